@@ -0,0 +1,70 @@
+"""
+Shared dependencies for API routes.
+"""
+
+from fastapi import HTTPException
+
+from app.config import settings
+from app.core.admission import AdmissionController, AdmissionRejected
+from app.services.board_sync import BoardSyncScheduler
+from app.services.cluster import ClusterRouter
+from app.services.micro_batcher import MicroBatcher
+from app.services.nlp_service import NLPService
+from app.services.skill_index import SkillIndex
+
+# CPU-bound NLP work (/analyze, /batch) runs in its own lane so a spike cannot
+# starve cheap requests such as /fetch-job and health checks.
+analysis_lane = AdmissionController(
+    "analysis",
+    max_concurrent=settings.ANALYSIS_MAX_CONCURRENCY,
+    max_queue=settings.ANALYSIS_MAX_QUEUE,
+    queue_timeout=settings.ANALYSIS_QUEUE_TIMEOUT,
+)
+
+fetch_lane = AdmissionController(
+    "fetch",
+    max_concurrent=settings.FETCH_MAX_CONCURRENCY,
+    max_queue=settings.FETCH_MAX_QUEUE,
+    queue_timeout=settings.FETCH_QUEUE_TIMEOUT,
+)
+
+# Groups concurrent single-job /analyze requests into one spaCy batch
+analysis_batcher = MicroBatcher(
+    lambda job_descriptions, sources: NLPService().analyze_job_descriptions(job_descriptions, sources=sources),
+    analysis_lane,
+    max_batch_size=settings.MICRO_BATCH_MAX_SIZE,
+    max_wait=settings.MICRO_BATCH_MAX_WAIT_MS / 1000,
+    max_queue=settings.MICRO_BATCH_MAX_QUEUE,
+    key=NLPService.content_key,
+)
+
+# Skill -> posting index over stored analyses, caught up from the database on use
+job_index = SkillIndex()
+
+# Periodic incremental sync of the configured job boards; started in app.main
+board_scheduler = BoardSyncScheduler(
+    analysis_lane,
+    BoardSyncScheduler.parse_boards(settings.BOARD_SYNC_BOARDS),
+    interval=settings.BOARD_SYNC_INTERVAL,
+    host_concurrency=settings.BOARD_SYNC_HOST_CONCURRENCY,
+    host_min_interval=settings.BOARD_SYNC_HOST_DELAY,
+)
+
+# Routes requests to the node owning their key when several replicas run; started in app.main
+cluster = ClusterRouter(
+    settings.CLUSTER_SELF_URL,
+    ClusterRouter.parse_nodes(settings.CLUSTER_NODES),
+    replicas=settings.CLUSTER_VIRTUAL_NODES,
+    forward_timeout=settings.CLUSTER_FORWARD_TIMEOUT,
+    health_interval=settings.CLUSTER_HEALTH_INTERVAL,
+    enabled=settings.CLUSTER_ENABLED,
+)
+
+
+def overloaded(error: AdmissionRejected) -> HTTPException:
+    """Translate an admission rejection into a fast 503 with Retry-After"""
+    return HTTPException(
+        status_code=503,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)},
+    )
@@ -0,0 +1,104 @@
+"""
+Administrative routes for inspecting the running service.
+"""
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.api.deps import analysis_batcher, analysis_lane, cluster, fetch_lane
+from app.config import settings
+from app.core.memory import read_memory_usage
+from app.core.profiling import SamplingProfiler
+from app.services.job_fetcher import JobFetcher
+from app.services.nlp_service import NLPService
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def get_metrics():
+    """
+    Return in-process performance counters.
+
+    Returns:
+        Request coalescing, near-duplicate, paragraph cache, language pipeline,
+        admission control, micro-batching, cluster routing and process memory counters
+    """
+    nlp_stats = NLPService().stats()
+    return {
+        "coalescing": {
+            "analysis": nlp_stats["coalescing"],
+            "fetch": JobFetcher.stats(),
+        },
+        "near_duplicates": nlp_stats["near_duplicates"],
+        "paragraph_cache": nlp_stats["paragraph_cache"],
+        "languages": nlp_stats["languages"],
+        "admission": {
+            "analysis": analysis_lane.stats(),
+            "fetch": fetch_lane.stats(),
+        },
+        "micro_batching": analysis_batcher.stats(),
+        "cluster": cluster.stats(),
+        "memory": read_memory_usage(),
+    }
+
+
+@router.get("/novel-terms")
+async def get_novel_terms(limit: int = Query(50, ge=1, le=1000, description="Number of terms to return")):
+    """
+    Return the unknown terms most often suggested by vector discovery.
+
+    Args:
+        limit: Number of terms to return
+
+    Returns:
+        Terms ranked by occurrences, each with its nearest known skill
+    """
+    discovery = NLPService().skills_extractor.skill_discovery
+    if discovery is None:
+        raise HTTPException(status_code=404, detail="Vector discovery is disabled")
+
+    return {"terms": discovery.novel_terms.top(limit)}
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def capture_profile(
+    seconds: float = Query(10.0, gt=0, description="How long to sample the process"),
+    interval_ms: float = Query(10.0, ge=1, le=1000, description="Sampling interval in milliseconds"),
+):
+    """
+    Capture a sampling profile of the live process.
+
+    The response body is in collapsed stack format and can be fed directly to
+    flamegraph.pl, inferno or speedscope.
+
+    Args:
+        seconds: Sampling duration (capped by PROFILE_MAX_SECONDS)
+        interval_ms: Delay between samples
+
+    Returns:
+        Collapsed stacks, one `frame;frame;... count` line per unique stack
+    """
+    if not settings.PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+
+    if seconds > settings.PROFILE_MAX_SECONDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Profile duration cannot exceed {settings.PROFILE_MAX_SECONDS} seconds"
+        )
+
+    profiler = SamplingProfiler(interval=interval_ms / 1000)
+    profiler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        # Joining the sampler thread can take up to one interval; keep it off the event loop
+        await asyncio.to_thread(profiler.stop)
+
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={"X-Profile-Samples": str(profiler.sample_count)},
+    )
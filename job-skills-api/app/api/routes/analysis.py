@@ -2,21 +2,27 @@
 API routes for job description analysis.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Header, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from datetime import datetime
+from typing import Dict, List, Optional
 from uuid import uuid4
 
+from app.api.deps import analysis_batcher, analysis_lane, cluster, fetch_lane, overloaded
+from app.config import settings
+from app.core.admission import AdmissionRejected
 from app.schemas.analysis import (
     AnalysisCreate,
     AnalysisResponse,
     BatchAnalysisRequest,
     BatchAnalysisResponse,
-    Skill,
     FetchJobRequest,
     FetchJobResponse,
 )
+from app.services import async_store, job_store, trend_service
+from app.services.export import ExportUnavailable, MEDIA_TYPES, check_format, export_filename, export_jobs
 from app.services.nlp_service import NLPService
-from app.services.job_fetcher import JobFetcher, JobFetchError
+from app.services.job_fetcher import JobFetcher, JobFetchError, normalize_url
 
 router = APIRouter()
 
@@ -24,44 +30,124 @@ router = APIRouter()
 nlp_service = NLPService()
 
 
+def _debug_requested(debug: bool, debug_header: Optional[str]) -> bool:
+    """Debug timings are opt-in per request and only honoured when enabled in config"""
+    if not settings.DEBUG_TIMINGS_ENABLED:
+        return False
+    header_enabled = (debug_header or "").strip().lower() in ("1", "true", "yes", "on")
+    return debug or header_enabled
+
+
+def _schedule_storage(
+    background_tasks: BackgroundTasks,
+    job_descriptions: List[str],
+    titles: List[Optional[str]],
+    analyses: List[Dict],
+    analyzed_at: datetime,
+):
+    """Queue the trend rollup and job storage writes to run after the response is sent"""
+    # Async writes run on the event loop; sync ones take a threadpool worker each
+    if settings.ASYNC_DB_ENABLED:
+        record, store = async_store.record_analyses, async_store.store_analyses
+    else:
+        record, store = trend_service.record_analyses, job_store.store_analyses
+    if settings.TRENDS_ENABLED:
+        # Queued before storage, so postings already stored are repeats of earlier requests
+        background_tasks.add_task(record, analyses, analyzed_at, job_descriptions)
+    if settings.JOB_INDEX_ENABLED:
+        background_tasks.add_task(store, job_descriptions, titles, analyses, analyzed_at)
+
+
+def _skills_payload(skills: List[Dict], include_ids: bool) -> List[Dict]:
+    """Skill dicts are already response-shaped; only copy them when adding IDs"""
+    if not include_ids:
+        return skills
+    return [{**skill, "id": uuid4()} for skill in skills]
+
+
+def _analysis_payload(
+    result: Dict,
+    title: Optional[str],
+    include_skill_ids: bool,
+    in_batch: bool = True,
+) -> Dict:
+    """Build an AnalysisResponse-shaped dict without Pydantic model construction"""
+    payload = {
+        "id": uuid4(),
+        "title": title,
+        "analyzed_at": datetime.utcnow(),
+        "skills": _skills_payload(result["skills"], include_skill_ids),
+        "total_skills_found": result["total_skills_found"],
+        "categories": result["categories"],
+        "language": result.get("language"),
+        "model": result.get("model"),
+    }
+    if "suggested_skills" in result:
+        payload["suggested_skills"] = result["suggested_skills"]
+    if "sections" in result:
+        payload["sections"] = result["sections"]
+    if "duplicate_of" in result:
+        duplicate_of = result["duplicate_of"]
+        if not in_batch:
+            # Batch positions are meaningless outside the batch (e.g. a micro-batch)
+            duplicate_of = {k: v for k, v in duplicate_of.items() if k != "job_index"}
+        payload["duplicate_of"] = duplicate_of
+    if "debug" in result:
+        payload["debug"] = result["debug"]
+    return payload
+
+
 @router.post("/analyze", response_model=AnalysisResponse)
-def analyze_job(request: AnalysisCreate):
+async def analyze_job(
+    request: AnalysisCreate,
+    background_tasks: BackgroundTasks,
+    http_request: Request,
+    include_skill_ids: bool = Query(False, description="Generate a UUID for every skill"),
+    debug: bool = Query(False, description="Include per-stage timings (requires DEBUG_TIMINGS_ENABLED)"),
+    x_debug_timings: Optional[str] = Header(None),
+):
     """
     Analyze a single job description and extract skills.
 
+    The response is serialized directly with orjson; the schema in
+    response_model documents its shape but is not re-validated. Requests go
+    through the analysis lane and get a 503 when it is saturated. In cluster
+    mode, postings are forwarded to the node owning their content hash.
+
     Args:
         request: Job description and optional title
+        include_skill_ids: Generate per-skill IDs (omitted by default)
+        debug: Include per-stage timings in the response
+        x_debug_timings: Header alternative to the debug query parameter
 
     Returns:
         Analysis results with extracted skills and statistics
     """
+    forwarded = await cluster.forward(http_request, NLPService.content_key(request.job_description))
+    if forwarded is not None:
+        return forwarded
+
     try:
         # Analyze job description
-        result = nlp_service.analyze_job_description(request.job_description)
-
-        # Convert skills to Pydantic models
-        skills = [
-            Skill(
-                name=skill["name"],
-                count=skill["count"],
-                category=skill["category"],
-                confidence=skill["confidence"],
+        profile = _debug_requested(debug, x_debug_timings)
+        if settings.MICRO_BATCH_ENABLED and not profile:
+            # The batcher takes one analysis lane slot per batch it dispatches
+            result = await analysis_batcher.submit(request.job_description, request.source_url)
+        else:
+            result = await analysis_lane.run_sync(
+                nlp_service.analyze_job_description,
+                request.job_description,
+                profile=profile,
+                source=request.source_url,
             )
-            for skill in result["skills"]
-        ]
-
-        # Create response
-        response = AnalysisResponse(
-            id=uuid4(),
-            title=request.title,
-            analyzed_at=datetime.utcnow(),
-            skills=skills,
-            total_skills_found=result["total_skills_found"],
-            categories=result["categories"],
-        )
 
-        return response
+        payload = _analysis_payload(result, request.title, include_skill_ids, in_batch=False)
+        _schedule_storage(background_tasks, [request.job_description], [request.title], [result], payload["analyzed_at"])
+
+        return ORJSONResponse(payload)
 
+    except AdmissionRejected as e:
+        raise overloaded(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -70,12 +156,32 @@ def analyze_job(request: AnalysisCreate):
 
 
 @router.post("/batch", response_model=BatchAnalysisResponse)
-def analyze_batch(request: BatchAnalysisRequest):
+async def analyze_batch(
+    request: BatchAnalysisRequest,
+    background_tasks: BackgroundTasks,
+    include_individual: bool = Query(True, description="Include per-job analyses in the response"),
+    offset: int = Query(0, ge=0, description="Index of the first individual analysis to return"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of individual analyses to return"),
+    skills_limit: Optional[int] = Query(None, ge=1, description="Maximum number of aggregated skills to return"),
+    include_skill_ids: bool = Query(False, description="Generate a UUID for every skill"),
+    debug: bool = Query(False, description="Include per-stage timings (requires DEBUG_TIMINGS_ENABLED)"),
+    x_debug_timings: Optional[str] = Header(None),
+):
     """
     Analyze multiple job descriptions and aggregate results.
 
+    Aggregates always cover every job; offset/limit only page through the
+    individual analyses included in the response.
+
     Args:
         request: List of job descriptions to analyze
+        include_individual: Set to false for a compact, aggregates-only response
+        offset: Pagination offset into individual analyses
+        limit: Pagination page size for individual analyses
+        skills_limit: Truncate aggregated_skills to the most common N skills
+        include_skill_ids: Generate per-skill IDs (omitted by default)
+        debug: Include per-stage timings in the response
+        x_debug_timings: Header alternative to the debug query parameter
 
     Returns:
         Aggregated analysis results across all jobs
@@ -85,57 +191,125 @@ def analyze_batch(request: BatchAnalysisRequest):
         job_texts = [job.job_description for job in request.jobs]
 
         # Analyze all jobs
-        batch_result = nlp_service.analyze_multiple_jobs(job_texts)
+        batch_result = await analysis_lane.run_sync(
+            nlp_service.analyze_multiple_jobs,
+            job_texts,
+            profile=_debug_requested(debug, x_debug_timings),
+            collapse_duplicates=request.collapse_duplicates,
+            sources=[job.source_url for job in request.jobs],
+        )
 
-        # Convert individual analyses to response models
+        # Select the page of individual analyses to serialize
         individual_analyses = []
-        for i, (job, analysis) in enumerate(zip(request.jobs, batch_result["individual_analyses"])):
-            skills = [
-                Skill(
-                    name=skill["name"],
-                    count=skill["count"],
-                    category=skill["category"],
-                    confidence=skill["confidence"],
-                )
-                for skill in analysis["skills"]
+        if include_individual:
+            end = offset + limit if limit is not None else None
+            page = zip(request.jobs[offset:end], batch_result["individual_analyses"][offset:end])
+            individual_analyses = [
+                _analysis_payload(analysis, job.title, include_skill_ids)
+                for job, analysis in page
             ]
 
-            individual_analyses.append(
-                AnalysisResponse(
-                    id=uuid4(),
-                    title=job.title,
-                    analyzed_at=datetime.utcnow(),
-                    skills=skills,
-                    total_skills_found=analysis["total_skills_found"],
-                    categories=analysis["categories"],
-                )
-            )
+        aggregated_skills = batch_result["aggregated_skills"]
+        if skills_limit is not None:
+            aggregated_skills = aggregated_skills[:skills_limit]
 
         # Create batch response
-        response = BatchAnalysisResponse(
-            id=uuid4(),
-            analyzed_at=datetime.utcnow(),
-            total_jobs=len(request.jobs),
-            aggregated_skills=batch_result["aggregated_skills"],
-            individual_analyses=individual_analyses,
-            top_skills=batch_result["top_skills"],
-            category_breakdown=batch_result["category_breakdown"],
+        response = {
+            "id": uuid4(),
+            "analyzed_at": datetime.utcnow(),
+            "total_jobs": len(request.jobs),
+            "aggregated_skills": aggregated_skills,
+            "individual_analyses": individual_analyses,
+            "top_skills": batch_result["top_skills"],
+            "category_breakdown": batch_result["category_breakdown"],
+            "duplicate_jobs": batch_result["duplicate_jobs"],
+        }
+        if "debug" in batch_result:
+            response["debug"] = batch_result["debug"]
+
+        _schedule_storage(
+            background_tasks,
+            job_texts,
+            [job.title for job in request.jobs],
+            batch_result["individual_analyses"],
+            response["analyzed_at"],
+        )
+
+        return ORJSONResponse(response)
+
+    except AdmissionRejected as e:
+        raise overloaded(e)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error analyzing batch jobs: {str(e)}"
         )
 
-        return response
 
+@router.post("/batch/export")
+async def export_batch(
+    request: BatchAnalysisRequest,
+    table: str = Query("skills", pattern="^(skills|aggregates)$", description="Per-job skill rows or per-skill aggregates"),
+    format: str = Query("csv", pattern="^(csv|arrow|parquet)$", description="Output format"),
+):
+    """
+    Analyze multiple job descriptions and stream the results as a table.
+
+    Rows are encoded in chunks as they are produced, without building a
+    BatchAnalysisResponse. With collapse_duplicates, postings repeated within
+    the batch are left out of the aggregates (as in /batch).
+
+    Args:
+        request: List of job descriptions to analyze
+        table: "skills" (job_id, title, analyzed_at, name, category, count,
+            confidence; job_id is the index in the request) or "aggregates"
+            (name, category, total_count, appeared_in_jobs, percentage)
+        format: "csv", "arrow" (Arrow IPC stream) or "parquet"
+
+    Returns:
+        Streaming download of the export file
+    """
+    try:
+        check_format(format)
+    except ExportUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    job_texts = [job.job_description for job in request.jobs]
+    try:
+        analyses = await analysis_lane.run_sync(
+            nlp_service.analyze_job_descriptions,
+            job_texts,
+            sources=[job.source_url for job in request.jobs],
+        )
+    except AdmissionRejected as e:
+        raise overloaded(e)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Error analyzing batch jobs: {str(e)}"
         )
 
+    analyzed_at = datetime.utcnow()
+    jobs = (
+        (index, job.title, analyzed_at, analysis["skills"])
+        for index, (job, analysis) in enumerate(zip(request.jobs, analyses))
+        if table == "skills" or not (request.collapse_duplicates and NLPService.repeats_in_batch(analysis))
+    )
+    return StreamingResponse(
+        export_jobs(jobs, table, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(table, format)}"'},
+    )
+
 
 @router.post("/fetch-job", response_model=FetchJobResponse)
-async def fetch_job_from_url(request: FetchJobRequest):
+async def fetch_job_from_url(request: FetchJobRequest, http_request: Request):
     """
     Fetch job title and description from a job board URL.
 
+    In cluster mode, requests are forwarded to the node owning the
+    normalized URL.
+
     Supports:
     - Greenhouse.io
     - Lever.co
@@ -148,15 +322,23 @@ async def fetch_job_from_url(request: FetchJobRequest):
     Returns:
         Extracted job title and description
     """
+    forwarded = await cluster.forward(http_request, normalize_url(request.url))
+    if forwarded is not None:
+        return forwarded
+
     try:
-        result = await JobFetcher.fetch_job(request.url)
+        async with fetch_lane.slot():
+            result = await JobFetcher.fetch_job(request.url)
 
         return FetchJobResponse(
             title=result['title'],
             description=result['description'],
-            url=request.url
+            url=request.url,
+            sections=result.get('sections'),
         )
 
+    except AdmissionRejected as e:
+        raise overloaded(e)
     except JobFetchError as e:
         raise HTTPException(
             status_code=400,
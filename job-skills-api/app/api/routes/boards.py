@@ -0,0 +1,68 @@
+"""
+API routes for incremental job board sync.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.api.deps import board_scheduler
+from app.config import settings
+from app.database import get_db
+from app.schemas.boards import BoardSyncRequest, BoardSyncResult, BoardSyncStatus, OpenPostingSkillsResponse
+from app.services.board_sync import open_posting_skills
+
+router = APIRouter()
+
+
+def require_board_sync():
+    """Dependency that hides board routes unless board sync is enabled"""
+    if not settings.BOARD_SYNC_ENABLED:
+        raise HTTPException(status_code=404, detail="Board sync is disabled")
+
+
+@router.post("/sync", response_model=BoardSyncResult, dependencies=[Depends(require_board_sync)])
+async def sync_board(request: BoardSyncRequest):
+    """
+    Sync one board now, outside the periodic schedule.
+
+    Only postings that are new or whose content changed are analyzed;
+    postings missing from the board are marked closed.
+
+    Args:
+        request: Provider and board token / company slug
+
+    Returns:
+        Counts of added, changed, unchanged and removed postings
+    """
+    outcome = await board_scheduler.sync_board(request.provider, request.board)
+    if outcome["error"]:
+        raise HTTPException(status_code=502, detail=f"Board sync failed: {outcome['error']}")
+    return outcome
+
+
+@router.get("/status", response_model=BoardSyncStatus, dependencies=[Depends(require_board_sync)])
+async def get_sync_status():
+    """
+    Report the configured boards and the latest sync of each board in this process.
+    """
+    return board_scheduler.stats()
+
+
+@router.get("/open-skills", response_model=OpenPostingSkillsResponse, dependencies=[Depends(require_board_sync)])
+def get_open_posting_skills(
+    limit: int = Query(20, ge=1, le=500),
+    category: Optional[str] = Query(None, description="Only rank skills in this category"),
+    db: Session = Depends(get_db),
+):
+    """
+    Rank skills by the number of currently open board postings that require them.
+
+    Args:
+        limit: Number of skills to return
+        category: Optional category filter
+
+    Returns:
+        Number of open postings and the top skills among them
+    """
+    return open_posting_skills(db, limit=limit, category=category)
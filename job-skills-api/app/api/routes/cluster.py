@@ -0,0 +1,102 @@
+"""
+API routes for cluster membership.
+"""
+
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app.api.deps import cluster
+from app.config import settings
+from app.prefork import in_prefork_worker
+from app.schemas.cluster import ClusterNodeRequest, ClusterStatus
+from app.services.cluster import SECRET_HEADER
+
+router = APIRouter()
+
+
+def require_cluster():
+    """Dependency that hides cluster routes unless cluster mode is enabled"""
+    if not settings.CLUSTER_ENABLED:
+        raise HTTPException(status_code=404, detail="Cluster mode is disabled")
+
+
+def require_cluster_secret(x_cluster_secret: Optional[str] = Header(None, alias=SECRET_HEADER)):
+    """Dependency that restricts membership changes to callers holding CLUSTER_SECRET"""
+    if not settings.CLUSTER_SECRET:
+        raise HTTPException(status_code=403, detail="Membership changes are disabled until CLUSTER_SECRET is set")
+    if not hmac.compare_digest((x_cluster_secret or "").encode("utf-8"), settings.CLUSTER_SECRET.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Invalid cluster secret")
+
+
+def require_single_process():
+    """
+    Dependency that refuses membership changes in pre-fork workers.
+
+    The ring lives in process memory, and a request reaches one worker only;
+    the other workers would keep routing by the old ring.
+    """
+    if in_prefork_worker():
+        raise HTTPException(
+            status_code=409,
+            detail="Membership changes are not supported in pre-fork mode; update CLUSTER_NODES and restart the node",
+        )
+
+
+@router.get("/status", response_model=ClusterStatus, dependencies=[Depends(require_cluster)])
+async def get_cluster_status():
+    """
+    Report ring membership, peer health and routing counters of this node.
+    """
+    return cluster.stats()
+
+
+@router.post(
+    "/join",
+    response_model=ClusterStatus,
+    dependencies=[Depends(require_cluster), Depends(require_cluster_secret), Depends(require_single_process)],
+)
+async def join_node(request: ClusterNodeRequest):
+    """
+    Add a node to this node's hash ring.
+
+    Only the keys the new node now owns move to it. Membership is per
+    process: send the same change to every node (the new one included) so
+    they agree on ownership. Requires the CLUSTER_SECRET in the
+    X-Cluster-Secret header, and is refused on pre-forked workers.
+
+    Args:
+        request: Base URL of the joining node
+
+    Returns:
+        Updated cluster status
+    """
+    cluster.join(request.url)
+    return cluster.stats()
+
+
+@router.post(
+    "/leave",
+    response_model=ClusterStatus,
+    dependencies=[Depends(require_cluster), Depends(require_cluster_secret), Depends(require_single_process)],
+)
+async def leave_node(request: ClusterNodeRequest):
+    """
+    Remove a node from this node's hash ring.
+
+    The keys it owned are spread over the remaining nodes; every other key
+    stays where it is. Requires the CLUSTER_SECRET in the X-Cluster-Secret
+    header, and is refused on pre-forked workers.
+
+    Args:
+        request: Base URL of the leaving node
+
+    Returns:
+        Updated cluster status
+    """
+    if request.url.rstrip("/") == cluster.self_url:
+        raise HTTPException(status_code=400, detail="A node cannot remove itself from its own ring")
+    if not cluster.leave(request.url):
+        raise HTTPException(status_code=404, detail=f"{request.url} is not on the ring")
+    return cluster.stats()
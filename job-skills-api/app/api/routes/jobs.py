@@ -0,0 +1,173 @@
+"""
+API routes for querying stored job analyses.
+"""
+
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from typing import Dict, List, Optional
+
+from app.api.deps import analysis_lane, job_index, overloaded
+from app.config import settings
+from app.core.admission import AdmissionRejected
+from app.database import get_db
+from app.models.jobs import AnalyzedJob
+from app.schemas.search import JobSearchResponse, ResumeMatchRequest, ResumeMatchResponse
+from app.services.export import ExportUnavailable, MEDIA_TYPES, check_format, export_filename, export_jobs
+from app.services.job_store import iter_stored_jobs
+from app.services.nlp_service import NLPService
+
+router = APIRouter()
+
+# Initialize NLP service (singleton)
+nlp_service = NLPService()
+
+
+def require_job_index():
+    """Dependency that hides job routes unless analyses are stored"""
+    if not settings.JOB_INDEX_ENABLED:
+        raise HTTPException(status_code=404, detail="Job storage and search are disabled")
+
+
+@router.get("/search", response_model=JobSearchResponse, dependencies=[Depends(require_job_index)])
+def search_jobs(
+    skills: List[str] = Query([], description="Skills every posting must require (AND)"),
+    any_skills: List[str] = Query([], description="Skills of which a posting must require at least one (OR)"),
+    exclude_skills: List[str] = Query([], description="Skills a posting must not mention (NOT)"),
+    category: Optional[str] = Query(None, description="Category in which a posting must require a skill"),
+    limit: int = Query(20, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_db),
+):
+    """
+    Search stored postings by skill.
+
+    Example: `?skills=Python&skills=Kubernetes&exclude_skills=Java&category=data_science`
+
+    Every stored posting is searchable, including superseded versions of
+    edited board postings and closed board postings.
+
+    Args:
+        skills: Required skills (case-insensitive)
+        any_skills: Alternative skills (case-insensitive)
+        exclude_skills: Excluded skills (case-insensitive)
+        category: Category filter (e.g. "data_science")
+        limit: Page size
+        offset: Index of the first hit to return
+
+    Returns:
+        Total number of matches and the requested page of ranked hits
+    """
+    # Pick up postings stored by any worker since the last query
+    job_index.sync_from_db(db)
+
+    result = job_index.search(
+        skills=skills,
+        any_skills=any_skills,
+        exclude_skills=exclude_skills,
+        category=category,
+        limit=limit,
+        offset=offset,
+    )
+
+    job_ids = [hit["job_id"] for hit in result["hits"]]
+    jobs = {
+        job.id: job
+        for job in db.query(AnalyzedJob.id, AnalyzedJob.title, AnalyzedJob.analyzed_at)
+        .filter(AnalyzedJob.id.in_(job_ids))
+    }
+    hits = [
+        {**hit, "title": jobs[hit["job_id"]].title, "analyzed_at": jobs[hit["job_id"]].analyzed_at}
+        for hit in result["hits"]
+    ]
+
+    return {"total": result["total"], "hits": hits}
+
+
+@router.get("/export", dependencies=[Depends(require_job_index)])
+def export_jobs_table(
+    table: str = Query("skills", pattern="^(skills|aggregates)$", description="Per-job skill rows or per-skill aggregates"),
+    format: str = Query("csv", pattern="^(csv|arrow|parquet)$", description="Output format"),
+    since: Optional[datetime] = Query(None, description="Only postings analyzed at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only postings analyzed before this time"),
+):
+    """
+    Stream every stored posting as a table.
+
+    Postings are read from the database in chunks and rows are encoded as
+    they go, so memory stays constant for any corpus size.
+
+    Args:
+        table: "skills" (job_id, title, analyzed_at, name, category, count,
+            confidence) or "aggregates" (name, category, total_count,
+            appeared_in_jobs, percentage)
+        format: "csv", "arrow" (Arrow IPC stream) or "parquet"
+        since: Lower bound on analyzed_at (inclusive)
+        until: Upper bound on analyzed_at (exclusive)
+
+    Returns:
+        Streaming download of the export file
+    """
+    try:
+        check_format(format)
+    except ExportUnavailable as e:
+        raise HTTPException(status_code=501, detail=str(e))
+
+    return StreamingResponse(
+        export_jobs(iter_stored_jobs(since, until), table, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{export_filename(table, format)}"'},
+    )
+
+
+def _rank_jobs(db: Session, resume_skills: List[Dict], top_k: int) -> Dict:
+    """Score stored postings against resume skills and attach matched/missing skills"""
+    job_index.sync_from_db(db)
+    result = job_index.match(resume_skills, top_k=top_k)
+
+    job_ids = [match["job_id"] for match in result["matches"]]
+    jobs = {
+        job.id: job
+        for job in db.query(AnalyzedJob.id, AnalyzedJob.title, AnalyzedJob.analyzed_at, AnalyzedJob.skills)
+        .filter(AnalyzedJob.id.in_(job_ids))
+    }
+
+    resume_names = {skill["name"].lower() for skill in resume_skills}
+    matches = []
+    for match in result["matches"]:
+        job = jobs[match["job_id"]]
+        job_skills = list(dict.fromkeys(skill["name"] for skill in job.skills))
+        matches.append({
+            **match,
+            "title": job.title,
+            "analyzed_at": job.analyzed_at,
+            "matched_skills": [name for name in job_skills if name.lower() in resume_names],
+            "missing_skills": [name for name in job_skills if name.lower() not in resume_names],
+        })
+
+    return {"candidates": result["candidates"], "matches": matches}
+
+
+@router.post("/match", response_model=ResumeMatchResponse, dependencies=[Depends(require_job_index)])
+async def match_resume(request: ResumeMatchRequest, db: Session = Depends(get_db)):
+    """
+    Rank stored postings by skill fit with a resume.
+
+    The resume goes through the same extractor as postings (in the analysis
+    lane); ranking is a vectorized cosine similarity over the skill index.
+
+    Args:
+        request: Resume text and number of postings to return
+
+    Returns:
+        Resume skills and the best matching postings with matched and missing skills
+    """
+    try:
+        resume_skills = await analysis_lane.run_sync(nlp_service.extract_skills, request.resume)
+    except AdmissionRejected as e:
+        raise overloaded(e)
+
+    result = await run_in_threadpool(_rank_jobs, db, resume_skills, request.top_k)
+    return {"resume_skills": resume_skills, **result}
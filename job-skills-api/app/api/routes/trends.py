@@ -0,0 +1,107 @@
+"""
+API routes for skill trends, answered from pre-aggregated rollups.
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from typing import Callable, Optional
+
+from app.config import settings
+from app.database import AsyncSessionLocal, SessionLocal
+from app.schemas.trends import TopSkillsResponse, TrendResponse
+from app.services import async_store, trend_service
+
+router = APIRouter()
+
+
+def require_trends():
+    """Dependency that hides trend routes unless rollups are enabled"""
+    if not settings.TRENDS_ENABLED:
+        raise HTTPException(status_code=404, detail="Trend rollups are disabled")
+
+
+async def _read(sync_read: Callable, async_read: Callable, *args, **kwargs):
+    """
+    Run a rollup query on the pooled async engine when ASYNC_DB_ENABLED,
+    otherwise on a sync session in the threadpool.
+    """
+    if settings.ASYNC_DB_ENABLED:
+        async with AsyncSessionLocal() as db:
+            return await async_read(db, *args, **kwargs)
+
+    def run():
+        db = SessionLocal()
+        try:
+            return sync_read(db, *args, **kwargs)
+        finally:
+            db.close()
+
+    return await run_in_threadpool(run)
+
+
+@router.get("/top-skills", response_model=TopSkillsResponse, dependencies=[Depends(require_trends)])
+async def get_top_skills(
+    days: int = Query(90, ge=1, le=3650, description="Trailing window in days"),
+    limit: int = Query(20, ge=1, le=500),
+    category: Optional[str] = Query(None, description="Only rank skills in this category"),
+):
+    """
+    Rank skills by the number of postings that required them.
+
+    Args:
+        days: Trailing window in days
+        limit: Number of skills to return
+        category: Optional category filter
+
+    Returns:
+        Top skills with their share of postings in the window
+    """
+    return await _read(
+        trend_service.top_skills, async_store.top_skills, days=days, limit=limit, category=category
+    )
+
+
+@router.get("/skills/{skill}", response_model=TrendResponse, dependencies=[Depends(require_trends)])
+async def get_skill_trend(
+    skill: str,
+    granularity: str = Query("month", pattern="^(day|week|month)$"),
+    periods: int = Query(12, ge=1, le=366),
+):
+    """
+    Share of postings requiring a skill over time.
+
+    Args:
+        skill: Skill name (case-insensitive)
+        granularity: day, week or month
+        periods: Number of periods ending with the current one
+
+    Returns:
+        One point per period, oldest first
+    """
+    points = await _read(
+        trend_service.skill_trend, async_store.skill_trend, skill, granularity=granularity, periods=periods
+    )
+    return {"name": skill, "granularity": granularity, "points": points}
+
+
+@router.get("/categories/{category}", response_model=TrendResponse, dependencies=[Depends(require_trends)])
+async def get_category_trend(
+    category: str,
+    granularity: str = Query("month", pattern="^(day|week|month)$"),
+    periods: int = Query(12, ge=1, le=366),
+):
+    """
+    Share of postings mentioning a skill category over time.
+
+    Args:
+        category: Category name (e.g. "programming_languages")
+        granularity: day, week or month
+        periods: Number of periods ending with the current one
+
+    Returns:
+        One point per period, oldest first
+    """
+    points = await _read(
+        trend_service.category_trend, async_store.category_trend, category, granularity=granularity, periods=periods
+    )
+    return {"name": category, "granularity": granularity, "points": points}
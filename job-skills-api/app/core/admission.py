@@ -0,0 +1,148 @@
+"""
+Admission control for request lanes.
+Bounds how much work of one kind runs at once and how long requests may wait,
+so overload turns into fast rejections instead of unbounded latency.
+"""
+
+import asyncio
+import functools
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Deque, Dict, Optional
+
+import anyio
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted before its deadline"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Concurrency limit with a bounded FIFO wait queue and queueing deadline.
+
+    Requests beyond `max_concurrent` wait in a queue of at most `max_queue`
+    entries for up to `queue_timeout` seconds. Anything else is rejected
+    immediately with an estimate of when to retry.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._thread_limiter: Optional[anyio.CapacityLimiter] = None
+        self._avg_service_time = 0.0  # exponentially weighted, seconds
+
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    async def acquire(self):
+        """
+        Wait for a slot.
+
+        Raises:
+            AdmissionRejected: If the queue is full or the deadline passes
+        """
+        if self._active < self.max_concurrent and not self._waiters:
+            self._active += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected(f"{self.name} queue is full", self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as we gave up; pass it on
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+            if isinstance(e, asyncio.TimeoutError):
+                self.rejected_timeout += 1
+                raise AdmissionRejected(
+                    f"{self.name} request timed out waiting for capacity",
+                    self.retry_after(),
+                )
+            raise
+
+        self.admitted += 1
+
+    def release(self):
+        """Release a slot, handing it directly to the oldest live waiter"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold a slot for the duration of the block"""
+        await self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            self._avg_service_time = 0.8 * self._avg_service_time + 0.2 * elapsed
+            self.release()
+
+    async def run_sync(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Admit the call, then run fn in a worker thread reserved for this lane.
+
+        The lane's threads come from its own limiter rather than the shared
+        default threadpool, so other lanes keep their capacity under load.
+        """
+        async with self.slot():
+            return await self.to_thread(fn, *args, **kwargs)
+
+    async def to_thread(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run fn on this lane's worker threads without taking an admission slot"""
+        if self._thread_limiter is None:
+            self._thread_limiter = anyio.CapacityLimiter(self.max_concurrent)
+
+        return await anyio.to_thread.run_sync(
+            functools.partial(fn, *args, **kwargs),
+            limiter=self._thread_limiter,
+        )
+
+    def retry_after(self) -> int:
+        """Estimate seconds until queued work drains, for the Retry-After header"""
+        backlog = len(self._waiters) + self._active
+        estimate = self._avg_service_time * backlog / max(self.max_concurrent, 1)
+        return max(1, math.ceil(estimate))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return lane occupancy and rejection counters"""
+        return {
+            "active": self._active,
+            "queued": len(self._waiters),
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "avg_service_ms": round(self._avg_service_time * 1000, 3),
+        }
@@ -0,0 +1,163 @@
+"""
+Fuzzy skill lookup using a deletion-neighborhood index (SymSpell-style).
+Finds skills within a small edit distance of a term without comparing the
+term against every known skill.
+"""
+
+import re
+from itertools import combinations
+from typing import Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+from app.core.skills_database import SKILL_ALIASES, SKILLS_DATABASE, get_category_for_skill
+
+_COMPACT_RE = re.compile(r"[\s.\-_]+")
+
+
+def compact(term: str) -> str:
+    """Lowercase a term and drop separators, so "Node JS" and "node.js" compare equal"""
+    return _COMPACT_RE.sub("", term.lower())
+
+
+def _deletes(term: str, distance: int) -> Set[str]:
+    """All strings obtained by deleting up to `distance` characters from term"""
+    variants = {term}
+    for count in range(1, min(distance, len(term)) + 1):
+        for positions in combinations(range(len(term)), count):
+            variants.add("".join(ch for i, ch in enumerate(term) if i not in positions))
+    return variants
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance between a and b.
+
+    Returns limit + 1 as soon as the distance is known to exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                previous_previous is not None
+                and i > 1 and j > 1
+                and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]
+            ):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+
+    return previous[-1]
+
+
+class FuzzyMatch(NamedTuple):
+    """A skill found for a term"""
+    name: str
+    category: str
+    distance: int
+
+
+class FuzzySkillIndex:
+    """
+    Map skill variants, aliases and misspellings to canonical skills.
+
+    Every known skill and alias is stored in compact form. For keys of at
+    least `min_length` characters, the index also stores every variant with
+    up to `max_distance` characters deleted. A lookup generates the deletions
+    of the query the same way, so candidates within the edit distance share
+    a variant and are found with a handful of dictionary probes.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[Tuple[str, str, str]],
+        max_distance: int = 2,
+        min_length: int = 5,
+        long_term_length: int = 8,
+    ):
+        """
+        Args:
+            entries: (term, canonical skill name, category) triples
+            max_distance: Largest edit distance ever accepted
+            min_length: Shorter terms only match exactly
+            long_term_length: Terms at least this long may use max_distance;
+                shorter ones are limited to a single edit
+        """
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self.long_term_length = long_term_length
+
+        self._exact: Dict[str, Tuple[str, str]] = {}
+        self._deletes: Dict[str, Set[str]] = {}
+
+        for term, name, category in entries:
+            key = compact(term)
+            if not key or key in self._exact:
+                continue
+            self._exact[key] = (name, category)
+            if len(key) >= min_length:
+                for variant in _deletes(key, self._allowed_distance(key)):
+                    self._deletes.setdefault(variant, set()).add(key)
+
+    @classmethod
+    def from_skills_database(cls, **kwargs) -> "FuzzySkillIndex":
+        """Build an index over SKILLS_DATABASE plus SKILL_ALIASES"""
+        entries = []
+        for category, skills in SKILLS_DATABASE.items():
+            for skill in skills:
+                entries.append((skill, skill, category))
+        for alias, skill in SKILL_ALIASES.items():
+            entries.append((alias, skill, get_category_for_skill(skill)))
+        return cls(entries, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def _allowed_distance(self, key: str) -> int:
+        if len(key) < self.min_length:
+            return 0
+        if len(key) < self.long_term_length:
+            return min(1, self.max_distance)
+        return self.max_distance
+
+    def lookup(self, term: str, fuzzy: bool = True) -> Optional[FuzzyMatch]:
+        """
+        Find the closest skill for a term.
+
+        Args:
+            term: Candidate text (one or more tokens)
+            fuzzy: Allow edit-distance matches; otherwise only exact compact matches
+
+        Returns:
+            Closest match, or None if nothing is within the allowed distance
+        """
+        key = compact(term)
+        exact = self._exact.get(key)
+        if exact is not None:
+            return FuzzyMatch(exact[0], exact[1], 0)
+
+        limit = self._allowed_distance(key)
+        if not fuzzy or limit == 0:
+            return None
+
+        candidates = set()
+        for variant in _deletes(key, limit):
+            candidates.update(self._deletes.get(variant, ()))
+
+        best = None
+        for candidate in sorted(candidates):
+            allowed = min(limit, self._allowed_distance(candidate))
+            distance = edit_distance(key, candidate, allowed)
+            if distance <= allowed and (best is None or distance < best[1]):
+                best = (candidate, distance)
+
+        if best is None:
+            return None
+        name, category = self._exact[best[0]]
+        return FuzzyMatch(name, category, best[1])
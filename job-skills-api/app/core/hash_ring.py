@@ -0,0 +1,81 @@
+"""
+Consistent hash ring.
+Maps keys (content hashes, URLs) to nodes so that adding or removing a node
+only moves the keys that node gains or loses.
+"""
+
+import hashlib
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional
+
+
+def _point(value: str) -> int:
+    """64-bit position of a value on the ring"""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent hashing with virtual nodes.
+
+    Each node is placed on the ring `replicas` times; a key belongs to the
+    first node point at or after the key's own point. With N nodes, a join
+    or leave remaps roughly 1/N of the keys and leaves the rest in place.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 160):
+        """
+        Args:
+            nodes: Initial node names (e.g. base URLs)
+            replicas: Virtual nodes per node; more points spread keys more evenly
+        """
+        self.replicas = replicas
+        self._owners: Dict[int, str] = {}  # point -> node
+        self._points: List[int] = []
+        self._nodes: List[str] = []
+        for node in nodes:
+            self.add(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        """Nodes on the ring, in the order they joined"""
+        return list(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._nodes
+
+    def add(self, node: str) -> bool:
+        """Place a node on the ring; returns False if it was already there"""
+        if node in self._nodes:
+            return False
+        self._nodes.append(node)
+        self._rebuild()
+        return True
+
+    def remove(self, node: str) -> bool:
+        """Take a node off the ring; returns False if it was not there"""
+        if node not in self._nodes:
+            return False
+        self._nodes.remove(node)
+        self._rebuild()
+        return True
+
+    def _rebuild(self):
+        # Sorted node order settles (vanishingly rare) point collisions the same way on every process
+        self._owners = {}
+        for node in sorted(self._nodes):
+            for replica in range(self.replicas):
+                self._owners.setdefault(_point(f"{node}#{replica}"), node)
+        self._points = sorted(self._owners)
+
+    def node_for(self, key: str) -> Optional[str]:
+        """The node owning a key, or None when the ring is empty"""
+        if not self._points:
+            return None
+        index = bisect_right(self._points, _point(key))
+        if index == len(self._points):
+            index = 0  # wrap around
+        return self._owners[self._points[index]]
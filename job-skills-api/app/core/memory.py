@@ -0,0 +1,40 @@
+"""
+Process memory accounting.
+Splits resident memory into pages shared with other processes (e.g. a
+pre-fork master) and pages unique to the process.
+"""
+
+from typing import Dict, Optional, Union
+
+
+def read_memory_usage(pid: Union[int, str] = "self") -> Optional[Dict[str, int]]:
+    """
+    Read memory usage for a process from /proc/<pid>/smaps_rollup (Linux only).
+
+    Args:
+        pid: Process ID, or "self" for the current process
+
+    Returns:
+        Dictionary of byte counts (rss, pss, shared, unique), or None if unavailable
+    """
+    fields = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    except OSError:
+        return None
+
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "unique": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def format_megabytes(value: int) -> str:
+    """Format a byte count as megabytes for log output"""
+    return f"{value / (1024 * 1024):.1f} MB"
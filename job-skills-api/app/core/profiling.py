@@ -0,0 +1,109 @@
+"""
+Lightweight profiling helpers.
+Provides per-request stage timing and a sampling profiler for the live process.
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Optional
+
+
+class StageTimer:
+    """Accumulate wall-clock timings and counters for named pipeline stages"""
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}  # stage name -> elapsed milliseconds
+        self.counts: Dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block and add it to the named stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def add_count(self, name: str, value: int):
+        """Add to a named counter (tokens, matches, ...)"""
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def as_dict(self) -> Dict:
+        """Return timings rounded for inclusion in an API response"""
+        return {
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "stages": {name: round(ms, 3) for name, ms in self.stages.items()},
+            "counts": dict(self.counts),
+        }
+
+
+class _NullTimer:
+    """No-op stand-in used when profiling is not requested"""
+
+    _context = nullcontext()
+
+    def stage(self, name: str):
+        return self._context
+
+    def add_count(self, name: str, value: int):
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler that periodically samples the stacks of all threads.
+
+    Output uses the "collapsed stack" format (one `frame;frame;frame count` line
+    per unique stack) understood by flamegraph.pl, speedscope and inferno.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start sampling in a background daemon thread"""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread to exit"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            thread_names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+                    frame = frame.f_back
+
+                stack.append(thread_names.get(ident, f"thread-{ident}"))
+                self.samples[";".join(reversed(stack))] += 1
+            self.sample_count += 1
+
+    def collapsed(self) -> str:
+        """Return collected samples in collapsed stack format"""
+        lines = [f"{stack} {count}" for stack, count in self.samples.most_common()]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,150 @@
+"""
+Single-flight request coalescing.
+Concurrent calls that share a key run the underlying work once and all
+receive its result (or its exception).
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """State for one in-flight computation shared by the threaded variant"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls made from worker threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the computation (e.g. a content hash)
+            fn: Function to run if this caller becomes the leader
+
+        Returns:
+            The shared result. Callers must treat it as read-only.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Return coalescing counters"""
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "in_flight": len(self._calls),
+            }
+
+
+class _Flight:
+    """State for one in-flight computation shared by the asyncio variant"""
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent identical coroutine calls on one event loop"""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    async def do(self, key: Hashable, coro_fn: Callable, *args, **kwargs) -> Any:
+        """
+        Await coro_fn(*args, **kwargs) unless an identical call is already in flight.
+
+        The shared work runs in its own task, so cancelling one caller does not
+        cancel it for the others. It is cancelled only once every caller is gone.
+
+        Args:
+            key: Identity of the computation (e.g. a normalized URL)
+            coro_fn: Coroutine function to run if no call is in flight
+
+        Returns:
+            The shared result. Callers must treat it as read-only.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(coro_fn(*args, **kwargs)))
+            flight.task.add_done_callback(lambda task: self._finish(key, flight))
+            self._flights[key] = flight
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                # Last interested caller left; stop the work and let new callers start fresh
+                flight.task.cancel()
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: Hashable, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        if not flight.task.cancelled() and flight.task.exception() is not None:
+            self.errors += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return coalescing counters"""
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "in_flight": len(self._flights),
+        }
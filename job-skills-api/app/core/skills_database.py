@@ -201,6 +201,40 @@ SKILLS_DATABASE = {
 }
 
 
+# Common variants and abbreviations that do not appear in SKILLS_DATABASE,
+# mapped to the canonical skill name. Keys are compared in compact form
+# (lowercase, without spaces, dots, hyphens or underscores).
+SKILL_ALIASES = {
+    "postgres": "PostgreSQL",
+    "psql": "PostgreSQL",
+    "mongo": "MongoDB",
+    "nodejs": "Node.js",
+    "reactjs": "React",
+    "vuejs": "Vue",
+    "nextjs": "Next.js",
+    "expressjs": "Express",
+    "k8s": "Kubernetes",
+    "kube": "Kubernetes",
+    "sklearn": "Scikit-learn",
+    "scikit": "Scikit-learn",
+    "pyspark": "Apache Spark",
+    "tailwindcss": "Tailwind CSS",
+    "dotnet": ".NET",
+    "csharp": "C#",
+    "cpp": "C++",
+    "cplusplus": "C++",
+    "objc": "Objective-C",
+    "es6": "JavaScript",
+    "ecmascript": "JavaScript",
+    "amazonwebservices": "AWS",
+    "googlecloud": "GCP",
+    "gitlabci": "GitLab CI",
+    "githubactions": "GitHub Actions",
+    "huggingface": "Hugging Face",
+    "powerbi": "Power BI",
+}
+
+
 def get_all_skills():
     """Returns a flat list of all skills across all categories"""
     all_skills = []
@@ -209,13 +243,22 @@ def get_all_skills():
     return all_skills
 
 
+def _build_category_index():
+    """Map each lowercase skill to the category it is first listed under"""
+    index = {}
+    for category, skills in SKILLS_DATABASE.items():
+        for skill in skills:
+            index.setdefault(skill.lower(), category)
+    return index
+
+
+# Built once; extraction looks up a category for every entity and context word
+SKILL_CATEGORIES = _build_category_index()
+
+
 def get_category_for_skill(skill_name: str) -> str:
     """Returns the category for a given skill name"""
-    skill_lower = skill_name.lower()
-    for category, skills in SKILLS_DATABASE.items():
-        if any(skill.lower() == skill_lower for skill in skills):
-            return category
-    return "other"
+    return SKILL_CATEGORIES.get(skill_name.lower(), "other")
 
 
 def get_skills_by_category(category: str):
@@ -1,12 +1,22 @@
+from typing import Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
 
+# SQLite (used as a local stand-in for PostgreSQL) needs cross-thread access
+# because sessions are used from FastAPI's worker threads
+connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
+    connect_args=connect_args,
 )
 
 # Create SessionLocal class
@@ -26,3 +36,88 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async drivers for the dialects the app supports
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_sessions: Optional[async_sessionmaker] = None
+
+
+def async_database_url(url: str) -> str:
+    """Rewrite DATABASE_URL for its async driver (postgresql:// -> postgresql+asyncpg://)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend} databases")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the process-wide async engine, creating it on first use.
+
+    Unlike the sync engine it sizes its pool explicitly and caches
+    statements at both levels: SQLAlchemy's compiled-statement cache, and
+    asyncpg's per-connection prepared statements (sqlite3's statement cache
+    with aiosqlite). File-based SQLite gets a real pool as well, instead of
+    aiosqlite's default of one connection per checkout.
+
+    Raises:
+        RuntimeError: If the async driver for the database is not installed
+    """
+    global _async_engine, _async_sessions
+    if _async_engine is not None:
+        return _async_engine
+
+    url = make_url(async_database_url(settings.DATABASE_URL))
+    backend = url.get_backend_name()
+    options = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+        "query_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+    }
+    if backend == "postgresql":
+        options["connect_args"] = {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    elif url.database in (None, "", ":memory:"):
+        # In-memory SQLite lives in one connection; there is nothing to pool
+        options = {"query_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    else:
+        options["poolclass"] = AsyncAdaptedQueuePool
+        options["connect_args"] = {"cached_statements": settings.DB_STATEMENT_CACHE_SIZE}
+
+    try:
+        _async_engine = create_async_engine(url, **options)
+    except ImportError as e:
+        raise RuntimeError(
+            f"ASYNC_DB_ENABLED needs the {ASYNC_DRIVERS[backend]} driver (pip install {ASYNC_DRIVERS[backend]})"
+        ) from e
+    _async_sessions = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _async_engine
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """Open a session on the async engine (use as `async with AsyncSessionLocal() as db`)"""
+    get_async_engine()
+    return _async_sessions()
+
+
+async def get_async_db():
+    """
+    Dependency function to get an async database session.
+    Yields a session on the pooled async engine and closes it after use.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine():
+    """Close the async engine's pooled connections (on shutdown)"""
+    global _async_engine, _async_sessions
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = _async_sessions = None
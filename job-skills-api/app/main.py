@@ -1,7 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.api.routes import analysis
+from app.api.deps import board_scheduler, cluster, job_index
+from app.api.routes import admin, analysis, boards, cluster as cluster_routes, jobs, trends
+from app.services.cluster import NodeHeaderMiddleware
+from app.database import Base, SessionLocal, dispose_async_engine, engine, get_async_engine
+from app.prefork import runs_background_loops
+from app.services.job_store import recent_signatures
+from app.services.nlp_service import NLPService
 
 app = FastAPI(
     title="Job Skills Analyzer API",
@@ -24,10 +30,111 @@ app.include_router(
     prefix=f"{settings.API_V1_PREFIX}/analysis",
     tags=["analysis"]
 )
+app.include_router(
+    trends.router,
+    prefix=f"{settings.API_V1_PREFIX}/trends",
+    tags=["trends"]
+)
+app.include_router(
+    jobs.router,
+    prefix=f"{settings.API_V1_PREFIX}/jobs",
+    tags=["jobs"]
+)
+app.include_router(
+    boards.router,
+    prefix=f"{settings.API_V1_PREFIX}/boards",
+    tags=["boards"]
+)
+app.include_router(
+    cluster_routes.router,
+    prefix=f"{settings.API_V1_PREFIX}/cluster",
+    tags=["cluster"]
+)
+app.include_router(
+    admin.router,
+    prefix=f"{settings.API_V1_PREFIX}/admin",
+    tags=["admin"]
+)
+
+
+# Only in cluster mode, so other deployments skip the extra hop on every response
+if cluster.enabled:
+    app.add_middleware(NodeHeaderMiddleware, node_url=cluster.self_url)
+
+
+@app.on_event("startup")
+def create_tables():
+    """Create tables on startup when trends, job storage or board sync are enabled"""
+    if settings.TRENDS_ENABLED or settings.JOB_INDEX_ENABLED or settings.BOARD_SYNC_ENABLED:
+        import app.models  # noqa: F401  (registers models on Base.metadata)
+        Base.metadata.create_all(bind=engine)
+
+
+@app.on_event("startup")
+def load_job_index():
+    """Build the skill search index from stored analyses"""
+    if settings.JOB_INDEX_ENABLED:
+        db = SessionLocal()
+        try:
+            added = job_index.sync_from_db(db)
+        finally:
+            db.close()
+        print(f"Indexed {added} stored job analyses")
+
+
+@app.on_event("startup")
+def seed_near_duplicate_index():
+    """Index the signatures of recently stored postings for near-duplicate detection"""
+    if settings.JOB_INDEX_ENABLED and settings.NEAR_DUPLICATE_DETECTION_ENABLED:
+        db = SessionLocal()
+        try:
+            seeded = NLPService().seed_near_duplicates(recent_signatures(db, settings.NEAR_DUPLICATE_INDEX_SIZE))
+        finally:
+            db.close()
+        print(f"Seeded the near-duplicate index with {seeded} stored postings")
+
+
+@app.on_event("startup")
+async def start_board_sync():
+    """Start the periodic board sync when boards are configured"""
+    if settings.BOARD_SYNC_ENABLED and board_scheduler.boards and runs_background_loops():
+        board_scheduler.start()
+
+
+@app.on_event("shutdown")
+async def stop_board_sync():
+    """Cancel the periodic board sync"""
+    await board_scheduler.stop()
+
+
+@app.on_event("startup")
+async def start_cluster_health_checks():
+    """Start probing peers when cluster mode is enabled"""
+    if runs_background_loops():
+        cluster.start()
+
+
+@app.on_event("shutdown")
+async def stop_cluster_health_checks():
+    """Cancel peer probing and close forwarding connections"""
+    await cluster.stop()
+
+
+@app.on_event("startup")
+async def open_async_database():
+    """Create the pooled async engine up front, so a missing driver fails at startup"""
+    if settings.ASYNC_DB_ENABLED:
+        get_async_engine()
+
+
+@app.on_event("shutdown")
+async def close_async_database():
+    """Close the async engine's pooled connections"""
+    await dispose_async_engine()
 
 
 @app.get("/")
-def root():
+async def root():
     """Root endpoint"""
     return {
         "message": "Job Skills Analyzer API",
@@ -37,8 +144,8 @@ def root():
 
 
 @app.get("/health")
-def health_check():
-    """Health check endpoint"""
+async def health_check():
+    """Health check endpoint (async so it never waits on the threadpool)"""
     return {
         "status": "healthy",
         "version": "1.0.0",
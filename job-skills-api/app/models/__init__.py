@@ -0,0 +1,12 @@
+from app.models.boards import BoardPosting
+from app.models.jobs import AnalyzedJob, ArchivedDoc
+from app.models.trends import CategoryRollup, PostingRollup, SkillRollup
+
+__all__ = [
+    "AnalyzedJob",
+    "ArchivedDoc",
+    "BoardPosting",
+    "CategoryRollup",
+    "PostingRollup",
+    "SkillRollup",
+]
@@ -0,0 +1,32 @@
+"""
+Postings tracked per job board.
+Board sync compares each fetched board against these rows to find postings
+that were added, edited or removed since the previous sync.
+"""
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, UniqueConstraint
+
+from app.database import Base
+
+
+class BoardPosting(Base):
+    """A posting seen on a Greenhouse or Lever board"""
+    __tablename__ = "board_postings"
+
+    id = Column(Integer, primary_key=True)
+    provider = Column(String(16), nullable=False)  # "greenhouse" or "lever"
+    board = Column(String(255), nullable=False)  # board token / company slug
+    external_id = Column(String(64), nullable=False)  # posting id on the board
+    title = Column(String(500), nullable=True)
+    url = Column(String(1000), nullable=True)
+    content_hash = Column(String(64), nullable=False)  # sha256 of title and description
+    skills = Column(JSON, nullable=True)  # skills of the latest analyzed version
+    first_seen_at = Column(DateTime, nullable=False)
+    last_seen_at = Column(DateTime, nullable=False)
+    last_changed_at = Column(DateTime, nullable=False)
+    closed_at = Column(DateTime, nullable=True)  # set when the posting disappears from the board
+
+    __table_args__ = (
+        UniqueConstraint("provider", "board", "external_id", name="uq_board_posting"),
+        Index("ix_board_posting_open", "provider", "board", "closed_at"),
+    )
@@ -0,0 +1,31 @@
+"""
+Stored job analyses.
+One row per distinct posting, keyed by the content hash of its text, so the
+search and matching indexes can be rebuilt or caught up from the database.
+"""
+
+from sqlalchemy import JSON, Column, DateTime, Integer, LargeBinary, String
+
+from app.database import Base
+
+
+class AnalyzedJob(Base):
+    """An analyzed posting and its extracted skills"""
+    __tablename__ = "analyzed_jobs"
+
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), nullable=False, unique=True)  # sha256 of the posting text
+    title = Column(String(500), nullable=True)
+    analyzed_at = Column(DateTime, nullable=False, index=True)
+    total_skills_found = Column(Integer, nullable=False, default=0)
+    skills = Column(JSON, nullable=False)  # [{name, count, category, confidence}, ...]
+    minhash = Column(LargeBinary, nullable=True)  # near-duplicate signature (uint32 array), when detection is on
+
+
+class ArchivedDoc(Base):
+    """The processed spaCy Docs of a stored posting, for re-extraction"""
+    __tablename__ = "archived_docs"
+
+    content_hash = Column(String(64), primary_key=True)  # matches AnalyzedJob.content_hash
+    docs = Column(LargeBinary, nullable=False)  # DocBin bytes, one Doc per extracted part
+    archived_at = Column(DateTime, nullable=False)
@@ -0,0 +1,58 @@
+"""
+Time-series rollups of skill mentions.
+Each analyzed posting is folded into per-day, per-week and per-month counters
+so trend queries never have to rescan postings.
+"""
+
+from sqlalchemy import Column, Date, Index, Integer, String, UniqueConstraint
+
+from app.database import Base
+
+
+class SkillRollup(Base):
+    """Postings and mentions per skill per period"""
+    __tablename__ = "skill_rollups"
+
+    id = Column(Integer, primary_key=True)
+    granularity = Column(String(8), nullable=False)  # "day", "week" or "month"
+    period_start = Column(Date, nullable=False)
+    skill = Column(String(255), nullable=False)  # first spelling seen in the period
+    skill_key = Column(String(255), nullable=False)  # lowercased skill; spellings share one row
+    category = Column(String(64), nullable=False)
+    postings = Column(Integer, nullable=False, default=0)  # postings mentioning the skill
+    mentions = Column(Integer, nullable=False, default=0)  # total occurrences
+
+    __table_args__ = (
+        UniqueConstraint("granularity", "period_start", "skill_key", name="uq_skill_rollup"),
+        Index("ix_skill_rollup_skill", "granularity", "skill_key", "period_start"),
+    )
+
+
+class CategoryRollup(Base):
+    """Postings and mentions per skill category per period"""
+    __tablename__ = "category_rollups"
+
+    id = Column(Integer, primary_key=True)
+    granularity = Column(String(8), nullable=False)
+    period_start = Column(Date, nullable=False)
+    category = Column(String(64), nullable=False)
+    postings = Column(Integer, nullable=False, default=0)
+    mentions = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("granularity", "period_start", "category", name="uq_category_rollup"),
+    )
+
+
+class PostingRollup(Base):
+    """Total postings analyzed per period, the denominator for skill shares"""
+    __tablename__ = "posting_rollups"
+
+    id = Column(Integer, primary_key=True)
+    granularity = Column(String(8), nullable=False)
+    period_start = Column(Date, nullable=False)
+    postings = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint("granularity", "period_start", name="uq_posting_rollup"),
+    )
@@ -0,0 +1,184 @@
+"""
+Pre-fork server mode.
+
+The master process imports the application (loading the spaCy model, its
+vectors table and the compiled PhraseMatcher), freezes the resulting heap
+with gc.freeze() and then forks workers that serve requests on a shared
+socket. Workers share the model pages copy-on-write instead of each loading
+their own copy.
+
+Usage:
+    python -m app.prefork --workers 4 --port 8000
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+
+import uvicorn
+
+from app.config import settings
+from app.core.memory import format_megabytes, read_memory_usage
+
+# Set in each forked worker to its slot; periodic background loops run in slot 0 only
+WORKER_SLOT_ENV = "PREFORK_WORKER_SLOT"
+
+# Exercises every pipeline component once so lazily allocated state is created
+# in the master and shared, rather than allocated separately in each worker.
+WARMUP_TEXT = (
+    "We are looking for a Senior Software Engineer with experience with Python, "
+    "React and PostgreSQL. Familiar with Docker, Kubernetes and AWS at Google."
+)
+
+
+def create_socket(host: str, port: int) -> socket.socket:
+    """Bind the listening socket that every worker will accept on"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def load_application():
+    """Import the app in the master and freeze the heap before forking"""
+    from app.main import app
+    from app.services.nlp_service import NLPService
+
+    NLPService().analyze_job_description(WARMUP_TEXT)
+
+    # Move everything allocated so far into a permanent generation. The
+    # collector then never writes to these objects' headers in the workers,
+    # which would otherwise copy the pages they live on.
+    gc.collect()
+    gc.freeze()
+    return app
+
+
+def runs_background_loops() -> bool:
+    """
+    Whether this process runs the periodic loops (board sync, cluster health checks).
+
+    Outside pre-fork mode the single server process does. Under pre-fork only
+    worker 0 does (a restarted worker 0 takes over), so the loops do not run
+    once per worker.
+    """
+    return os.environ.get(WORKER_SLOT_ENV, "0") == "0"
+
+
+def in_prefork_worker() -> bool:
+    """Whether this process is one of several pre-forked workers (each with its own in-memory state)"""
+    return WORKER_SLOT_ENV in os.environ
+
+
+def run_worker(app, sock: socket.socket, host: str, port: int, slot: int):
+    """Serve requests in a forked worker; never returns"""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    os.environ[WORKER_SLOT_ENV] = str(slot)
+
+    config = uvicorn.Config(app, host=host, port=port, log_level="info")
+    server = uvicorn.Server(config)
+    try:
+        server.run(sockets=[sock])
+    finally:
+        os._exit(0)
+
+
+def report_memory(workers: Dict[int, int]):
+    """Print shared vs unique memory for the master and each worker"""
+    master = read_memory_usage()
+    if master is None:
+        return
+
+    print(f"[prefork] master pid={os.getpid()} rss={format_megabytes(master['rss'])}", flush=True)
+    for pid in sorted(workers):
+        usage = read_memory_usage(pid)
+        if usage is None:
+            continue
+        print(
+            f"[prefork] worker pid={pid} "
+            f"unique={format_megabytes(usage['unique'])} "
+            f"shared={format_megabytes(usage['shared'])} "
+            f"pss={format_megabytes(usage['pss'])}",
+            flush=True,
+        )
+
+
+def serve(host: str, port: int, worker_count: int, report_interval: float):
+    """Load the app once, fork workers and supervise them until shutdown"""
+    sock = create_socket(host, port)
+    print(f"[prefork] loading application in master pid={os.getpid()}", flush=True)
+    app = load_application()
+
+    workers: Dict[int, int] = {}  # pid -> worker slot
+    shutting_down = False
+
+    def spawn(slot: int):
+        pid = os.fork()
+        if pid == 0:
+            run_worker(app, sock, host, port, slot)
+        workers[pid] = slot
+        print(f"[prefork] started worker {slot} pid={pid}", flush=True)
+
+    def shutdown(signum, frame):
+        nonlocal shutting_down
+        shutting_down = True
+        for pid in list(workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    for slot in range(worker_count):
+        spawn(slot)
+
+    next_report = time.monotonic() + report_interval
+    while workers:
+        pid, status = os.waitpid(-1, os.WNOHANG)
+        if pid == 0:
+            if report_interval and time.monotonic() >= next_report:
+                report_memory(workers)
+                next_report = time.monotonic() + report_interval
+            time.sleep(0.5)
+            continue
+
+        slot = workers.pop(pid, None)
+        if slot is not None and not shutting_down:
+            print(f"[prefork] worker {slot} pid={pid} exited with status {status}; restarting", flush=True)
+            spawn(slot)
+
+    sock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the API from pre-forked workers sharing one model")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)))
+    parser.add_argument("--workers", type=int, default=settings.WEB_WORKERS)
+    parser.add_argument(
+        "--memory-report-interval",
+        type=float,
+        default=60.0,
+        help="Seconds between shared/unique memory reports (0 to disable)",
+    )
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        print("Pre-fork mode requires a platform with os.fork()", file=sys.stderr)
+        sys.exit(1)
+
+    serve(args.host, args.port, args.workers, args.memory_report_interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Re-extract stored postings from their archived Docs.
+
+After SKILLS_DATABASE or the extraction rules change, stored analyses are
+brought up to date without running the spaCy pipeline again: worker
+processes load only the model's vocabulary (with its vectors), restore each
+posting's archived Docs and rerun the phrase matcher, entity filter,
+contextual and fuzzy tiers on them. Updated skills are written back to
+analyzed_jobs in bulk.
+
+Only postings stored with DOC_ARCHIVE_ENABLED have archived Docs; others are
+left untouched. Docs are restored against the English model's vocabulary,
+so postings processed by another language's model (MULTILINGUAL_ENABLED) are
+re-extracted with the English entity labels and context keywords. Restart the
+API afterwards so the skill search index is rebuilt from the updated rows.
+Trend rollups are not recomputed.
+
+Usage:
+    python -m app.reextract --workers 4
+    python -m app.reextract --dry-run   # count changes without writing them
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Tuple
+
+import spacy
+from sqlalchemy import update
+
+from app.database import SessionLocal
+from app.models.jobs import AnalyzedJob, ArchivedDoc
+from app.services.doc_archive import deserialize_docs
+from app.services.nlp_service import NLPService
+from app.services.skills_extractor import SPACY_MODEL, SkillsExtractor
+
+# Pipeline components of the en_core_web_* models; re-extraction needs none of
+# them, only the vocabulary (names missing from a pipeline are ignored)
+PIPELINE_COMPONENTS = ["tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer", "ner", "entity_ruler"]
+
+# Postings per task sent to a worker
+DEFAULT_CHUNK_SIZE = 200
+
+_extractor = None  # per worker process
+
+
+def _init_worker():
+    global _extractor
+    _extractor = SkillsExtractor(nlp=spacy.load(SPACY_MODEL, exclude=PIPELINE_COMPONENTS))
+
+
+def reextract_chunk(rows: List[Tuple[int, bytes, List[Dict]]]) -> List[Tuple[int, List[Dict]]]:
+    """
+    Re-extract one chunk of postings in a worker process.
+
+    Args:
+        rows: (analyzed job id, archived DocBin bytes, stored skills) per posting
+
+    Returns:
+        (id, new skills) for every posting whose skills changed
+    """
+    changed = []
+    for job_id, data, stored_skills in rows:
+        docs = deserialize_docs(data, _extractor.nlp.vocab)
+        skills = NLPService._merge_skill_lists([_extractor.extract_from_doc(doc) for doc in docs] or [[]])
+        if skills != stored_skills:
+            changed.append((job_id, skills))
+    return changed
+
+
+def iter_archived(chunk_size: int) -> Iterator[List[Tuple[int, bytes, List[Dict]]]]:
+    """Stream stored postings that have archived Docs, a chunk at a time, in id order"""
+    db = SessionLocal()
+    try:
+        last_id = 0
+        while True:
+            rows = (
+                db.query(AnalyzedJob.id, ArchivedDoc.docs, AnalyzedJob.skills)
+                .join(ArchivedDoc, ArchivedDoc.content_hash == AnalyzedJob.content_hash)
+                .filter(AnalyzedJob.id > last_id)
+                .order_by(AnalyzedJob.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if rows:
+                yield [tuple(row) for row in rows]
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1].id
+    finally:
+        db.close()
+
+
+def write_changes(changed: List[Tuple[int, List[Dict]]]):
+    """Update skills and skill totals of re-extracted postings"""
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(AnalyzedJob),
+            [{"id": job_id, "skills": skills, "total_skills_found": len(skills)} for job_id, skills in changed],
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def reextract(workers: int, chunk_size: int = DEFAULT_CHUNK_SIZE, dry_run: bool = False) -> Dict:
+    """
+    Re-extract every posting with archived Docs across worker processes.
+
+    At most two chunks per worker are in flight, so memory stays bounded
+    however many postings are stored.
+
+    Returns:
+        Postings re-extracted, postings whose skills changed and elapsed seconds
+    """
+    started = time.perf_counter()
+    processed = changed = 0
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending = {}  # future -> chunk size
+
+        def collect(done):
+            nonlocal processed, changed
+            for future in done:
+                processed += pending.pop(future)
+                updates = future.result()
+                changed += len(updates)
+                if updates and not dry_run:
+                    write_changes(updates)
+
+        for chunk in iter_archived(chunk_size):
+            if len(pending) >= workers * 2:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending[pool.submit(reextract_chunk, chunk)] = len(chunk)
+        collect(wait(pending).done)
+
+    return {
+        "postings": processed,
+        "changed": changed,
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Postings per worker task")
+    parser.add_argument("--dry-run", action="store_true", help="Count changed postings without writing them")
+    args = parser.parse_args()
+
+    result = reextract(args.workers, args.chunk_size, args.dry_run)
+    rate = result["postings"] / result["seconds"] if result["seconds"] else 0.0
+    print(
+        f"Re-extracted {result['postings']} postings in {result['seconds']}s ({rate:.0f}/s); "
+        f"{result['changed']} changed{' (dry run, nothing written)' if args.dry_run else ''}"
+    )
+
+
+if __name__ == "__main__":
+    main()
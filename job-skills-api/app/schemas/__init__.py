@@ -6,6 +6,36 @@ from app.schemas.analysis import (
     BatchAnalysisRequest,
     AggregatedSkill,
     BatchAnalysisResponse,
+    DebugInfo,
+    DuplicateReference,
+    PostingSection,
+    SectionSkills,
+    SuggestedSkill,
+)
+from app.schemas.boards import (
+    BoardSyncRequest,
+    BoardSyncResult,
+    BoardSyncStatus,
+    OpenPostingSkill,
+    OpenPostingSkillsResponse,
+)
+from app.schemas.cluster import (
+    ClusterNode,
+    ClusterNodeRequest,
+    ClusterStatus,
+)
+from app.schemas.search import (
+    JobMatch,
+    JobSearchHit,
+    JobSearchResponse,
+    ResumeMatchRequest,
+    ResumeMatchResponse,
+)
+from app.schemas.trends import (
+    TopSkill,
+    TopSkillsResponse,
+    TrendPoint,
+    TrendResponse,
 )
 
 __all__ = [
@@ -16,4 +46,26 @@ __all__ = [
     "BatchAnalysisRequest",
     "AggregatedSkill",
     "BatchAnalysisResponse",
+    "DebugInfo",
+    "DuplicateReference",
+    "PostingSection",
+    "SectionSkills",
+    "SuggestedSkill",
+    "BoardSyncRequest",
+    "BoardSyncResult",
+    "BoardSyncStatus",
+    "OpenPostingSkill",
+    "OpenPostingSkillsResponse",
+    "ClusterNode",
+    "ClusterNodeRequest",
+    "ClusterStatus",
+    "JobMatch",
+    "JobSearchHit",
+    "JobSearchResponse",
+    "ResumeMatchRequest",
+    "ResumeMatchResponse",
+    "TopSkill",
+    "TopSkillsResponse",
+    "TrendPoint",
+    "TrendResponse",
 ]
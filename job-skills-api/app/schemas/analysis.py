@@ -13,8 +13,8 @@ class SkillBase(BaseModel):
 
 
 class Skill(SkillBase):
-    """Skill with ID"""
-    id: UUID = Field(default_factory=uuid4)
+    """Skill with optional ID (only generated when requested)"""
+    id: Optional[UUID] = None
 
 
 class AnalysisCreate(BaseModel):
@@ -28,6 +28,50 @@ class AnalysisCreate(BaseModel):
         max_length=255,
         description="Optional job title"
     )
+    source_url: Optional[str] = Field(
+        None,
+        description="Posting URL or domain; postings from the same source share cached paragraphs"
+    )
+
+
+class DebugInfo(BaseModel):
+    """Per-stage timings and counters returned in debug mode"""
+    total_ms: float = Field(description="Wall-clock time spent in the analysis")
+    stages: Dict[str, float] = Field(description="Milliseconds spent per pipeline stage")
+    counts: Dict[str, int] = Field(description="Token, entity and match counts")
+
+
+class DuplicateReference(BaseModel):
+    """Identifies the posting whose analysis a near-duplicate reuses"""
+    job_index: Optional[int] = Field(
+        None,
+        description="Index of the original within the same batch, if it was in the batch"
+    )
+    content_hash: str = Field(description="Content hash of the original posting")
+    similarity: float = Field(ge=0.0, le=1.0, description="Estimated Jaccard similarity")
+
+
+class SuggestedSkill(BaseModel):
+    """An unknown term with the nearest known skill by word-vector similarity"""
+    term: str = Field(description="Term as it appears in the posting")
+    nearest_skill: str = Field(description="Most similar skill in the skills database")
+    category: str = Field(description="Category of the nearest skill")
+    similarity: float = Field(description="Cosine similarity of the word vectors")
+
+
+class SectionSkills(BaseModel):
+    """Skills attributed to one section of a posting"""
+    type: str = Field(description="requirements, responsibilities, benefits, legal, about or other")
+    heading: Optional[str] = Field(None, description="Heading line that opened the section")
+    skipped: bool = Field(description="Whether extraction skipped the section as boilerplate")
+    skills: List[str] = Field(description="Skills found in the section")
+
+
+class PostingSection(BaseModel):
+    """A typed region of a fetched posting"""
+    type: str = Field(description="requirements, responsibilities, benefits, legal, about or other")
+    heading: Optional[str] = Field(None, description="Heading line that opened the section")
+    text: str
 
 
 class AnalysisResponse(BaseModel):
@@ -40,6 +84,30 @@ class AnalysisResponse(BaseModel):
     categories: Dict[str, int] = Field(
         description="Count of skills per category"
     )
+    language: Optional[str] = Field(
+        None,
+        description="Detected language of the posting (always \"en\" unless multi-language support is enabled)"
+    )
+    model: Optional[str] = Field(
+        None,
+        description="spaCy model the posting was processed with"
+    )
+    suggested_skills: Optional[List[SuggestedSkill]] = Field(
+        None,
+        description="Possible skills not in the database, present when vector discovery is enabled"
+    )
+    sections: Optional[List[SectionSkills]] = Field(
+        None,
+        description="Per-section skill attribution, present when section segmentation is enabled"
+    )
+    duplicate_of: Optional[DuplicateReference] = Field(
+        None,
+        description="Present when this posting reused the analysis of a near-duplicate"
+    )
+    debug: Optional[DebugInfo] = Field(
+        None,
+        description="Stage timings, only present when debug mode is requested"
+    )
 
 
 class BatchAnalysisRequest(BaseModel):
@@ -49,6 +117,10 @@ class BatchAnalysisRequest(BaseModel):
         max_length=50,
         description="List of job descriptions to analyze (max 50)"
     )
+    collapse_duplicates: bool = Field(
+        False,
+        description="Count postings repeated within the batch only once in aggregated statistics"
+    )
 
 
 class AggregatedSkill(BaseModel):
@@ -77,6 +149,14 @@ class BatchAnalysisResponse(BaseModel):
     category_breakdown: Dict[str, int] = Field(
         description="Total skills per category across all jobs"
     )
+    duplicate_jobs: int = Field(
+        0,
+        description="Number of jobs that reused the analysis of a duplicate posting"
+    )
+    debug: Optional[DebugInfo] = Field(
+        None,
+        description="Stage timings summed over all jobs, only present in debug mode"
+    )
 
 
 class FetchJobRequest(BaseModel):
@@ -92,3 +172,7 @@ class FetchJobResponse(BaseModel):
     title: str = Field(description="Job title extracted from the page")
     description: str = Field(description="Job description text")
     url: str = Field(description="Original URL")
+    sections: Optional[List[PostingSection]] = Field(
+        None,
+        description="Description split into typed sections by its headings"
+    )
@@ -0,0 +1,45 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+
+class BoardSyncRequest(BaseModel):
+    """Schema for syncing one board on demand"""
+    provider: str = Field(..., pattern="^(greenhouse|lever)$", description="Board provider")
+    board: str = Field(..., min_length=1, max_length=255, description="Greenhouse board token or Lever company slug")
+
+
+class BoardSyncResult(BaseModel):
+    """Schema for the outcome of one board sync"""
+    provider: str
+    board: str
+    synced_at: datetime
+    added: int = Field(0, description="Postings seen for the first time")
+    changed: int = Field(0, description="Tracked postings whose content changed (or that reappeared edited)")
+    unchanged: int = Field(0, description="Postings skipped because their content hash matched")
+    removed: int = Field(0, description="Open postings no longer on the board, now marked closed")
+    reopened: int = Field(0, description="Closed postings back on the board, now open again")
+    analyzed: int = Field(0, description="Postings sent through skill extraction")
+    duration_ms: float
+    error: Optional[str] = None
+
+
+class BoardSyncStatus(BaseModel):
+    """Schema for the board sync scheduler"""
+    boards: List[str] = Field(description="Configured boards as provider:board")
+    interval: float = Field(description="Seconds between sync cycles")
+    running: bool = Field(description="Whether the periodic sync loop is running in this process")
+    last_results: List[BoardSyncResult]
+
+
+class OpenPostingSkill(BaseModel):
+    """Schema for a skill ranked over currently open postings"""
+    name: str
+    category: str
+    postings: int = Field(description="Open postings that require the skill")
+
+
+class OpenPostingSkillsResponse(BaseModel):
+    """Schema for skill demand across open board postings"""
+    open_postings: int
+    skills: List[OpenPostingSkill]
@@ -0,0 +1,32 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class ClusterNodeRequest(BaseModel):
+    """Schema for adding a node to or removing it from the hash ring"""
+    url: str = Field(
+        ...,
+        min_length=1,
+        max_length=2048,
+        pattern=r"^https?://\S+$",
+        description="Base URL of the node, e.g. http://10.0.0.3:8000",
+    )
+
+
+class ClusterNode(BaseModel):
+    """Schema for one node as seen from this node"""
+    url: str
+    self: bool = Field(description="Whether this is the node answering")
+    healthy: bool = Field(description="False while the node fails forwards or health checks")
+    unhealthy_for: Optional[float] = Field(None, description="Seconds since the node was marked unhealthy")
+
+
+class ClusterStatus(BaseModel):
+    """Schema for cluster membership and routing counters of this node"""
+    enabled: bool
+    self: str = Field(description="This node's base URL")
+    nodes: List[ClusterNode]
+    owned: int = Field(description="Requests this node owned and processed")
+    forwarded: int = Field(description="Requests forwarded to their owning node")
+    received: int = Field(description="Requests other nodes forwarded here")
+    fallbacks: int = Field(description="Requests processed here because their owner was unhealthy")
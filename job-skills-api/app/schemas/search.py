@@ -0,0 +1,46 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+from app.schemas.analysis import SkillBase
+
+
+class JobSearchHit(BaseModel):
+    """Schema for a stored posting matching a skill query"""
+    job_id: int
+    title: Optional[str]
+    analyzed_at: datetime
+    score: float = Field(description="Sum of confidence * log(1 + count) over matched query skills")
+    matched_skills: List[str] = Field(description="Queried skills the posting requires")
+
+
+class JobSearchResponse(BaseModel):
+    """Schema for a page of skill search results"""
+    total: int = Field(description="Number of postings matching the query")
+    hits: List[JobSearchHit]
+
+
+class ResumeMatchRequest(BaseModel):
+    """Schema for ranking stored postings against a resume"""
+    resume: str = Field(
+        min_length=50,
+        description="Resume or candidate profile text"
+    )
+    top_k: int = Field(10, ge=1, le=100, description="Number of postings to return")
+
+
+class JobMatch(BaseModel):
+    """Schema for a stored posting ranked by skill fit"""
+    job_id: int
+    title: Optional[str]
+    analyzed_at: datetime
+    score: float = Field(description="Category-weighted cosine similarity of the skill sets")
+    matched_skills: List[str] = Field(description="Posting skills the resume also mentions")
+    missing_skills: List[str] = Field(description="Posting skills the resume does not mention")
+
+
+class ResumeMatchResponse(BaseModel):
+    """Schema for resume-to-jobs matching results"""
+    resume_skills: List[SkillBase]
+    candidates: int = Field(description="Stored postings sharing at least one skill with the resume")
+    matches: List[JobMatch]
@@ -0,0 +1,36 @@
+from pydantic import BaseModel, Field
+from typing import List
+from datetime import date
+
+
+class TopSkill(BaseModel):
+    """Schema for a skill ranked over a time window"""
+    name: str
+    category: str
+    postings: int = Field(description="Postings in the window that mention the skill")
+    mentions: int = Field(description="Total occurrences in the window")
+    share: float = Field(description="Percentage of postings in the window that mention the skill")
+
+
+class TopSkillsResponse(BaseModel):
+    """Schema for the top skills over a trailing window"""
+    start: date
+    end: date
+    total_postings: int
+    skills: List[TopSkill]
+
+
+class TrendPoint(BaseModel):
+    """Schema for one period of a skill or category trend"""
+    period_start: date
+    postings: int
+    mentions: int
+    total_postings: int = Field(description="All postings analyzed in the period")
+    share: float = Field(description="Percentage of the period's postings")
+
+
+class TrendResponse(BaseModel):
+    """Schema for a skill or category trend"""
+    name: str
+    granularity: str
+    points: List[TrendPoint]
@@ -0,0 +1,213 @@
+"""
+Async persistence and rollup reads.
+The same writes and trend queries as job_store and trend_service, over the
+pooled async engine (ASYNC_DB_ENABLED), so database work is awaited on the
+event loop instead of holding threadpool workers that NLP requests need.
+Row building and read statements are shared with the sync modules.
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.jobs import AnalyzedJob, ArchivedDoc
+from app.models.trends import CategoryRollup, PostingRollup, SkillRollup
+from app.services import trend_service
+from app.services.job_store import INSERT_CHUNK_SIZE, analysis_rows, archived_doc_rows
+from app.services.nlp_service import NLPService
+
+
+def _dialect_insert(dialect: str):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"Async upserts are not supported for {dialect} databases")
+    return insert
+
+
+@lru_cache(maxsize=None)
+def _insert_ignoring_conflicts(dialect: str, model, key_column: str):
+    """INSERT ... ON CONFLICT DO NOTHING, built once per table"""
+    return _dialect_insert(dialect)(model.__table__).on_conflict_do_nothing(index_elements=[key_column])
+
+
+@lru_cache(maxsize=None)
+def _upsert_counters(dialect: str, model, key_columns: Tuple[str, ...], counter_columns: Tuple[str, ...]):
+    """INSERT ... ON CONFLICT DO UPDATE adding to the counters, built once per table"""
+    table = model.__table__
+    stmt = _dialect_insert(dialect)(table)
+    return stmt.on_conflict_do_update(
+        index_elements=list(key_columns),
+        set_={column: table.c[column] + stmt.excluded[column] for column in counter_columns},
+    )
+
+
+async def _execute_many(db: AsyncSession, statement, rows: List[Dict]):
+    """
+    Run one statement over many rows.
+
+    The driver's executemany prepares the statement once and streams the
+    rows through it (pipelined with asyncpg), instead of one multi-row
+    VALUES statement per chunk whose SQL changes with the chunk length.
+    """
+    if rows:
+        await db.execute(statement, rows)
+
+
+async def save_analyses(
+    db: AsyncSession,
+    job_descriptions: List[str],
+    titles: List[Optional[str]],
+    analyses: List[Dict],
+    analyzed_at: datetime,
+) -> int:
+    """
+    Insert analyzed postings (without committing), ignoring ones already stored.
+
+    Same rows as job_store.save_analyses, including archived Docs.
+
+    Returns:
+        Number of rows submitted for insertion
+    """
+    rows = analysis_rows(job_descriptions, titles, analyses, analyzed_at)
+    if not rows:
+        return 0
+
+    dialect = db.bind.dialect.name
+    await _execute_many(db, _insert_ignoring_conflicts(dialect, AnalyzedJob, "content_hash"), rows)
+    await _execute_many(
+        db,
+        _insert_ignoring_conflicts(dialect, ArchivedDoc, "content_hash"),
+        archived_doc_rows(rows, analyzed_at),
+    )
+    return len(rows)
+
+
+async def stored_content_hashes(db: AsyncSession, content_hashes: List[str]) -> Set[str]:
+    """The given content hashes that already have an analyzed_jobs row (see job_store)"""
+    if not settings.JOB_INDEX_ENABLED:
+        return set()
+    content_hashes = sorted(set(content_hashes))
+    stored = set()
+    for offset in range(0, len(content_hashes), INSERT_CHUNK_SIZE):
+        chunk = content_hashes[offset:offset + INSERT_CHUNK_SIZE]
+        result = await db.execute(select(AnalyzedJob.content_hash).where(AnalyzedJob.content_hash.in_(chunk)))
+        stored.update(result.scalars())
+    return stored
+
+
+async def fold_analyses(
+    db: AsyncSession,
+    analyses: List[Dict],
+    analyzed_at: datetime,
+    job_descriptions: Optional[List[str]] = None,
+) -> int:
+    """
+    Fold analysis results into the rollup tables (without committing).
+
+    Same counters as trend_service.fold_analyses, including skipping postings
+    already stored when job_descriptions are given.
+
+    Returns:
+        Number of postings folded in
+    """
+    if job_descriptions is not None:
+        stored = await stored_content_hashes(db, [NLPService.content_key(text) for text in job_descriptions])
+        analyses = trend_service.unstored_analyses(analyses, job_descriptions, stored)
+
+    postings, posting_rows, skill_rows, category_rows = trend_service.rollup_rows(analyses, analyzed_at)
+    if not postings:
+        return 0
+
+    dialect = db.bind.dialect.name
+    await _execute_many(
+        db,
+        _upsert_counters(dialect, PostingRollup, ("granularity", "period_start"), ("postings",)),
+        posting_rows,
+    )
+    await _execute_many(
+        db,
+        _upsert_counters(dialect, SkillRollup, ("granularity", "period_start", "skill_key"), ("postings", "mentions")),
+        skill_rows,
+    )
+    await _execute_many(
+        db,
+        _upsert_counters(dialect, CategoryRollup, ("granularity", "period_start", "category"), ("postings", "mentions")),
+        category_rows,
+    )
+    return postings
+
+
+async def store_analyses(
+    job_descriptions: List[str],
+    titles: List[Optional[str]],
+    analyses: List[Dict],
+    analyzed_at: Optional[datetime] = None,
+):
+    """Store analyzed postings in a session of their own (for background tasks)"""
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            await save_analyses(db, job_descriptions, titles, analyses, analyzed_at or datetime.utcnow())
+
+
+async def record_analyses(
+    analyses: List[Dict],
+    analyzed_at: Optional[datetime] = None,
+    job_descriptions: Optional[List[str]] = None,
+):
+    """Fold analyses into the rollups in a session of their own (for background tasks)"""
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            await fold_analyses(db, analyses, analyzed_at or datetime.utcnow(), job_descriptions)
+
+
+async def top_skills(
+    db: AsyncSession,
+    days: int = 90,
+    limit: int = 20,
+    category: Optional[str] = None,
+    today: Optional[date] = None,
+) -> Dict:
+    """Most frequently required skills over a trailing window (see trend_service.top_skills)"""
+    params = trend_service.top_skills_params(days, limit, category, today)
+    total_postings = (await db.execute(trend_service.WINDOW_POSTINGS, params)).scalar_one()
+    statement = trend_service.TOP_SKILLS_IN_CATEGORY if category else trend_service.TOP_SKILLS
+    rows = (await db.execute(statement, params)).all()
+    return trend_service.top_skills_result(params, total_postings, rows)
+
+
+async def _series(db: AsyncSession, statement, params: Dict) -> List[Dict]:
+    count_rows = (await db.execute(statement, params)).all()
+    total_rows = (await db.execute(trend_service.PERIOD_POSTINGS, params)).all()
+    return trend_service.series_points(params, count_rows, total_rows)
+
+
+async def skill_trend(
+    db: AsyncSession,
+    skill: str,
+    granularity: str = "month",
+    periods: int = 12,
+    today: Optional[date] = None,
+) -> List[Dict]:
+    """Share of postings requiring a skill in each period (case-insensitive)"""
+    params = trend_service.series_params(skill.lower(), granularity, periods, today)
+    return await _series(db, trend_service.SKILL_SERIES, params)
+
+
+async def category_trend(
+    db: AsyncSession,
+    category: str,
+    granularity: str = "month",
+    periods: int = 12,
+    today: Optional[date] = None,
+) -> List[Dict]:
+    """Share of postings mentioning a skill category in each period"""
+    params = trend_service.series_params(category, granularity, periods, today)
+    return await _series(db, trend_service.CATEGORY_SERIES, params)
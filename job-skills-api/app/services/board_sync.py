@@ -0,0 +1,407 @@
+"""
+Incremental sync of Greenhouse and Lever job boards.
+Each sync fetches a board's listing through its public API, diffs it against
+the postings tracked in the database by content hash, and analyzes only new
+or edited postings. Postings that disappeared are marked closed.
+"""
+
+import asyncio
+import hashlib
+import html
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, urlparse
+
+import httpx
+from bs4 import BeautifulSoup
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.admission import AdmissionController
+from app.database import SessionLocal
+from app.models.boards import BoardPosting
+from app.services.job_fetcher import JobFetcher
+from app.services.job_store import save_analyses
+from app.services.nlp_service import NLPService
+from app.services.trend_service import fold_analyses
+
+PROVIDERS = ("greenhouse", "lever")
+
+
+class BoardSyncError(Exception):
+    """Raised when a board listing cannot be fetched or parsed"""
+    pass
+
+
+def _html_to_text(markup: str) -> str:
+    """Convert posting HTML to text, keeping one line per block for the section segmenter"""
+    return BeautifulSoup(markup, "html.parser").get_text(separator="\n", strip=True)
+
+
+def content_hash(title: Optional[str], description: str) -> str:
+    """Hash of what analysis sees; a posting whose hash changes is re-analyzed"""
+    return hashlib.sha256(f"{title or ''}\n{description}".encode("utf-8")).hexdigest()
+
+
+class HostLimiter:
+    """
+    Per-host politeness for outgoing requests.
+
+    At most `max_concurrent` requests run against one host at a time, and
+    request starts to the same host are spaced at least `min_interval`
+    seconds apart. Boards on the same provider share its API host.
+    """
+
+    def __init__(self, max_concurrent: int = 1, min_interval: float = 1.0):
+        self.max_concurrent = max_concurrent
+        self.min_interval = min_interval
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def limit(self, url: str):
+        """Hold a request slot for the URL's host"""
+        host = (urlparse(url).hostname or "").lower()
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.max_concurrent))
+        async with semaphore:
+            async with self._locks.setdefault(host, asyncio.Lock()):
+                delay = self._next_start.get(host, 0.0) - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._next_start[host] = time.monotonic() + self.min_interval
+            yield
+
+
+async def _get_json(client: httpx.AsyncClient, limiter: HostLimiter, url: str, params: Dict):
+    async with limiter.limit(url):
+        response = await client.get(url, params=params, follow_redirects=True)
+    if response.status_code == 404:
+        raise BoardSyncError(f"Board not found: {url}")
+    response.raise_for_status()
+    return response.json()
+
+
+async def fetch_greenhouse_board(client: httpx.AsyncClient, limiter: HostLimiter, board: str) -> List[Dict]:
+    """Fetch every posting on a Greenhouse board (one request, content included)"""
+    url = f"{settings.GREENHOUSE_API_URL.rstrip('/')}/v1/boards/{quote(board)}/jobs"
+    data = await _get_json(client, limiter, url, {"content": "true"})
+
+    postings = []
+    for job in data.get("jobs", []):
+        # Greenhouse returns the description as HTML-escaped HTML
+        description = _html_to_text(html.unescape(job.get("content") or ""))
+        postings.append({
+            "external_id": str(job["id"]),
+            "title": job.get("title"),
+            "url": job.get("absolute_url"),
+            "description": description,
+        })
+    return postings
+
+
+async def fetch_lever_board(client: httpx.AsyncClient, limiter: HostLimiter, board: str) -> List[Dict]:
+    """Fetch every posting on a Lever board (one request, content included)"""
+    url = f"{settings.LEVER_API_URL.rstrip('/')}/v0/postings/{quote(board)}"
+    data = await _get_json(client, limiter, url, {"mode": "json"})
+
+    postings = []
+    for job in data:
+        parts = [job.get("descriptionPlain") or _html_to_text(job.get("description") or "")]
+        for section in job.get("lists", []):
+            # Lever keeps requirements and responsibilities in titled lists
+            parts.append(section.get("text") or "")
+            parts.append(_html_to_text(section.get("content") or ""))
+        parts.append(job.get("additionalPlain") or "")
+
+        postings.append({
+            "external_id": str(job["id"]),
+            "title": job.get("text"),
+            "url": job.get("hostedUrl"),
+            "description": "\n".join(part for part in parts if part),
+        })
+    return postings
+
+
+FETCHERS = {
+    "greenhouse": fetch_greenhouse_board,
+    "lever": fetch_lever_board,
+}
+
+
+def apply_board_snapshot(provider: str, board: str, postings: List[Dict], seen_at: Optional[datetime] = None) -> Dict:
+    """
+    Reconcile a fetched board listing with the tracked postings.
+
+    New and edited postings are analyzed as one batch and their skills
+    stored. New postings are folded into the trend rollups (edits are not, so
+    a posting is counted once). Stored analyses feed the skill search index.
+    Postings missing from the listing are marked closed, and closed postings
+    that reappear are reopened. Closing only affects open_posting_skills: the
+    rollups count postings when they were first seen, open or not. Likewise
+    the stored analyses (and so the skill index) keep every version of an
+    edited posting and keep closed postings; only board_postings tracks the
+    current, open state.
+
+    Args:
+        provider: "greenhouse" or "lever"
+        board: Board token / company slug
+        postings: Fetched postings (external_id, title, url, description)
+        seen_at: Time of the fetch (defaults to now, UTC)
+
+    Returns:
+        Counts of added, changed, unchanged, removed, reopened and analyzed postings
+    """
+    seen_at = seen_at or datetime.utcnow()
+    db = SessionLocal()
+    try:
+        tracked_hashes = dict(
+            db.query(BoardPosting.external_id, BoardPosting.content_hash).filter_by(provider=provider, board=board)
+        )
+    finally:
+        db.close()
+
+    to_analyze: List[Tuple[Dict, str]] = []  # (posting, hash)
+    for posting in postings:
+        digest = content_hash(posting["title"], posting["description"])
+        if tracked_hashes.get(posting["external_id"]) != digest:
+            to_analyze.append((posting, digest))
+
+    # Analysis runs before the write session opens, so no connection is held during extraction
+    analyses = []
+    if to_analyze:
+        analyses = NLPService().analyze_job_descriptions(
+            [posting["description"] for posting, _ in to_analyze],
+            sources=[posting["url"] for posting, _ in to_analyze],
+        )
+    analyzed = {
+        posting["external_id"]: (posting, digest, analysis)
+        for (posting, digest), analysis in zip(to_analyze, analyses)
+    }
+
+    db = SessionLocal()
+    try:
+        tracked = {
+            row.external_id: row
+            for row in db.query(BoardPosting).filter_by(provider=provider, board=board)
+        }
+
+        added_analyses, added_descriptions = [], []
+        unchanged = reopened = 0
+        for posting in postings:
+            row = tracked.get(posting["external_id"])
+            if row is not None and row.closed_at is not None:
+                reopened += 1
+            if posting["external_id"] not in analyzed:
+                row.last_seen_at = seen_at
+                row.closed_at = None
+                unchanged += 1
+                continue
+
+            posting, digest, analysis = analyzed[posting["external_id"]]
+            if row is None:
+                row = BoardPosting(
+                    provider=provider,
+                    board=board,
+                    external_id=posting["external_id"],
+                    first_seen_at=seen_at,
+                )
+                db.add(row)
+                added_analyses.append(analysis)
+                added_descriptions.append(posting["description"])
+            row.title = posting["title"]
+            row.url = posting["url"]
+            row.content_hash = digest
+            row.skills = analysis["skills"]
+            row.last_seen_at = seen_at
+            row.last_changed_at = seen_at
+            row.closed_at = None
+
+        fetched_ids = {posting["external_id"] for posting in postings}
+        removed = 0
+        for external_id, row in tracked.items():
+            if external_id not in fetched_ids and row.closed_at is None:
+                row.closed_at = seen_at
+                removed += 1
+
+        if settings.TRENDS_ENABLED:
+            fold_analyses(db, added_analyses, seen_at, added_descriptions)
+        if settings.JOB_INDEX_ENABLED and to_analyze:
+            save_analyses(
+                db,
+                [posting["description"] for posting, _ in to_analyze],
+                [posting["title"] for posting, _ in to_analyze],
+                analyses,
+                seen_at,
+            )
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    return {
+        "added": len(added_analyses),
+        "changed": len(to_analyze) - len(added_analyses),
+        "unchanged": unchanged,
+        "removed": removed,
+        "reopened": reopened,
+        "analyzed": len(to_analyze),
+    }
+
+
+def open_posting_skills(db: Session, limit: int = 20, category: Optional[str] = None) -> Dict:
+    """
+    Rank skills by the number of currently open board postings that require them.
+
+    Unlike the trend rollups, which count every posting ever analyzed, this
+    reflects live demand: closed postings drop out as soon as a sync notices.
+
+    Args:
+        db: Database session
+        limit: Number of skills to return
+        category: Optional category filter
+
+    Returns:
+        Number of open postings and the top skills with their posting counts
+    """
+    counts: Counter = Counter()
+    first_seen: Dict[str, Dict] = {}  # lowercase skill -> first skill entry (display name, category)
+    open_postings = 0
+    for (skills,) in db.query(BoardPosting.skills).filter(BoardPosting.closed_at.is_(None)).yield_per(1000):
+        open_postings += 1
+        keys = set()
+        for skill in skills or []:
+            if category and skill["category"] != category:
+                continue
+            key = skill["name"].lower()
+            keys.add(key)
+            first_seen.setdefault(key, skill)
+        counts.update(keys)
+
+    return {
+        "open_postings": open_postings,
+        "skills": [
+            {"name": first_seen[key]["name"], "category": first_seen[key]["category"], "postings": postings}
+            for key, postings in counts.most_common(limit)
+        ],
+    }
+
+
+class BoardSyncScheduler:
+    """
+    Periodically sync a fixed list of boards.
+
+    Boards are synced concurrently; the HostLimiter keeps requests to each
+    provider's API host polite. Reconciliation and analysis run on the
+    analysis lane's worker threads so they share CPU with API traffic
+    instead of competing with it.
+    """
+
+    def __init__(
+        self,
+        lane: AdmissionController,
+        boards: List[Tuple[str, str]],
+        interval: float = 3600.0,
+        host_concurrency: int = 1,
+        host_min_interval: float = 1.0,
+    ):
+        self.lane = lane
+        self.boards = boards
+        self.interval = interval
+        self.limiter = HostLimiter(host_concurrency, host_min_interval)
+
+        self.last_results: Dict[str, Dict] = {}  # "provider:board" -> outcome of the latest sync
+        self._task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def parse_boards(spec: str) -> List[Tuple[str, str]]:
+        """Parse "greenhouse:acme,lever:globex" into (provider, board) pairs"""
+        boards = []
+        for item in spec.split(","):
+            item = item.strip()
+            if not item:
+                continue
+            provider, _, board = item.partition(":")
+            provider = provider.strip().lower()
+            if provider not in PROVIDERS or not board.strip():
+                raise ValueError(f"Invalid board spec {item!r}; expected provider:board with provider in {PROVIDERS}")
+            boards.append((provider, board.strip()))
+        return boards
+
+    async def sync_board(self, provider: str, board: str) -> Dict:
+        """
+        Fetch one board and reconcile it with the tracked postings.
+
+        Returns:
+            Sync outcome with counts, duration and any error
+        """
+        started = time.perf_counter()
+        outcome = {"provider": provider, "board": board, "synced_at": datetime.utcnow()}
+        try:
+            async with httpx.AsyncClient(timeout=JobFetcher.TIMEOUT) as client:
+                postings = await FETCHERS[provider](client, self.limiter, board)
+            outcome.update(await self.lane.to_thread(apply_board_snapshot, provider, board, postings))
+            outcome["error"] = None
+        except (BoardSyncError, httpx.HTTPError, ValueError) as e:
+            outcome["error"] = str(e)
+        except Exception as e:
+            # e.g. a database error; reported like the others so one board cannot stop the scheduler
+            outcome["error"] = f"{type(e).__name__}: {e}"
+
+        outcome["duration_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        self.last_results[f"{provider}:{board}"] = outcome
+        return outcome
+
+    async def sync_all(self) -> List[Dict]:
+        """Sync every configured board once"""
+        return await asyncio.gather(*(self.sync_board(provider, board) for provider, board in self.boards))
+
+    def stats(self) -> Dict:
+        """Return the schedule and the latest outcome per board"""
+        return {
+            "boards": [f"{provider}:{board}" for provider, board in self.boards],
+            "interval": self.interval,
+            "running": self._task is not None and not self._task.done(),
+            "last_results": list(self.last_results.values()),
+        }
+
+    async def _run(self):
+        while True:
+            results = await asyncio.gather(
+                *(self.sync_board(provider, board) for provider, board in self.boards),
+                return_exceptions=True,
+            )
+            for (provider, board), outcome in zip(self.boards, results):
+                if isinstance(outcome, BaseException):
+                    print(f"[board-sync] {provider}:{board} failed: {type(outcome).__name__}: {outcome}")
+                elif outcome["error"]:
+                    print(f"[board-sync] {provider}:{board} failed: {outcome['error']}")
+                else:
+                    print(
+                        f"[board-sync] {provider}:{board} "
+                        f"+{outcome['added']} ~{outcome['changed']} -{outcome['removed']} "
+                        f"({outcome['reopened']} reopened, {outcome['unchanged']} unchanged) "
+                        f"in {outcome['duration_ms']}ms"
+                    )
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        """Start the periodic sync loop on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        """Cancel the periodic sync loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
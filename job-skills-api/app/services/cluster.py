@@ -0,0 +1,261 @@
+"""
+Cache-affine routing across analyzer nodes.
+Each request is owned by one node of a consistent hash ring (by content hash
+for analyses, by normalized URL for fetches) and forwarded there, so repeated
+postings hit the node whose caches and in-flight work already cover them.
+Requests for unreachable owners are processed locally instead.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import httpx
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.hash_ring import HashRing
+
+# Marks a request already forwarded once; the receiving node never forwards it again
+FORWARDED_HEADER = "X-Cluster-Forwarded"
+
+# Base URL of the node that produced a response
+NODE_HEADER = "X-Cluster-Node"
+
+# Shared secret (CLUSTER_SECRET) required for membership changes
+SECRET_HEADER = "X-Cluster-Secret"
+
+# Request headers passed through to the owning node
+FORWARD_HEADERS = ("content-type", "accept", "x-debug-timings")
+
+
+class NodeHeaderMiddleware:
+    """
+    Name the node that produced each response (forwarded ones keep their owner's name).
+
+    A plain ASGI middleware that only edits the response start message, so
+    streamed bodies pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, node_url: str):
+        self.app = app
+        self.node_url = node_url
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_tagged(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if NODE_HEADER not in headers:
+                    headers.append(NODE_HEADER, self.node_url)
+            await send(message)
+
+        await self.app(scope, receive, send_tagged)
+
+
+class ClusterRouter:
+    """
+    Forward requests to the node owning their key.
+
+    Membership starts from the configured node list and changes with
+    join()/leave(). Peers that fail a forward or a health check are marked
+    unhealthy; their keys are processed locally (not moved to another peer)
+    until a health check succeeds again, so a flapping node does not reshuffle
+    the other nodes' caches. A process that does not run the health checks
+    (pre-fork workers other than worker 0) retries a peer by forwarding to it
+    once `health_interval` has passed.
+    """
+
+    def __init__(
+        self,
+        self_url: str,
+        nodes: List[str],
+        replicas: int = 160,
+        forward_timeout: float = 30.0,
+        health_interval: float = 5.0,
+        enabled: bool = True,
+    ):
+        """
+        Args:
+            self_url: Base URL other nodes use to reach this node
+            nodes: Base URLs of every node, this one included
+            replicas: Virtual nodes per node on the hash ring
+            forward_timeout: Seconds to wait for a forwarded request
+            health_interval: Seconds between health checks of peers
+            enabled: Process everything locally when False
+        """
+        self.self_url = self_url.rstrip("/")
+        self.ring = HashRing([node.rstrip("/") for node in nodes], replicas=replicas)
+        if self.self_url:
+            self.ring.add(self.self_url)
+        self.forward_timeout = forward_timeout
+        self.health_interval = health_interval
+        self.enabled = enabled and bool(self.self_url)
+
+        self._unhealthy: Dict[str, float] = {}  # peer -> monotonic time it was marked
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.owned = 0  # requests this node owned
+        self.forwarded = 0  # requests sent to their owner
+        self.received = 0  # requests other nodes forwarded here
+        self.fallbacks = 0  # requests processed here because their owner was unhealthy
+
+    @staticmethod
+    def parse_nodes(spec: str) -> List[str]:
+        """Parse "http://10.0.0.1:8000,http://10.0.0.2:8000" into base URLs"""
+        return [node.strip().rstrip("/") for node in spec.split(",") if node.strip()]
+
+    def join(self, node: str) -> bool:
+        """Add a node; only keys it now owns move to it"""
+        node = node.rstrip("/")
+        self._unhealthy.pop(node, None)
+        return self.ring.add(node)
+
+    def leave(self, node: str) -> bool:
+        """Remove a node; only the keys it owned move, spread over the others"""
+        node = node.rstrip("/")
+        self._unhealthy.pop(node, None)
+        return self.ring.remove(node)
+
+    def owner(self, key: str) -> Optional[str]:
+        """
+        Peer a key should be forwarded to.
+
+        Returns:
+            The owning peer's base URL, or None to process locally (this node
+            owns the key, the owner is unhealthy or clustering is off)
+        """
+        if not self.enabled:
+            return None
+        node = self.ring.node_for(key)
+        if node is None or node == self.self_url:
+            self.owned += 1
+            return None
+        if node in self._unhealthy:
+            if self._task is not None or time.monotonic() - self._unhealthy[node] < self.health_interval:
+                self.fallbacks += 1
+                return None
+            del self._unhealthy[node]  # no health checks here; the next forward re-marks it if still down
+        return node
+
+    async def forward(self, request: Request, key: str) -> Optional[Response]:
+        """
+        Send a request to the node owning its key.
+
+        Args:
+            request: Incoming request; its body must already have been read
+            key: Routing key (content hash or normalized URL)
+
+        Returns:
+            The owner's response, or None when the request should be processed
+            locally (already forwarded once, owned here, or owner unreachable)
+        """
+        if not self.enabled:
+            return None
+        if request.headers.get(FORWARDED_HEADER):
+            self.received += 1
+            return None
+
+        node = self.owner(key)
+        if node is None:
+            return None
+
+        headers = {name: request.headers[name] for name in FORWARD_HEADERS if name in request.headers}
+        headers[FORWARDED_HEADER] = self.self_url
+        url = node + request.url.path + (f"?{request.url.query}" if request.url.query else "")
+        try:
+            response = await self._http().post(url, content=await request.body(), headers=headers)
+        except httpx.TransportError as e:
+            # Connection refused, timed out, reset: stop routing to the peer until it looks healthy
+            print(f"[cluster] forwarding to {node} failed ({type(e).__name__}); processing locally")
+            self._mark_unhealthy(node)
+            self.fallbacks += 1
+            return None
+
+        self.forwarded += 1
+        passthrough = {NODE_HEADER: response.headers.get(NODE_HEADER, node)}
+        if "retry-after" in response.headers:
+            passthrough["Retry-After"] = response.headers["retry-after"]
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            media_type=response.headers.get("content-type"),
+            headers=passthrough,
+        )
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.forward_timeout)
+        return self._client
+
+    def _mark_unhealthy(self, node: str):
+        self._unhealthy.setdefault(node, time.monotonic())
+
+    async def check_health(self):
+        """Probe every peer's /health once and update its status"""
+        peers = [node for node in self.ring.nodes if node != self.self_url]
+
+        async def probe(node: str) -> bool:
+            response = await self._http().get(f"{node}/health", timeout=min(self.health_interval, 2.0))
+            return response.status_code == 200
+
+        # Any probe error (unreachable peer, malformed URL) counts as a failed check
+        results = await asyncio.gather(*(probe(node) for node in peers), return_exceptions=True)
+        for node, result in zip(peers, results):
+            if result is True:
+                if self._unhealthy.pop(node, None) is not None:
+                    print(f"[cluster] {node} is healthy again")
+            elif node not in self._unhealthy:
+                reason = f" ({type(result).__name__})" if isinstance(result, BaseException) else ""
+                print(f"[cluster] {node} failed its health check{reason}; processing its keys locally")
+                self._mark_unhealthy(node)
+
+    async def _run(self):
+        while True:
+            await self.check_health()
+            await asyncio.sleep(self.health_interval)
+
+    def start(self):
+        """Start periodic health checks on the running event loop"""
+        if self.enabled and (self._task is None or self._task.done()):
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        """Cancel health checks and close forwarding connections"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> Dict:
+        """Return membership, peer health and routing counters"""
+        now = time.monotonic()
+        return {
+            "enabled": self.enabled,
+            "self": self.self_url,
+            "nodes": [
+                {
+                    "url": node,
+                    "self": node == self.self_url,
+                    "healthy": node not in self._unhealthy,
+                    "unhealthy_for": round(now - self._unhealthy[node], 1) if node in self._unhealthy else None,
+                }
+                for node in self.ring.nodes
+            ],
+            "owned": self.owned,
+            "forwarded": self.forwarded,
+            "received": self.received,
+            "fallbacks": self.fallbacks,
+        }
@@ -0,0 +1,68 @@
+"""
+Archive of processed spaCy Docs.
+Keeps the tokens and entities of every stored posting in compact DocBin form,
+so skills can be re-extracted after a taxonomy or rule change without running
+the spaCy pipeline again.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from spacy.tokens import DocBin
+
+# Enough to rebuild what extraction reads: token text and spacing (which give
+# the lexeme attributes the matcher and fuzzy tier use) and entity spans
+DOC_ATTRS = ["ORTH", "SPACY", "ENT_IOB", "ENT_TYPE"]
+
+# Serialized Docs waiting for their posting to be stored; older ones are dropped
+PENDING_LIMIT = 2000
+
+
+def serialize_docs(docs: List) -> bytes:
+    """Serialize the Docs extracted for one posting (one per section or the whole text)"""
+    doc_bin = DocBin(attrs=DOC_ATTRS)
+    for doc in docs:
+        doc_bin.add(doc)
+    return doc_bin.to_bytes()
+
+
+def deserialize_docs(data: bytes, vocab) -> List:
+    """Restore a posting's Docs against a vocabulary (the model's, for lexeme attributes and vectors)"""
+    return list(DocBin().from_bytes(data).get_docs(vocab))
+
+
+class PendingDocs:
+    """
+    Hand-off of serialized Docs from extraction to storage.
+
+    Analyses are stored after the response is sent (or by the board sync),
+    by code that only sees the analysis results. Extraction leaves each
+    posting's Docs here under its content hash and storage takes them out.
+    Docs of postings that are never stored age out of the bounded buffer.
+    """
+
+    def __init__(self, max_entries: int = PENDING_LIMIT):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def stash(self, content_hash: str, data: bytes):
+        """Keep a posting's serialized Docs until it is stored"""
+        with self._lock:
+            self._entries[content_hash] = data
+            self._entries.move_to_end(content_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def take(self, content_hash: str) -> Optional[bytes]:
+        """Remove and return a posting's serialized Docs, if extraction left any"""
+        with self._lock:
+            return self._entries.pop(content_hash, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by NLPService (producer) and job_store (consumer) within a process
+pending_docs = PendingDocs()
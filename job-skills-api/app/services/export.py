@@ -0,0 +1,280 @@
+"""
+Streaming tabular export of analyses.
+Turns analyses into per-job skill rows or aggregated skill statistics and
+encodes them chunk by chunk as CSV, Arrow IPC or Parquet, so exports of any
+size are written in constant memory.
+"""
+
+import csv
+import io
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Arrow IPC and Parquet need pyarrow; CSV does not
+    pa = None
+    pq = None
+
+# Rows encoded per chunk (one Arrow record batch / Parquet row group)
+DEFAULT_CHUNK_ROWS = 10000
+
+FORMATS = ("csv", "arrow", "parquet")
+TABLES = ("skills", "aggregates")
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+FILE_EXTENSIONS = {"csv": "csv", "arrow": "arrows", "parquet": "parquet"}
+
+# Column name -> Arrow type name, per table
+COLUMNS = {
+    "skills": [
+        ("job_id", "int64"),
+        ("title", "string"),
+        ("analyzed_at", "timestamp"),
+        ("name", "string"),
+        ("category", "string"),
+        ("count", "int32"),
+        ("confidence", "float32"),
+    ],
+    "aggregates": [
+        ("name", "string"),
+        ("category", "string"),
+        ("total_count", "int64"),
+        ("appeared_in_jobs", "int64"),
+        ("percentage", "float64"),
+    ],
+}
+
+# (job id, title, analyzed_at, skills)
+JobRecord = Tuple[int, Optional[str], Optional[datetime], List[Dict]]
+
+
+class ExportUnavailable(Exception):
+    """Raised when an export format needs a library that is not installed"""
+    pass
+
+
+def skill_rows(jobs: Iterable[JobRecord]) -> Iterator[tuple]:
+    """
+    Flatten analyses into one row per (job, skill).
+
+    Args:
+        jobs: (job id, title, analyzed_at, skills) per job
+
+    Yields:
+        Rows in COLUMNS["skills"] order
+    """
+    for job_id, title, analyzed_at, skills in jobs:
+        for skill in skills:
+            yield (job_id, title, analyzed_at, skill["name"], skill["category"], skill["count"], skill["confidence"])
+
+
+class SkillAggregator:
+    """
+    Running per-skill totals over a stream of analyses.
+
+    Matches the aggregated_skills of a /batch response; memory grows with
+    the number of distinct skills, not with the number of jobs.
+    """
+
+    def __init__(self):
+        self.total_jobs = 0
+        self._skills: Dict[str, list] = {}  # name -> [category, total_count, appeared_in_jobs]
+
+    def add(self, skills: List[Dict]):
+        """Count one job's skills"""
+        self.total_jobs += 1
+        seen = set()
+        for skill in skills:
+            entry = self._skills.setdefault(skill["name"], [skill["category"], 0, 0])
+            entry[1] += skill["count"]
+            if skill["name"] not in seen:
+                seen.add(skill["name"])
+                entry[2] += 1
+
+    def consume(self, jobs: Iterable[JobRecord]) -> "SkillAggregator":
+        """Count every job of a stream"""
+        for _, _, _, skills in jobs:
+            self.add(skills)
+        return self
+
+    def rows(self) -> Iterator[tuple]:
+        """Rows in COLUMNS["aggregates"] order, most mentioned skill first"""
+        ranked = sorted(self._skills.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (category, total_count, appeared_in_jobs) in ranked:
+            percentage = round(appeared_in_jobs / self.total_jobs * 100, 1) if self.total_jobs else 0.0
+            yield (name, category, total_count, appeared_in_jobs, percentage)
+
+
+def _chunks(rows: Iterable[tuple], size: int) -> Iterator[List[tuple]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to the generator"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def _arrow_schema(table: str):
+    types = {
+        "int32": pa.int32(),
+        "int64": pa.int64(),
+        "float32": pa.float32(),
+        "float64": pa.float64(),
+        "string": pa.string(),
+        "timestamp": pa.timestamp("us"),
+    }
+    return pa.schema([(name, types[type_name]) for name, type_name in COLUMNS[table]])
+
+
+def _record_batch(schema, chunk: List[tuple]):
+    columns = list(zip(*chunk))
+    return pa.RecordBatch.from_arrays(
+        [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+def _write_csv(rows: Iterable[tuple], columns: Sequence[str], chunk_rows: int) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for chunk in _chunks(rows, chunk_rows):
+        writer.writerows(
+            tuple(value.isoformat() if isinstance(value, datetime) else value for value in row)
+            for row in chunk
+        )
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _write_arrow(rows: Iterable[tuple], table: str, chunk_rows: int) -> Iterator[bytes]:
+    schema = _arrow_schema(table)
+    sink = _ChunkSink()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for chunk in _chunks(rows, chunk_rows):
+            writer.write_batch(_record_batch(schema, chunk))
+            yield sink.drain()
+    yield sink.drain()  # end-of-stream marker (or the schema alone for an empty export)
+
+
+def _write_parquet(rows: Iterable[tuple], table: str, chunk_rows: int) -> Iterator[bytes]:
+    schema = _arrow_schema(table)
+    sink = _ChunkSink()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for chunk in _chunks(rows, chunk_rows):
+            writer.write_batch(_record_batch(schema, chunk))  # one row group per chunk
+            yield sink.drain()
+    yield sink.drain()  # footer
+
+
+def check_format(fmt: str):
+    """
+    Validate an export format before streaming starts.
+
+    Raises:
+        ValueError: If the format is unknown
+        ExportUnavailable: If the format needs pyarrow and it is not installed
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    if fmt != "csv" and pa is None:
+        raise ExportUnavailable(f"The {fmt} export format requires pyarrow (pip install pyarrow)")
+
+
+def encode_rows(rows: Iterable[tuple], table: str, fmt: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[bytes]:
+    """
+    Encode rows of an export table as a stream of byte chunks.
+
+    Args:
+        rows: Rows in COLUMNS[table] order (any iterable; consumed lazily)
+        table: "skills" or "aggregates"
+        fmt: "csv", "arrow" (Arrow IPC stream) or "parquet"
+        chunk_rows: Rows buffered per chunk
+
+    Yields:
+        Encoded chunks; concatenated they form one complete file
+    """
+    check_format(fmt)
+    if fmt == "csv":
+        return _write_csv(rows, [name for name, _ in COLUMNS[table]], chunk_rows)
+    if fmt == "arrow":
+        return _write_arrow(rows, table, chunk_rows)
+    return _write_parquet(rows, table, chunk_rows)
+
+
+def export_jobs(
+    jobs: Iterable[JobRecord],
+    table: str = "skills",
+    fmt: str = "csv",
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    """
+    Export a stream of analyses as per-job skill rows or aggregated statistics.
+
+    Args:
+        jobs: (job id, title, analyzed_at, skills) per job, consumed lazily
+        table: "skills" for one row per (job, skill), "aggregates" for one row per skill
+        fmt: "csv", "arrow" or "parquet"
+        chunk_rows: Rows buffered per chunk
+
+    Yields:
+        Encoded chunks of the export file
+
+    Example:
+        with open("skills.parquet", "wb") as f:
+            for chunk in export_jobs(jobs, "skills", "parquet"):
+                f.write(chunk)
+    """
+    if table not in TABLES:
+        raise ValueError(f"Unknown export table {table!r}; expected one of {', '.join(TABLES)}")
+    check_format(fmt)
+
+    if table == "skills":
+        return encode_rows(skill_rows(jobs), table, fmt, chunk_rows)
+
+    def aggregate_rows():
+        # Aggregates are only known once every job is counted
+        yield from SkillAggregator().consume(jobs).rows()
+
+    return encode_rows(aggregate_rows(), table, fmt, chunk_rows)
+
+
+def export_filename(table: str, fmt: str) -> str:
+    """Download filename for an export"""
+    return f"{table}-{datetime.utcnow():%Y%m%dT%H%M%S}.{FILE_EXTENSIONS[fmt]}"
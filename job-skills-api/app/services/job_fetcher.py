@@ -4,8 +4,76 @@ Service for fetching job descriptions from job board URLs.
 
 import httpx
 from bs4 import BeautifulSoup
+from functools import lru_cache
 from typing import Dict, Optional
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+from app.config import settings
+from app.core.singleflight import AsyncSingleFlight
+from app.services.section_segmenter import segment_html
+
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {"gh_src", "lever-source", "lever-origin"}
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a job URL so equivalent links share a coalescing key.
+
+    Lowercases scheme and host, drops default ports, fragments, tracking
+    parameters and trailing slashes, and sorts the remaining query string.
+    """
+    try:
+        parsed = urlparse(url.strip())
+        scheme = parsed.scheme.lower()
+        hostname = (parsed.hostname or "").lower()
+        port = parsed.port
+    except ValueError:
+        return url
+
+    netloc = hostname
+    if port and DEFAULT_PORTS.get(scheme) != port:
+        netloc = f"{hostname}:{port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    )
+    path = parsed.path.rstrip("/") or "/"
+
+    return urlunparse((scheme, netloc, path, parsed.params, urlencode(query), ""))
+
+
+@lru_cache(maxsize=4)
+def _parse_host_overrides(spec: str) -> Dict[str, str]:
+    overrides = {}
+    for item in spec.split(","):
+        host, _, base_url = item.partition("=")
+        if host.strip() and base_url.strip():
+            overrides[host.strip().lower()] = base_url.strip().rstrip("/")
+    return overrides
+
+
+def apply_host_override(url: str) -> str:
+    """
+    Redirect a job URL to a stand-in server configured in FETCH_HOST_OVERRIDES.
+
+    "https://boards.greenhouse.io/acme/jobs/1" with the override
+    "boards.greenhouse.io=http://127.0.0.1:8090/greenhouse" is fetched from
+    "http://127.0.0.1:8090/greenhouse/acme/jobs/1". The board-specific parser
+    is still chosen from the original host.
+    """
+    if not settings.FETCH_HOST_OVERRIDES:
+        return url
+    parsed = urlparse(url)
+    base_url = _parse_host_overrides(settings.FETCH_HOST_OVERRIDES).get((parsed.hostname or "").lower())
+    if base_url is None:
+        return url
+    return base_url + urlunparse(("", "", parsed.path, parsed.params, parsed.query, ""))
 
 
 class JobFetchError(Exception):
@@ -18,20 +86,37 @@ class JobFetcher:
 
     TIMEOUT = 10.0  # seconds
 
+    # Concurrent fetches of the same normalized URL share one request
+    _inflight = AsyncSingleFlight()
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        """Return request coalescing metrics"""
+        return JobFetcher._inflight.stats()
+
     @staticmethod
     async def fetch_job(url: str) -> Dict[str, str]:
         """
         Fetch job title and description from a job board URL.
 
+        Concurrent requests for the same normalized URL are coalesced into a
+        single fetch; every caller receives the same result or error.
+
         Args:
             url: URL to the job posting
 
         Returns:
-            Dictionary with 'title' and 'description' keys
+            Dictionary with 'title', 'description' and 'sections' keys
+            (typed regions of the description, split at its headings)
 
         Raises:
             JobFetchError: If fetching fails or URL is invalid
         """
+        return await JobFetcher._inflight.do(normalize_url(url), JobFetcher._fetch_job, url)
+
+    @staticmethod
+    async def _fetch_job(url: str) -> Dict[str, str]:
+        """Fetch a job posting without coalescing"""
         try:
             # Validate URL
             parsed = urlparse(url)
@@ -40,16 +125,17 @@ class JobFetcher:
 
             # Determine job board and fetch accordingly
             hostname = parsed.netloc.lower()
+            fetch_url = apply_host_override(url)
 
             if 'greenhouse.io' in hostname:
-                return await JobFetcher._fetch_greenhouse(url)
+                return await JobFetcher._fetch_greenhouse(fetch_url)
             elif 'lever.co' in hostname:
-                return await JobFetcher._fetch_lever(url)
+                return await JobFetcher._fetch_lever(fetch_url)
             elif 'linkedin.com' in hostname:
-                return await JobFetcher._fetch_linkedin(url)
+                return await JobFetcher._fetch_linkedin(fetch_url)
             else:
                 # Generic fallback
-                return await JobFetcher._fetch_generic(url)
+                return await JobFetcher._fetch_generic(fetch_url)
 
         except httpx.RequestError as e:
             raise JobFetchError(f"Network error: {str(e)}")
@@ -77,6 +163,7 @@ class JobFetcher:
 
             # Extract description - try multiple selectors
             description = ""
+            sections = []
             content_div = soup.find('div', class_='job__description')
             if not content_div:
                 content_div = soup.find('div', id='content')
@@ -90,13 +177,15 @@ class JobFetcher:
 
                 # Get all text content
                 description = content_div.get_text(separator='\n', strip=True)
+                sections = segment_html(content_div)
 
             if not description:
                 raise JobFetchError("Could not extract job description from Greenhouse page")
 
             return {
                 'title': title or 'Job Opening',
-                'description': description
+                'description': description,
+                'sections': sections,
             }
 
     @staticmethod
@@ -118,6 +207,7 @@ class JobFetcher:
 
             # Extract description
             description = ""
+            sections = []
             content_div = soup.find('div', class_='content')
             if not content_div:
                 content_div = soup.find('div', attrs={'data-qa': 'job-description'})
@@ -128,13 +218,15 @@ class JobFetcher:
                     unwanted.decompose()
 
                 description = content_div.get_text(separator='\n', strip=True)
+                sections = segment_html(content_div)
 
             if not description:
                 raise JobFetchError("Could not extract job description from Lever page")
 
             return {
                 'title': title or 'Job Opening',
-                'description': description
+                'description': description,
+                'sections': sections,
             }
 
     @staticmethod
@@ -162,13 +254,15 @@ class JobFetcher:
                 desc_div = soup.find('article')
 
             description = desc_div.get_text(separator='\n', strip=True) if desc_div else ""
+            sections = segment_html(desc_div) if desc_div else []
 
             if not description:
                 raise JobFetchError("Could not extract job description from LinkedIn (authentication may be required)")
 
             return {
                 'title': title,
-                'description': description
+                'description': description,
+                'sections': sections,
             }
 
     @staticmethod
@@ -195,6 +289,7 @@ class JobFetcher:
 
             # Try to find main content
             description = ""
+            sections = []
             for selector in ['main', 'article', 'div[role="main"]', 'body']:
                 content = soup.select_one(selector)
                 if content:
@@ -203,6 +298,7 @@ class JobFetcher:
                         unwanted.decompose()
 
                     description = content.get_text(separator='\n', strip=True)
+                    sections = segment_html(content)
                     if description and len(description) > 100:
                         break
 
@@ -211,5 +307,6 @@ class JobFetcher:
 
             return {
                 'title': title or 'Job Opening',
-                'description': description
+                'description': description,
+                'sections': sections,
             }
@@ -0,0 +1,213 @@
+"""
+Persistence of analyzed postings.
+Stores each distinct posting once so indexes over stored jobs can catch up
+from the database.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.jobs import AnalyzedJob, ArchivedDoc
+from app.services.doc_archive import pending_docs
+from app.services.nlp_service import NLPService
+
+# Rows per INSERT statement; keeps SQLite under its bound-parameter limit
+INSERT_CHUNK_SIZE = 100
+
+# Rows fetched per round trip when streaming stored postings
+READ_CHUNK_SIZE = 1000
+
+
+def save_analyses(
+    db: Session,
+    job_descriptions: List[str],
+    titles: List[Optional[str]],
+    analyses: List[Dict],
+    analyzed_at: datetime,
+) -> int:
+    """
+    Insert analyzed postings (without committing), ignoring ones already stored.
+
+    Near-duplicate postings (those carrying "duplicate_of") are skipped, like
+    in the trend rollups. Postings whose Docs extraction archived also get an
+    archived_docs row.
+
+    Args:
+        db: Database session
+        job_descriptions: Posting texts, used for the content hash
+        titles: Posting titles, aligned with job_descriptions
+        analyses: Analysis dictionaries as returned by NLPService
+        analyzed_at: When the postings were analyzed
+
+    Returns:
+        Number of rows submitted for insertion
+    """
+    rows = analysis_rows(job_descriptions, titles, analyses, analyzed_at)
+    if not rows:
+        return 0
+
+    _insert_ignoring_conflicts(db, AnalyzedJob, rows, "content_hash")
+    archived = archived_doc_rows(rows, analyzed_at)
+    if archived:
+        _insert_ignoring_conflicts(db, ArchivedDoc, archived, "content_hash")
+
+    return len(rows)
+
+
+def analysis_rows(
+    job_descriptions: List[str],
+    titles: List[Optional[str]],
+    analyses: List[Dict],
+    analyzed_at: datetime,
+) -> List[Dict]:
+    """analyzed_jobs rows for distinct, non-duplicate postings"""
+    rows, seen = [], set()
+    for text, title, analysis in zip(job_descriptions, titles, analyses):
+        if "duplicate_of" in analysis:
+            continue
+        content_hash = NLPService.content_key(text)
+        if content_hash in seen:
+            continue
+        seen.add(content_hash)
+        rows.append({
+            "content_hash": content_hash,
+            "title": title,
+            "analyzed_at": analyzed_at,
+            "total_skills_found": analysis["total_skills_found"],
+            "skills": analysis["skills"],
+            "minhash": NLPService().signature_bytes(text) if settings.NEAR_DUPLICATE_DETECTION_ENABLED else None,
+        })
+    return rows
+
+
+def archived_doc_rows(rows: List[Dict], analyzed_at: datetime) -> List[Dict]:
+    """archived_docs rows for the postings whose Docs extraction archived (DOC_ARCHIVE_ENABLED)"""
+    archived = []
+    for row in rows:
+        docs = pending_docs.take(row["content_hash"])
+        if docs is not None:
+            archived.append({"content_hash": row["content_hash"], "docs": docs, "archived_at": analyzed_at})
+    return archived
+
+
+def stored_content_hashes(db: Session, content_hashes: List[str]) -> Set[str]:
+    """The given content hashes that already have an analyzed_jobs row (none without JOB_INDEX_ENABLED)"""
+    if not settings.JOB_INDEX_ENABLED:
+        return set()
+    content_hashes = sorted(set(content_hashes))
+    stored = set()
+    for offset in range(0, len(content_hashes), INSERT_CHUNK_SIZE):
+        chunk = content_hashes[offset:offset + INSERT_CHUNK_SIZE]
+        stored.update(
+            row.content_hash
+            for row in db.query(AnalyzedJob.content_hash).filter(AnalyzedJob.content_hash.in_(chunk))
+        )
+    return stored
+
+
+def recent_signatures(db: Session, limit: int) -> List[Tuple[str, bytes, List[Dict]]]:
+    """
+    Near-duplicate signatures of the most recently stored postings.
+
+    Args:
+        db: Database session
+        limit: Most postings to return
+
+    Returns:
+        (content hash, signature bytes, skills) per posting, oldest first
+    """
+    rows = (
+        db.query(AnalyzedJob.content_hash, AnalyzedJob.minhash, AnalyzedJob.skills)
+        .filter(AnalyzedJob.minhash.isnot(None))
+        .order_by(AnalyzedJob.id.desc())
+        .limit(limit)
+        .all()
+    )
+    return [tuple(row) for row in reversed(rows)]
+
+
+def _insert_ignoring_conflicts(db: Session, model, rows: List[Dict], key_column: str):
+    """Insert rows in chunks, skipping ones whose key already exists"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        insert = None
+
+    key = getattr(model, key_column)
+    for offset in range(0, len(rows), INSERT_CHUNK_SIZE):
+        chunk = rows[offset:offset + INSERT_CHUNK_SIZE]
+
+        if insert is None:
+            # Portable fallback: one lookup per row
+            for row in chunk:
+                if db.query(key).filter(key == row[key_column]).first() is None:
+                    db.add(model(**row))
+            continue
+
+        stmt = insert(model.__table__).values(chunk)
+        db.execute(stmt.on_conflict_do_nothing(index_elements=[key_column]))
+
+
+def store_analyses(
+    job_descriptions: List[str],
+    titles: List[Optional[str]],
+    analyses: List[Dict],
+    analyzed_at: Optional[datetime] = None,
+):
+    """Store analyzed postings in a session of their own (for background tasks)"""
+    db = SessionLocal()
+    try:
+        save_analyses(db, job_descriptions, titles, analyses, analyzed_at or datetime.utcnow())
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def iter_stored_jobs(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    chunk_size: int = READ_CHUNK_SIZE,
+) -> Iterator[Tuple[int, Optional[str], datetime, List[Dict]]]:
+    """
+    Stream stored postings in id order, a chunk of rows at a time.
+
+    Uses a session of its own and keyset pagination on id, so memory stays
+    constant however many rows are read and no cursor is held open between
+    chunks.
+
+    Args:
+        since: Only postings analyzed at or after this time
+        until: Only postings analyzed before this time
+        chunk_size: Rows fetched per query
+
+    Yields:
+        (id, title, analyzed_at, skills) per posting
+    """
+    db = SessionLocal()
+    try:
+        last_id = 0
+        while True:
+            query = db.query(AnalyzedJob.id, AnalyzedJob.title, AnalyzedJob.analyzed_at, AnalyzedJob.skills)
+            if since is not None:
+                query = query.filter(AnalyzedJob.analyzed_at >= since)
+            if until is not None:
+                query = query.filter(AnalyzedJob.analyzed_at < until)
+            rows = query.filter(AnalyzedJob.id > last_id).order_by(AnalyzedJob.id).limit(chunk_size).all()
+
+            for row in rows:
+                yield tuple(row)
+            if len(rows) < chunk_size:
+                return
+            last_id = rows[-1].id
+    finally:
+        db.close()
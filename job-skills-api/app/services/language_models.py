@@ -0,0 +1,208 @@
+"""
+Language detection and per-language spaCy pipelines.
+Postings are routed to a pipeline for their language; pipelines other than
+the default one are loaded on first use and kept in an LRU bounded by count
+and by the memory they added when loaded.
+"""
+
+import gc
+import importlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import spacy
+
+from app.core.memory import format_megabytes, read_memory_usage
+
+DEFAULT_LANGUAGE = "en"
+
+# Words sampled from the start of a posting for detection
+DETECTION_SAMPLE_WORDS = 200
+
+# Fewer stopword hits than this and the posting is assumed to be in the default language
+DETECTION_MIN_HITS = 3
+
+_WORD_RE = re.compile(r"[^\W\d_]+")  # runs of letters, in any script
+
+
+def parse_language_models(spec: str) -> Dict[str, str]:
+    """Parse "de:de_core_news_lg,fr:fr_core_news_lg" into {language: model}"""
+    models = {}
+    for item in spec.split(","):
+        language, _, model = item.partition(":")
+        if language.strip() and model.strip():
+            models[language.strip().lower()] = model.strip()
+    return models
+
+
+class LanguageDetector:
+    """
+    Guess a posting's language from its stopwords.
+
+    Each language is scored by how many of the first words of the text are
+    stopwords of that language only (spaCy's stopword lists, minus words
+    several languages share). This needs no model and costs one regex scan
+    over a few hundred words.
+    """
+
+    def __init__(self, languages: List[str], default: str = DEFAULT_LANGUAGE):
+        """
+        Args:
+            languages: Language codes to tell apart (spaCy language packages)
+            default: Language assumed when the evidence is too thin
+        """
+        self.default = default
+        codes = list(dict.fromkeys([default, *languages]))
+        stop_words = {
+            code: importlib.import_module(f"spacy.lang.{code}.stop_words").STOP_WORDS
+            for code in codes
+        }
+        self._stop_words = {
+            code: frozenset(
+                word for word in words
+                if not any(word in others for other, others in stop_words.items() if other != code)
+            )
+            for code, words in stop_words.items()
+        }
+        self.detections: Dict[str, int] = {code: 0 for code in codes}
+
+    def detect(self, text: str) -> str:
+        """Return the language code of a text (the default when unsure)"""
+        scores = dict.fromkeys(self._stop_words, 0)
+        for n, match in enumerate(_WORD_RE.finditer(text)):
+            if n == DETECTION_SAMPLE_WORDS:
+                break
+            word = match.group().lower()
+            for code, words in self._stop_words.items():
+                if word in words:
+                    scores[code] += 1
+
+        best = max(scores, key=scores.get)
+        if scores[best] < DETECTION_MIN_HITS or scores[best] <= scores[self.default]:
+            best = self.default
+        self.detections[best] += 1
+        return best
+
+
+class LanguagePipelines:
+    """
+    Lazily loaded spaCy pipelines per language, LRU-bounded.
+
+    The default pipeline is always resident. Other configured pipelines are
+    loaded on first use; the resident set size growth while loading is
+    recorded as the pipeline's footprint, and least recently used pipelines
+    are dropped once more than `max_loaded` are resident or their footprints
+    exceed `max_memory_mb`. Languages without a configured model use the
+    default pipeline.
+    """
+
+    def __init__(
+        self,
+        default_language: str,
+        default_model: str,
+        default_nlp,
+        models: Dict[str, str],
+        max_loaded: int = 2,
+        max_memory_mb: float = 2048.0,
+        on_load: Optional[Callable] = None,
+        loader: Callable = spacy.load,
+    ):
+        """
+        Args:
+            default_language: Language of the always-resident pipeline
+            default_model: Model name of the default pipeline
+            default_nlp: The default pipeline, already loaded
+            models: Language code -> spaCy model name for the other languages
+            max_loaded: Non-default pipelines kept resident at once
+            max_memory_mb: Memory budget for the non-default pipelines
+            on_load: Called with each newly loaded pipeline (e.g. to add its
+                tokenization of the skill patterns to a shared matcher)
+            loader: Function loading a model by name
+        """
+        self.default_language = default_language
+        self.default_model = default_model
+        self.default_nlp = default_nlp
+        self.models = {language: model for language, model in models.items() if language != default_language}
+        self.max_loaded = max_loaded
+        self.max_memory = max_memory_mb * 1024 * 1024
+        self.on_load = on_load
+        self.loader = loader
+
+        self._loaded: "OrderedDict[str, Tuple]" = OrderedDict()  # language -> (nlp, footprint bytes)
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    @property
+    def languages(self) -> List[str]:
+        """Languages with a pipeline of their own, the default one first"""
+        return [self.default_language, *self.models]
+
+    def model_name(self, language: Optional[str]) -> str:
+        """Model used for a language"""
+        return self.models.get(language, self.default_model)
+
+    def get(self, language: Optional[str]):
+        """
+        Pipeline for a language, loading it if needed.
+
+        Returns:
+            The spaCy Language object
+        """
+        model = self.models.get(language)
+        if model is None:
+            return self.default_nlp
+
+        with self._lock:
+            entry = self._loaded.get(language)
+            if entry is not None:
+                self._loaded.move_to_end(language)
+                return entry[0]
+
+            # Loads are rare and slow; holding the lock keeps two requests from loading one model twice
+            before = read_memory_usage()
+            print(f"Loading spaCy model {model} for '{language}'...")
+            nlp = self.loader(model)
+            after = read_memory_usage()
+            footprint = max(after["rss"] - before["rss"], 0) if before and after else 0
+            if self.on_load is not None:
+                self.on_load(nlp)
+
+            self._loaded[language] = (nlp, footprint)
+            self.loads += 1
+            print(f"Loaded {model} ({format_megabytes(footprint)})")
+            self._evict(keep=language)
+            return nlp
+
+    def _evict(self, keep: str):
+        evicted = False
+        while len(self._loaded) > 1 and (
+            len(self._loaded) > self.max_loaded
+            or sum(footprint for _, footprint in self._loaded.values()) > self.max_memory
+        ):
+            language = next(iter(self._loaded))
+            if language == keep:
+                break
+            del self._loaded[language]
+            self.evictions += 1
+            evicted = True
+            print(f"Unloaded spaCy model {self.models[language]} for '{language}'")
+        if evicted:
+            gc.collect()  # pipelines hold reference cycles; return their memory now
+
+    def stats(self) -> Dict:
+        """Return resident pipelines and load/eviction counters"""
+        with self._lock:
+            resident = [
+                {"language": language, "model": self.models[language], "memory_mb": round(footprint / 2 ** 20, 1)}
+                for language, (_, footprint) in self._loaded.items()
+            ]
+        return {
+            "default": {"language": self.default_language, "model": self.default_model},
+            "configured": dict(self.models),
+            "resident": resident,
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,185 @@
+"""
+Dynamic micro-batching for single-job analysis requests.
+Concurrent /analyze calls are grouped into one spaCy batch and the results
+are fanned back out to each waiting request.
+"""
+
+import asyncio
+import math
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from app.core.admission import AdmissionController, AdmissionRejected
+from app.core.singleflight import AsyncSingleFlight
+
+
+class MicroBatcher:
+    """
+    Collect single-job requests into batches for `NLPService.analyze_job_descriptions`.
+
+    When no batch is running, a request is dispatched immediately, so light
+    traffic sees no added latency. While batches are running, new requests
+    linger until the batch reaches a target size: the number of arrivals
+    expected while one batch runs, spread over the lane's workers, so
+    batches grow with the arrival rate up to `max_batch_size`. The wait for
+    the missing requests is sized from the recent arrival rate and capped at
+    `max_wait`.
+
+    Each dispatched batch takes one admission slot of the lane, so a batch
+    is not limited by the number of slots. Queued requests are bounded by
+    `max_queue` instead; identical requests queued or running at the same
+    time share one analysis.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[str], List[Optional[str]]], List[Dict]],
+        lane: AdmissionController,
+        max_batch_size: int = 16,
+        max_wait: float = 0.01,
+        max_queue: int = 64,
+        key: Callable[[str], Hashable] = hash,
+    ):
+        """
+        Args:
+            process_batch: Analyzes a list of texts (with their sources) in one call
+            lane: Admission lane batches are run in, one slot per batch
+            max_batch_size: Most requests per batch
+            max_wait: Longest a request lingers for its batch to fill, seconds
+            max_queue: Most requests waiting for a batch; more are rejected
+            key: Identity of a text for coalescing (e.g. its content hash)
+        """
+        self.process_batch = process_batch
+        self.lane = lane
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.key = key
+        self._inflight = AsyncSingleFlight()
+
+        self._pending: List[Tuple[str, Optional[str], asyncio.Future]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._running = 0
+        self._last_arrival = 0.0
+        self._avg_interarrival = max_wait  # exponentially weighted, seconds
+        self._avg_batch_time = 0.0  # exponentially weighted, seconds
+
+        self.batches = 0
+        self.requests = 0
+        self.rejected_queue_full = 0
+
+    async def submit(self, job_description: str, source: Optional[str] = None) -> Dict:
+        """
+        Queue one job description and wait for its analysis.
+
+        Args:
+            job_description: The job description text
+            source: Posting URL or domain, passed through to process_batch
+
+        Returns:
+            Analysis dictionary, shared with identical requests in flight
+
+        Raises:
+            AdmissionRejected: If the queue is full, or the batch is not admitted to the lane
+        """
+        return await self._inflight.do(self.key(job_description), self._enqueue, job_description, source)
+
+    async def _enqueue(self, job_description: str, source: Optional[str]) -> Dict:
+        if len(self._pending) >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected(f"{self.lane.name} batch queue is full", self.lane.retry_after())
+
+        now = time.monotonic()
+        if self._last_arrival:
+            self._avg_interarrival = 0.8 * self._avg_interarrival + 0.2 * (now - self._last_arrival)
+        self._last_arrival = now
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((job_description, source, future))
+        self.requests += 1
+
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._collector is None or self._collector.done():
+            self._collector = asyncio.ensure_future(self._collect())
+
+        return await future
+
+    def _target_size(self) -> int:
+        """Batch size that keeps up with the arrival rate given the recent batch run time"""
+        if not self._avg_batch_time or not self._avg_interarrival:
+            return self.max_batch_size if self._running else 1
+        expected = self._avg_batch_time / self._avg_interarrival / max(self.lane.max_concurrent, 1)
+        return max(1, min(self.max_batch_size, math.ceil(expected)))
+
+    def _window(self) -> float:
+        """Time to wait for more requests before dispatching a partial batch"""
+        missing = max(self._target_size() - len(self._pending), 0)
+        return min(self.max_wait, missing * self._avg_interarrival)
+
+    async def _collect(self):
+        while self._pending:
+            if self._running >= self.lane.max_concurrent:
+                # Every worker is busy; requests keep accumulating meanwhile
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            target = self._target_size()
+            if self._running > 0 and len(self._pending) < target:
+                deadline = time.monotonic() + self._window()
+                while len(self._pending) < target:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+
+            batch = [item for item in self._pending[:self.max_batch_size] if not item[2].done()]
+            del self._pending[:self.max_batch_size]
+            if batch:
+                self._running += 1
+                self.batches += 1
+                asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch: List[Tuple[str, Optional[str], asyncio.Future]]):
+        try:
+            async with self.lane.slot():
+                start = time.monotonic()
+                results = await self.lane.to_thread(
+                    self.process_batch,
+                    [text for text, _, _ in batch],
+                    [source for _, source, _ in batch],
+                )
+                self._avg_batch_time = 0.8 * self._avg_batch_time + 0.2 * (time.monotonic() - start)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self._running -= 1
+            self._wakeup.set()
+
+    def stats(self) -> Dict:
+        """Return batching counters"""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "avg_batch_size": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "pending": len(self._pending),
+            "max_queue": self.max_queue,
+            "rejected_queue_full": self.rejected_queue_full,
+            "running_batches": self._running,
+            "target_batch_size": self._target_size(),
+            "window_ms": round(self._window() * 1000, 3),
+            "coalescing": self._inflight.stats(),
+        }
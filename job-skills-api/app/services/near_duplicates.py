@@ -0,0 +1,158 @@
+"""
+Near-duplicate detection for job postings.
+Uses MinHash signatures over word shingles with locality-sensitive hashing,
+so lookups only compare against postings that share at least one band.
+"""
+
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional
+
+import numpy as np
+
+# Mersenne-style prime larger than any 32-bit shingle hash
+_PRIME = np.uint64(4294967311)
+
+
+class MinHasher:
+    """Compute MinHash signatures of word shingles"""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 5, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        # Coefficients stay below 2**31 so a * hash + b cannot overflow uint64
+        self.a = rng.randint(1, 2 ** 31 - 1, size=num_perm).astype(np.uint64)
+        self.b = rng.randint(0, 2 ** 31 - 1, size=num_perm).astype(np.uint64)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Preprocessed posting text
+
+        Returns:
+            uint32 array of length num_perm
+        """
+        words = text.lower().split()
+        k = self.shingle_size
+        if len(words) <= k:
+            shingles = {" ".join(words)}
+        else:
+            shingles = {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+class NearDuplicateMatch(NamedTuple):
+    """An indexed posting similar to the query"""
+    key: Hashable
+    similarity: float
+    payload: Any
+
+
+class NearDuplicateIndex:
+    """
+    LSH index over MinHash signatures.
+
+    Signatures are split into `bands` bands; postings sharing any band are
+    candidates and are confirmed by estimated Jaccard similarity. With 64
+    permutations and 8 bands, pairs above ~0.77 similarity are found with
+    high probability. The index is bounded to `max_size` entries (oldest
+    evicted first) and safe to use from several threads.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 8,
+        threshold: float = 0.8,
+        max_size: Optional[int] = None,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.threshold = threshold
+        self.max_size = max_size
+
+        self._buckets: List[Dict[bytes, set]] = [{} for _ in range(bands)]
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (signature, payload)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def query(self, signature: np.ndarray) -> Optional[NearDuplicateMatch]:
+        """
+        Find the most similar indexed posting above the threshold.
+
+        Args:
+            signature: MinHash signature of the query posting
+
+        Returns:
+            Best match, or None if no posting is similar enough
+        """
+        with self._lock:
+            candidates = set()
+            for band, band_key in enumerate(self._band_keys(signature)):
+                candidates.update(self._buckets[band].get(band_key, ()))
+
+            best = None
+            for key in candidates:
+                indexed_signature, payload = self._entries[key]
+                similarity = float(np.mean(indexed_signature == signature))
+                if similarity >= self.threshold and (best is None or similarity > best.similarity):
+                    best = NearDuplicateMatch(key, round(similarity, 3), payload)
+
+            return best
+
+    def signature(self, key: Hashable) -> Optional[np.ndarray]:
+        """Signature of an indexed posting, or None if it is not (or no longer) indexed"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def add(self, key: Hashable, signature: np.ndarray, payload: Any = None):
+        """
+        Index a posting.
+
+        Args:
+            key: Posting identity (e.g. its content hash)
+            signature: MinHash signature of the posting
+            payload: Value returned with matches (e.g. the posting's analysis)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+
+            self._entries[key] = (signature, payload)
+            for band, band_key in enumerate(self._band_keys(signature)):
+                self._buckets[band].setdefault(band_key, set()).add(key)
+
+            if self.max_size is not None and len(self._entries) > self.max_size:
+                self._evict_oldest()
+
+    def _evict_oldest(self):
+        key, (signature, _) = self._entries.popitem(last=False)
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
@@ -3,8 +3,21 @@ NLP Service wrapper for skills extraction.
 Provides a high-level interface for analyzing job descriptions.
 """
 
+import hashlib
 import re
-from typing import List, Dict
+import unicodedata
+from typing import Iterable, List, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.config import settings
+from app.core.profiling import StageTimer
+from app.core.singleflight import SingleFlight
+from app.services.doc_archive import pending_docs, serialize_docs
+from app.services.language_models import DEFAULT_LANGUAGE, LanguageDetector
+from app.services.near_duplicates import MinHasher, NearDuplicateIndex
+from app.services.paragraph_cache import ParagraphCache, source_key
+from app.services.section_segmenter import is_skill_bearing, segment_text
 from app.services.skills_extractor import SkillsExtractor
 
 
@@ -24,54 +37,594 @@ class NLPService:
         """Initialize the NLP service (only once due to singleton)"""
         if not self._initialized:
             self.skills_extractor = SkillsExtractor()
+            self._inflight = SingleFlight()
+            self._batch_duplicates = 0
+
+            # Near-duplicate postings reuse the analysis of the first copy seen by
+            # this process, or of a stored posting seeded at startup
+            self.minhasher = None
+            self.near_duplicates = None
+            self._near_duplicate_hits = 0
+            if settings.NEAR_DUPLICATE_DETECTION_ENABLED:
+                self.minhasher = MinHasher()
+                self.near_duplicates = self._new_duplicate_index(settings.NEAR_DUPLICATE_INDEX_SIZE)
+
+            # Paragraphs that recur across postings of one source are extracted once
+            self.paragraph_cache = None
+            if settings.PARAGRAPH_CACHE_ENABLED:
+                self.paragraph_cache = ParagraphCache(max_entries=settings.PARAGRAPH_CACHE_SIZE)
+
+            # Postings are routed to a pipeline for their language
+            self.language_detector = None
+            if self.skills_extractor.pipelines is not None:
+                self.language_detector = LanguageDetector(self.skills_extractor.pipelines.languages)
+
+            # Processed Docs are kept for re-extraction after taxonomy changes
+            self.archive_docs = settings.DOC_ARCHIVE_ENABLED
+
             self._initialized = True
 
-    def analyze_job_description(self, job_description: str) -> Dict:
+    @staticmethod
+    def content_key(job_description: str) -> str:
+        """Return the content hash used to coalesce identical analyses"""
+        return hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+
+    def stats(self) -> Dict:
+        """Return request coalescing, near-duplicate, paragraph cache and language metrics"""
+        pipelines = self.skills_extractor.pipelines
+        return {
+            "coalescing": {
+                **self._inflight.stats(),
+                "batch_duplicates": self._batch_duplicates,
+            },
+            "near_duplicates": {
+                "enabled": self.near_duplicates is not None,
+                "indexed": len(self.near_duplicates) if self.near_duplicates is not None else 0,
+                "hits": self._near_duplicate_hits,
+            },
+            "paragraph_cache": {
+                "enabled": self.paragraph_cache is not None,
+                **(self.paragraph_cache.stats() if self.paragraph_cache is not None else {}),
+            },
+            "languages": {
+                "enabled": pipelines is not None,
+                **(pipelines.stats() if pipelines is not None else {}),
+                **({"detected": dict(self.language_detector.detections)} if self.language_detector is not None else {}),
+            },
+        }
+
+    @staticmethod
+    def _new_duplicate_index(max_size: Optional[int] = None) -> NearDuplicateIndex:
+        return NearDuplicateIndex(threshold=settings.NEAR_DUPLICATE_THRESHOLD, max_size=max_size)
+
+    def _signature(self, job_description: str):
+        """MinHash signature of a posting, computed over its preprocessed text"""
+        return self.minhasher.signature(self._preprocess_text(job_description))
+
+    def signature_bytes(self, job_description: str) -> Optional[bytes]:
+        """
+        MinHash signature of a posting for storage with its analysis.
+
+        Reuses the signature indexed when the posting was analyzed, if it is
+        still in the index.
+
+        Returns:
+            Signature bytes, or None when near-duplicate detection is disabled
+        """
+        if self.near_duplicates is None:
+            return None
+        signature = self.near_duplicates.signature(self.content_key(job_description))
+        if signature is None:
+            signature = self._signature(job_description)
+        return signature.tobytes()
+
+    def seed_near_duplicates(self, stored: Iterable[Tuple[str, bytes, List[Dict]]]) -> int:
+        """
+        Index stored postings so repeats of them are caught after a restart.
+
+        Stored rows keep skills but not the language or model, so analyses
+        reused from them carry only skills, totals and categories.
+
+        Args:
+            stored: (content hash, signature bytes, skills) per posting, oldest first
+
+        Returns:
+            Number of postings indexed
+        """
+        if self.near_duplicates is None:
+            return 0
+        seeded = 0
+        for content_hash, signature, skills in stored:
+            category_counts = {}
+            for skill in skills:
+                category_counts[skill["category"]] = category_counts.get(skill["category"], 0) + 1
+            analysis = {"skills": skills, "total_skills_found": len(skills), "categories": category_counts}
+            self.near_duplicates.add(content_hash, np.frombuffer(signature, dtype=np.uint32), analysis)
+            seeded += 1
+        return seeded
+
+    def analyze_job_description(
+        self,
+        job_description: str,
+        profile: bool = False,
+        source: Optional[str] = None,
+    ) -> Dict:
         """
         Analyze a single job description and extract skills.
 
+        Concurrent calls with identical text share one computation and receive
+        the same result dict, which callers must not mutate. When near-duplicate
+        detection is enabled, a posting identical or similar to one analyzed
+        before reuses that analysis and is marked with "duplicate_of". Profiled
+        calls are never coalesced since their timings are per-request.
+
         Args:
             job_description: The job description text
+            profile: Include per-stage timings and counts under a "debug" key
+            source: Posting URL or domain, used by the paragraph cache
 
         Returns:
             Dictionary with extracted skills and statistics
         """
+        if profile:
+            return self._analyze(job_description, StageTimer())
+
+        key = self.content_key(job_description)
+        if self.near_duplicates is None:
+            return self._inflight.do(key, self._analyze, job_description, None, source)
+
+        signature = self._signature(job_description)
+        match = self.near_duplicates.query(signature)
+        if match is not None:
+            self._near_duplicate_hits += 1
+            return {
+                **match.payload,
+                "duplicate_of": {"content_hash": match.key, "similarity": match.similarity},
+            }
+
+        result = self._inflight.do(key, self._analyze, job_description, None, source)
+        self.near_duplicates.add(key, signature, result)
+        return result
+
+    def analyze_job_descriptions(
+        self,
+        job_descriptions: List[str],
+        sources: Optional[List[Optional[str]]] = None,
+    ) -> List[Dict]:
+        """
+        Analyze several job descriptions in one spaCy batch.
+
+        Repeated descriptions are analyzed once; each repeat reuses the first
+        analysis and carries a "duplicate_of" reference. With near-duplicate
+        detection enabled, the same applies to postings similar to an earlier
+        one in the call, and to postings identical or similar to a previously
+        analyzed one; those references carry no "job_index".
+
+        Args:
+            job_descriptions: List of job description texts
+            sources: Optional posting URL or domain per text, used by the paragraph cache
+
+        Returns:
+            One analysis dictionary per input, in input order
+        """
+        sources = sources or [None] * len(job_descriptions)
+        detect = self.near_duplicates is not None
+        batch_index = self._new_duplicate_index() if detect else None
+
+        first_index = {}  # content hash -> index of first occurrence
+        duplicate_of = {}  # job index -> reference to the analysis it reuses
+        corpus_analyses = {}  # job index -> analysis reused from the corpus index
+        signatures = {}  # job index -> MinHash signature of each original
+        originals = []  # indices that need a full analysis
+
+        for i, job_text in enumerate(job_descriptions):
+            key = self.content_key(job_text)
+            if key in first_index:
+                self._batch_duplicates += 1
+                duplicate_of[i] = {"job_index": first_index[key], "content_hash": key, "similarity": 1.0}
+                continue
+            first_index[key] = i
+
+            if detect:
+                signature = self._signature(job_text)
+                match = batch_index.query(signature)
+                if match is not None:
+                    duplicate_of[i] = {"job_index": match.payload, "content_hash": match.key, "similarity": match.similarity}
+                    continue
+
+                match = self.near_duplicates.query(signature)
+                if match is not None:
+                    self._near_duplicate_hits += 1
+                    duplicate_of[i] = {"content_hash": match.key, "similarity": match.similarity}
+                    corpus_analyses[i] = match.payload
+                    continue
+
+                batch_index.add(key, signature, i)
+                signatures[i] = signature
+
+            originals.append(i)
+
+        results: List[Optional[Dict]] = [None] * len(job_descriptions)
+        if settings.SECTION_SEGMENTATION_ENABLED:
+            sectioned = self._extract_sections(
+                [job_descriptions[i] for i in originals],
+                sources=[sources[i] for i in originals],
+            )
+            for i, result in zip(originals, sectioned):
+                results[i] = result
+        else:
+            suggestions = [] if self.skills_extractor.skill_discovery is not None else None
+            docs = [] if self.archive_docs else None
+            languages = [self._language(job_descriptions[i]) for i in originals]
+            skills_lists = self._extract_batch(
+                [job_descriptions[i] for i in originals],
+                [sources[i] for i in originals],
+                suggestions,
+                docs,
+                languages,
+            )
+            for n, (i, skills) in enumerate(zip(originals, skills_lists)):
+                results[i] = self._build_result(
+                    skills,
+                    suggestions[n] if suggestions is not None else None,
+                    languages[n],
+                )
+                if docs is not None:
+                    self._archive(job_descriptions[i], [docs[n]])
+
+        if detect:
+            for i in originals:
+                self.near_duplicates.add(self.content_key(job_descriptions[i]), signatures[i], results[i])
+
+        for i, reference in sorted(duplicate_of.items()):
+            if "job_index" in reference:
+                original = results[reference["job_index"]]
+            else:
+                original = corpus_analyses[i]
+
+            results[i] = {**original, "duplicate_of": reference}
+
+        return results
+
+    def extract_skills(self, text: str) -> List[Dict]:
+        """
+        Extract skills from text that is not a posting (e.g. a resume).
+
+        Unlike analyze_job_description, results are neither coalesced nor
+        added to the near-duplicate index.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            List of skill dictionaries with name, count, category, and confidence
+        """
+        return self.skills_extractor.extract_skills(self._preprocess_text(text), language=self._language(text))
+
+    def _analyze(
+        self,
+        job_description: str,
+        timer: Optional[StageTimer] = None,
+        source: Optional[str] = None,
+    ) -> Dict:
+        """Run preprocessing and extraction for one job description"""
+        if settings.SECTION_SEGMENTATION_ENABLED:
+            result = self._extract_sections([job_description], timer, [source])[0]
+            if timer:
+                timer.add_count("skills", result["total_skills_found"])
+                result["debug"] = timer.as_dict()
+            return result
+
+        suggestions = [] if self.skills_extractor.skill_discovery is not None else None
+        if not timer:
+            # Profiled runs below time each pipeline component and bypass the paragraph cache
+            language = self._language(job_description)
+            docs = [] if self.archive_docs else None
+            skills = self._extract_batch([job_description], [source], suggestions, docs, [language])[0]
+            if docs is not None:
+                self._archive(job_description, docs)
+            return self._build_result(skills, suggestions[0] if suggestions is not None else None, language)
+
+        with timer.stage("detect_language"):
+            language = self._language(job_description)
+
         # Preprocess text
-        cleaned_text = self._preprocess_text(job_description)
+        with timer.stage("preprocess_text"):
+            cleaned_text = self._preprocess_text(job_description)
 
         # Extract skills
-        skills = self.skills_extractor.extract_skills(cleaned_text)
+        skills = self.skills_extractor.extract_skills(cleaned_text, timer=timer, suggestions=suggestions, language=language)
+
+        result = self._build_result(skills, suggestions, language)
+        timer.add_count("skills", len(skills))
+        result["debug"] = timer.as_dict()
+
+        return result
+
+    def _extract_batch(
+        self,
+        texts: List[str],
+        sources: List[Optional[str]],
+        suggestions: Optional[List[List[Dict]]] = None,
+        docs: Optional[List] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[List[Dict]]:
+        """
+        Extract skills from raw texts as one spaCy batch.
+
+        With the paragraph cache enabled, paragraphs a source has repeated are
+        answered from the cache, and a paragraph seen for the second time is
+        extracted on its own so its result can be cached. Everything else is
+        extracted as before.
+
+        Args:
+            texts: Raw texts with their line breaks intact
+            sources: Posting URL or domain per text (None bypasses the cache)
+            suggestions: Optional list that receives one suggestions list per text
+            docs: Optional list that receives the Doc of each text, or None for
+                texts the paragraph cache split into parts
+            languages: Optional language code per text (paragraphs inherit their text's)
+
+        Returns:
+            One skills list per text, in input order
+        """
+        if self.paragraph_cache is None:
+            cleaned_texts = [self._preprocess_text(text) for text in texts]
+            return self.skills_extractor.extract_skills_batch(
+                cleaned_texts, suggestions=suggestions, docs=docs, languages=languages
+            )
+
+        plans = [
+            self.paragraph_cache.plan(source_key(source), text) if source else None
+            for text, source in zip(texts, sources)
+        ]
+
+        unit_texts = []
+        unit_owners = []  # (text index, cache key or None) per extraction unit
+        for n, (text, plan) in enumerate(zip(texts, plans)):
+            unit_texts.append(self._preprocess_text(text if plan is None else plan.rest))
+            unit_owners.append((n, None))
+            if plan is not None:
+                for key, paragraph in plan.learn:
+                    unit_texts.append(self._preprocess_text(paragraph))
+                    unit_owners.append((n, key))
+
+        unit_suggestions = [] if suggestions is not None else None
+        unit_docs = [] if docs is not None else None
+        unit_languages = [languages[n] for n, _ in unit_owners] if languages is not None else None
+        unit_skills = self.skills_extractor.extract_skills_batch(
+            unit_texts, suggestions=unit_suggestions, docs=unit_docs, languages=unit_languages
+        )
+        if docs is not None:
+            # A text's first unit is the whole text unless the cache planned it in parts
+            first_units = [u for u, (_, key) in enumerate(unit_owners) if key is None]
+            docs.extend(unit_docs[u] if plan is None else None for u, plan in zip(first_units, plans))
+
+        skill_lists = [list(plan.cached) if plan is not None else [] for plan in plans]
+        text_suggestions = [[] for _ in texts]
+        for u, ((n, key), skills) in enumerate(zip(unit_owners, unit_skills)):
+            if key is not None:
+                self.paragraph_cache.store(key, skills)
+            skill_lists[n].append(skills)
+            if unit_suggestions is not None:
+                text_suggestions[n].extend(unit_suggestions[u])
+
+        if suggestions is not None:
+            suggestions.extend(text_suggestions)
+        return [self._merge_skill_lists(lists) for lists in skill_lists]
+
+    @staticmethod
+    def _merge_skill_lists(skill_lists: List[List[Dict]]) -> List[Dict]:
+        """Combine skills extracted from parts of one posting, summing counts"""
+        if len(skill_lists) == 1:
+            return skill_lists[0]
+
+        merged = {}  # skill name -> skill dict summed over parts
+        for skills in skill_lists:
+            for skill in skills:
+                if skill["name"] not in merged:
+                    merged[skill["name"]] = dict(skill)
+                else:
+                    merged[skill["name"]]["count"] += skill["count"]
+                    merged[skill["name"]]["confidence"] = max(merged[skill["name"]]["confidence"], skill["confidence"])
+
+        return sorted(merged.values(), key=lambda x: (x["count"], x["confidence"]), reverse=True)
+
+    def _extract_sections(
+        self,
+        job_descriptions: List[str],
+        timer: Optional[StageTimer] = None,
+        sources: Optional[List[Optional[str]]] = None,
+    ) -> List[Dict]:
+        """
+        Extract skills only from the skill-bearing sections of each posting.
 
-        # Calculate category breakdown
+        Postings are split at their heading lines before preprocessing (which
+        collapses line breaks). Benefits, legal and "about us" sections are
+        skipped; the remaining sections of all postings go through spaCy as
+        one batch, or one at a time when profiling.
+
+        Args:
+            job_descriptions: Raw posting texts with line breaks intact
+            timer: Optional StageTimer (per-section extraction, summed per stage)
+            sources: Optional posting URL or domain per text, used by the paragraph cache
+
+        Returns:
+            One result per posting, with per-section skill attribution under "sections"
+        """
+        discovery = self.skills_extractor.skill_discovery is not None
+        sources = sources or [None] * len(job_descriptions)
+        languages = [self._language(job_description) for job_description in job_descriptions]
+
+        sections_per_job = []
+        units = []  # (posting, section) of every section to extract from
+        texts = []
+        for n, job_description in enumerate(job_descriptions):
+            if timer:
+                with timer.stage("segment_sections"):
+                    sections = segment_text(job_description)
+            else:
+                sections = segment_text(job_description)
+            sections_per_job.append(sections)
+
+            for k, section in enumerate(sections):
+                if is_skill_bearing(section):
+                    units.append((n, k))
+                    texts.append(section["text"])
+                elif timer:
+                    timer.add_count("sections_skipped", 1)
+
+        suggestion_lists = [] if discovery else None
+        if timer:
+            skills_lists = []
+            for (n, _), text in zip(units, texts):
+                suggestions = [] if discovery else None
+                skills_lists.append(
+                    self.skills_extractor.extract_skills(
+                        self._preprocess_text(text), timer=timer, suggestions=suggestions, language=languages[n]
+                    )
+                )
+                if discovery:
+                    suggestion_lists.append(suggestions)
+        else:
+            unit_docs = [] if self.archive_docs else None
+            skills_lists = self._extract_batch(
+                texts,
+                [sources[n] for n, _ in units],
+                suggestion_lists,
+                unit_docs,
+                [languages[n] for n, _ in units],
+            )
+            if unit_docs is not None:
+                docs_per_job = [[] for _ in job_descriptions]
+                for (n, _), doc in zip(units, unit_docs):
+                    docs_per_job[n].append(doc)
+                for job_description, job_docs in zip(job_descriptions, docs_per_job):
+                    self._archive(job_description, job_docs)
+
+        unit_skills = dict(zip(units, skills_lists))
+        unit_suggestions = dict(zip(units, suggestion_lists)) if discovery else {}
+
+        results = []
+        for n, sections in enumerate(sections_per_job):
+            section_skill_lists = []
+            suggestions = [] if discovery else None
+            attribution = []
+            for k, section in enumerate(sections):
+                section_skills = unit_skills.get((n, k), [])
+                section_skill_lists.append(section_skills)
+                if discovery:
+                    suggestions.extend(unit_suggestions.get((n, k), []))
+
+                attribution.append({
+                    "type": section["type"],
+                    "heading": section["heading"],
+                    "skipped": (n, k) not in unit_skills,
+                    "skills": [skill["name"] for skill in section_skills],
+                })
+
+            result = self._build_result(self._merge_skill_lists(section_skill_lists or [[]]), suggestions, languages[n])
+            result["sections"] = attribution
+            results.append(result)
+
+        return results
+
+    def _archive(self, job_description: str, docs: List):
+        """Keep a posting's Docs (one per extracted part) until the posting is stored"""
+        if any(doc is None for doc in docs):
+            return  # Partly answered from the paragraph cache; nothing complete to archive
+        pending_docs.stash(self.content_key(job_description), serialize_docs(docs))
+
+    def _language(self, text: str) -> str:
+        """Language of a raw posting (always the default without multilingual support)"""
+        if self.language_detector is None:
+            return DEFAULT_LANGUAGE
+        return self.language_detector.detect(text)
+
+    def _build_result(
+        self,
+        skills: List[Dict],
+        suggestions: Optional[List[Dict]] = None,
+        language: str = DEFAULT_LANGUAGE,
+    ) -> Dict:
+        """Wrap an extracted skills list with its category breakdown, language and model"""
         category_counts = {}
         for skill in skills:
             category = skill["category"]
             category_counts[category] = category_counts.get(category, 0) + 1
 
-        return {
+        result = {
             "skills": skills,
             "total_skills_found": len(skills),
             "categories": category_counts,
+            "language": language,
+            "model": self.skills_extractor.model_name(language),
         }
-
-    def analyze_multiple_jobs(self, job_descriptions: List[str]) -> Dict:
+        if suggestions is not None:
+            result["suggested_skills"] = suggestions
+        return result
+
+    @staticmethod
+    def repeats_in_batch(analysis: Dict) -> bool:
+        """Whether an analysis reuses that of an earlier posting in the same batch"""
+        return "job_index" in analysis.get("duplicate_of", ())
+
+    def analyze_multiple_jobs(
+        self,
+        job_descriptions: List[str],
+        profile: bool = False,
+        collapse_duplicates: bool = False,
+        sources: Optional[List[Optional[str]]] = None,
+    ) -> Dict:
         """
         Analyze multiple job descriptions and aggregate results.
 
         Args:
             job_descriptions: List of job description texts
+            profile: Include per-job and summed stage timings under "debug" keys
+            collapse_duplicates: Count postings repeated within the batch only once
+                in aggregates (postings that repeat earlier requests still count)
+            sources: Optional posting URL or domain per text, used by the paragraph cache
 
         Returns:
             Dictionary with aggregated skills across all jobs
         """
-        all_analyses = []
         skill_aggregation = {}  # skill_name -> {total_count, job_count, category}
-
-        # Analyze each job
-        for job_text in job_descriptions:
-            analysis = self.analyze_job_description(job_text)
-            all_analyses.append(analysis)
-
+        batch_timer = StageTimer() if profile else None
+
+        if profile:
+            # Profiled jobs run one at a time so each gets its own stage timings
+            analyses_by_key = {}  # content hash -> (job index, analysis), so repeats run once
+            all_analyses = []
+            for job_text in job_descriptions:
+                key = self.content_key(job_text)
+                first = analyses_by_key.get(key)
+                if first is not None:
+                    self._batch_duplicates += 1
+                    analysis = {
+                        **first[1],
+                        "duplicate_of": {"job_index": first[0], "content_hash": key, "similarity": 1.0},
+                    }
+                else:
+                    analysis = self.analyze_job_description(job_text, profile=True)
+                    analyses_by_key[key] = (len(all_analyses), analysis)
+
+                    debug = analysis["debug"]
+                    for stage, elapsed in debug["stages"].items():
+                        batch_timer.stages[stage] = batch_timer.stages.get(stage, 0.0) + elapsed
+                    for name, value in debug["counts"].items():
+                        batch_timer.add_count(name, value)
+                all_analyses.append(analysis)
+        else:
+            all_analyses = self.analyze_job_descriptions(job_descriptions, sources=sources)
+
+        duplicate_jobs = sum(1 for analysis in all_analyses if "duplicate_of" in analysis)
+        counted_analyses = all_analyses
+        if collapse_duplicates:
+            counted_analyses = [analysis for analysis in all_analyses if not self.repeats_in_batch(analysis)]
+
+        # Aggregate skills across jobs
+        for analysis in counted_analyses:
             # Track which skills appeared in this job (for percentage calculation)
             skills_in_this_job = set()
 
@@ -94,7 +647,7 @@ class NLPService:
                 skill_aggregation[skill_name]["job_count"] += 1
 
         # Convert to list with percentages
-        total_jobs = len(job_descriptions)
+        total_jobs = len(counted_analyses)
         aggregated_skills = []
 
         for skill_name, data in skill_aggregation.items():
@@ -119,12 +672,17 @@ class NLPService:
             category = skill["category"]
             category_breakdown[category] = category_breakdown.get(category, 0) + 1
 
-        return {
+        result = {
             "aggregated_skills": aggregated_skills,
             "top_skills": top_skills,
             "category_breakdown": category_breakdown,
             "individual_analyses": all_analyses,
+            "duplicate_jobs": duplicate_jobs,
         }
+        if batch_timer:
+            result["debug"] = batch_timer.as_dict()
+
+        return result
 
     def _preprocess_text(self, text: str) -> str:
         """
@@ -142,9 +700,15 @@ class NLPService:
         # Normalize whitespace
         text = re.sub(r'\s+', ' ', text)
 
-        # Remove special characters but keep alphanumeric, spaces, and common punctuation
-        # Keep: letters, numbers, spaces, periods, commas, hyphens, slashes, parentheses, +, #
-        text = re.sub(r'[^a-zA-Z0-9\s.,\-/()+#]', '', text)
+        if self.language_detector is not None:
+            # Same filter for any script: fold compatibility forms (ligatures,
+            # full-width letters) and keep letters and digits beyond ASCII
+            text = unicodedata.normalize("NFKC", text)
+            text = re.sub(r'[^\w\s.,\-/()+#]|_', '', text)
+        else:
+            # Remove special characters but keep alphanumeric, spaces, and common punctuation
+            # Keep: letters, numbers, spaces, periods, commas, hyphens, slashes, parentheses, +, #
+            text = re.sub(r'[^a-zA-Z0-9\s.,\-/()+#]', '', text)
 
         # Strip leading/trailing whitespace
         text = text.strip()
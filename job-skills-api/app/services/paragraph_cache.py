@@ -0,0 +1,143 @@
+"""
+Per-source cache of recurring posting paragraphs.
+Postings from the same company repeat their "About us" text, benefits lists
+and legal notices verbatim; once a paragraph recurs, its extraction result is
+cached and later postings from that source skip it in spaCy.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Tuple
+from urllib.parse import urlparse
+
+# Boards that host many companies under one domain; the first path segment names the company
+MULTI_TENANT_HOSTS = ("greenhouse.io", "lever.co")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def source_key(source: str) -> str:
+    """
+    Reduce a posting URL (or bare domain) to the source whose paragraphs recur.
+
+    "https://boards.greenhouse.io/acme/jobs/1" -> "boards.greenhouse.io/acme",
+    "https://careers.acme.com/jobs/1" -> "careers.acme.com"
+    """
+    parsed = urlparse(source if "//" in source else f"//{source}")
+    host = (parsed.hostname or source).lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if host.endswith(MULTI_TENANT_HOSTS):
+        segments = [segment for segment in parsed.path.split("/") if segment]
+        if segments:
+            return f"{host}/{segments[0].lower()}"
+    return host
+
+
+class ParagraphPlan(NamedTuple):
+    """How one posting's paragraphs are served"""
+    cached: List[List[Dict]]  # skills of paragraphs answered from the cache
+    learn: List[Tuple[tuple, str]]  # (cache key, paragraph) to extract alone and cache
+    rest: str  # remaining text, extracted as usual
+
+
+class ParagraphCache:
+    """
+    LRU map of (source, paragraph fingerprint) -> sightings and extracted skills.
+
+    The first sighting of a paragraph only records it. On the second, the
+    caller extracts the paragraph on its own and stores the result; every
+    later sighting is answered from the cache. Memory is bounded by
+    `max_entries` across all sources.
+    """
+
+    def __init__(self, max_entries: int = 50000, min_length: int = 80):
+        """
+        Args:
+            max_entries: Paragraph fingerprints remembered across all sources
+            min_length: Shorter paragraphs (single bullets) are never cached
+        """
+        self.max_entries = max_entries
+        self.min_length = min_length
+
+        self._entries: "OrderedDict[tuple, list]" = OrderedDict()  # key -> [sightings, skills or None]
+        self._lock = threading.Lock()
+
+        self.lookups = 0
+        self.hits = 0
+        self.learned = 0
+        self.evictions = 0
+        self.skipped_chars = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _fingerprint(paragraph: str) -> str:
+        normalized = _WHITESPACE_RE.sub(" ", paragraph).strip().lower()
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+    def plan(self, source: str, text: str) -> ParagraphPlan:
+        """
+        Split a posting into cached paragraphs, paragraphs to learn and the rest.
+
+        Args:
+            source: Source key (see source_key)
+            text: Raw posting text with its line breaks intact
+
+        Returns:
+            ParagraphPlan for the posting
+        """
+        cached, learn, rest = [], [], []
+        with self._lock:
+            for paragraph in text.splitlines():
+                if len(paragraph.strip()) < self.min_length:
+                    rest.append(paragraph)
+                    continue
+
+                key = (source, self._fingerprint(paragraph))
+                self.lookups += 1
+                entry = self._entries.get(key)
+                if entry is None:
+                    self._entries[key] = [1, None]
+                    if len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                        self.evictions += 1
+                    rest.append(paragraph)
+                    continue
+
+                self._entries.move_to_end(key)
+                entry[0] += 1
+                if entry[1] is not None:
+                    self.hits += 1
+                    self.skipped_chars += len(paragraph)
+                    cached.append(entry[1])
+                else:
+                    learn.append((key, paragraph))
+
+        return ParagraphPlan(cached, learn, "\n".join(rest))
+
+    def store(self, key: tuple, skills: List[Dict]):
+        """Cache the extraction result of a recurring paragraph"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is None:
+                entry[1] = skills
+                self.learned += 1
+
+    def stats(self) -> Dict:
+        """Return hit-rate and size counters"""
+        with self._lock:
+            cached_paragraphs = sum(1 for _, skills in self._entries.values() if skills is not None)
+        return {
+            "entries": len(self._entries),
+            "cached_paragraphs": cached_paragraphs,
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": round(self.hits / self.lookups, 3) if self.lookups else 0.0,
+            "learned": self.learned,
+            "evictions": self.evictions,
+            "skipped_chars": self.skipped_chars,
+        }
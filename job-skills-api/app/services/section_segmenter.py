@@ -0,0 +1,166 @@
+"""
+Section segmentation for job postings.
+Splits a posting into regions (requirements, responsibilities, benefits,
+legal, about) from its heading lines, so extraction can skip boilerplate.
+"""
+
+import re
+from typing import Dict, List, Optional, Set
+
+# Heading phrases per section type, matched against short heading lines
+SECTION_PATTERNS = {
+    "requirements": re.compile(
+        r"\b(requirements?|qualifications?|what you('ll)? (need|bring|have)|must[- ]haves?|"
+        r"nice[- ]to[- ]haves?|preferred|skills|experience|about you|who you are|you have|"
+        r"tech(nology)? stack|our stack|tools)\b"
+    ),
+    "responsibilities": re.compile(
+        r"\b(responsibilit(y|ies)|what you('ll)? (do|work on|be doing)|role( overview)?|"
+        r"duties|day[- ]to[- ]day|in this role|the job|the opportunity|your impact)\b"
+    ),
+    "benefits": re.compile(
+        r"\b(benefits|perks|what we offer|we offer|compensation|salary|pay range|pay transparency|"
+        r"why (join|work)|what's in it for you|total rewards)\b"
+    ),
+    "legal": re.compile(
+        r"\b(equal (employment )?opportunity|eeo|diversity|inclusion|accommodations?|privacy|"
+        r"e-verify|disclaimer|legal|right to work|background check)\b"
+    ),
+    "about": re.compile(
+        r"\b(about (us|the company|the team|our company)|who we are|our (mission|story|values|culture)|"
+        r"company (overview|description)|life at)\b"
+    ),
+}
+
+# Body text that marks a paragraph as legal boilerplate even without a heading
+LEGAL_BODY_PATTERN = re.compile(
+    r"\b(equal (employment )?opportunity employer|without regard to (race|sex|age)|"
+    r"reasonable accommodations?|e-verify|protected veteran status)\b",
+    re.IGNORECASE,
+)
+
+# Sections that rarely name skills; extraction skips them
+BOILERPLATE_SECTIONS = {"benefits", "legal", "about"}
+
+MAX_HEADING_WORDS = 8
+MAX_HEADING_LENGTH = 80
+
+# Words that may precede the heading phrase of an unmarked heading line ("Our Benefits")
+_HEADING_PREFIX = re.compile(r"^(?:our|your|the|key|main|core|a few)\s+")
+
+
+def classify_heading(line: str, marked: bool = False) -> Optional[str]:
+    """
+    Classify a line as a section heading.
+
+    Lines marked up as headings or ending in a colon only need to contain a
+    heading phrase. Other short lines must start with one, so requirement
+    bullets such as "Strong Python experience" do not open a new section.
+
+    Args:
+        line: One line of posting text
+        marked: Whether markup (h1-h6, bold paragraph) identifies the line as a heading
+
+    Returns:
+        Section type, or None if the line does not look like a known heading
+    """
+    stripped = line.strip()
+    text = stripped.rstrip(":").strip()
+    if not text or len(text) > MAX_HEADING_LENGTH or len(text.split()) > MAX_HEADING_WORDS:
+        return None
+
+    strong = marked or stripped.endswith(":")
+    if not strong and text.endswith((".", "!", "?", ",", ";")):
+        return None  # a short sentence, not a heading
+
+    lowered = text.lower()
+    if not strong:
+        lowered = _HEADING_PREFIX.sub("", lowered)
+    for section_type, pattern in SECTION_PATTERNS.items():
+        match = pattern.search(lowered)
+        if match and (strong or match.start() == 0):
+            return section_type
+    return None
+
+
+def segment_text(text: str, heading_lines: Optional[Set[str]] = None) -> List[Dict]:
+    """
+    Split posting text into typed sections at heading lines.
+
+    Text before the first heading, and sections under headings that match no
+    known type, are typed "other". Unheaded paragraphs that read like an EEO
+    statement are typed "legal".
+
+    Args:
+        text: Posting text with its line breaks intact
+        heading_lines: Lines known to be headings from markup (h1-h6, bold
+            paragraphs); they start a section even if their type is unknown
+
+    Returns:
+        Sections in document order, each with type, heading and text
+    """
+    heading_lines = heading_lines or set()
+    sections: List[Dict] = []
+    current = {"type": "other", "heading": None, "lines": []}
+
+    def flush():
+        if current["lines"]:
+            body = "\n".join(current["lines"])
+            section_type = current["type"]
+            if section_type == "other" and LEGAL_BODY_PATTERN.search(body):
+                section_type = "legal"
+            sections.append({"type": section_type, "heading": current["heading"], "text": body})
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        marked = stripped in heading_lines
+        section_type = classify_heading(stripped, marked=marked)
+        if section_type is None and marked:
+            section_type = "other"
+        if section_type == current["type"] and not (marked or stripped.endswith(":")):
+            section_type = None  # "Experience with AWS" inside requirements is a bullet, not a new section
+
+        if section_type is not None:
+            flush()
+            current = {"type": section_type, "heading": stripped.rstrip(":").strip(), "lines": []}
+
+        # Headings stay in the section text; "Experience with AWS:" names a skill itself
+        current["lines"].append(stripped)
+
+    flush()
+    return sections
+
+
+def segment_html(element) -> List[Dict]:
+    """
+    Split the content element of a posting page into typed sections.
+
+    Uses heading tags and bold-only paragraphs as heading lines.
+
+    Args:
+        element: BeautifulSoup element holding the posting body
+
+    Returns:
+        Sections in document order, each with type, heading and text
+    """
+    heading_lines = set()
+    for tag in element.find_all(["h1", "h2", "h3", "h4", "h5", "h6", "strong", "b"]):
+        text = tag.get_text(" ", strip=True)
+        if not text:
+            continue
+        if tag.name in ("strong", "b"):
+            # Only bold text that makes up its whole block acts as a heading
+            parent_text = tag.parent.get_text(" ", strip=True) if tag.parent is not None else ""
+            if parent_text != text:
+                continue
+        heading_lines.add(text)
+
+    return segment_text(element.get_text(separator="\n", strip=True), heading_lines)
+
+
+def is_skill_bearing(section: Dict) -> bool:
+    """Whether a section should go through skill extraction"""
+    return section["type"] not in BOILERPLATE_SECTIONS
@@ -0,0 +1,156 @@
+"""
+Vector-similarity discovery of skills missing from SKILLS_DATABASE.
+Candidate noun chunks and entities are compared against a precomputed,
+normalized matrix of word vectors for every known skill in one matrix
+multiplication per document.
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from app.core.skills_database import SKILLS_DATABASE, get_category_for_skill
+
+CANDIDATE_ENTITY_LABELS = {"PRODUCT", "ORG", "GPE"}
+MAX_CANDIDATE_TOKENS = 4
+
+
+class NovelTermLog:
+    """Bounded frequency log of unknown terms, for growing the taxonomy"""
+
+    def __init__(self, max_terms: int = 5000):
+        self.max_terms = max_terms
+        self._counts: Counter = Counter()
+        self._nearest: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, suggestion: Dict):
+        term = suggestion["term"]
+        with self._lock:
+            if term not in self._counts:
+                print(
+                    f"[discovery] novel term {term!r} "
+                    f"(nearest skill {suggestion['nearest_skill']!r}, similarity {suggestion['similarity']:.2f})"
+                )
+            self._counts[term] += 1
+            self._nearest[term] = suggestion
+
+            if len(self._counts) > self.max_terms:
+                # Keep the most frequent half; one-off terms are the likeliest noise
+                keep = self._counts.most_common(self.max_terms // 2)
+                self._counts = Counter(dict(keep))
+                self._nearest = {t: self._nearest[t] for t, _ in keep}
+
+    def top(self, limit: int = 50) -> List[Dict]:
+        """Most frequently seen novel terms with their nearest known skill"""
+        with self._lock:
+            return [
+                {**self._nearest[term], "occurrences": count}
+                for term, count in self._counts.most_common(limit)
+            ]
+
+
+class SkillDiscovery:
+    """Propose the nearest known skill for terms the extraction tiers did not recognise"""
+
+    def __init__(self, nlp, threshold: float = 0.7, novel_terms: Optional[NovelTermLog] = None):
+        self.nlp = nlp
+        self.threshold = threshold
+        self.novel_terms = novel_terms or NovelTermLog()
+
+        names, categories, vectors = [], [], []
+        seen = set()
+        for category, skills in SKILLS_DATABASE.items():
+            for skill in skills:
+                if skill.lower() in seen:
+                    continue
+                seen.add(skill.lower())
+                vector = self._term_vector(skill)
+                if vector is None:
+                    continue  # no word vectors for any token of this skill
+                names.append(skill)
+                categories.append(category)
+                vectors.append(vector)
+
+        self.skill_names = names
+        self.skill_categories = categories
+        self.matrix = self._normalize(np.asarray(vectors, dtype=np.float32)) if vectors else None
+
+    def _term_vector(self, text: str, span=None) -> Optional[np.ndarray]:
+        """Mean word vector of a term, retrying in lowercase for cased vector tables"""
+        vector = (span if span is not None else self.nlp.make_doc(text)).vector
+        if not np.any(vector):
+            vector = self.nlp.make_doc(text.lower()).vector
+        return vector if np.any(vector) else None
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _candidates(self, doc, known: Set[str]) -> List:
+        spans = [ent for ent in doc.ents if ent.label_ in CANDIDATE_ENTITY_LABELS]
+        if doc.has_annotation("DEP"):
+            spans.extend(doc.noun_chunks)
+
+        candidates, seen = [], set()
+        for span in spans:
+            # Drop leading determiners and pronouns ("the", "our")
+            while len(span) and (span[0].is_stop or span[0].pos_ in ("DET", "PRON")):
+                span = span[1:]
+            if not len(span) or len(span) > MAX_CANDIDATE_TOKENS:
+                continue
+
+            term = span.text.lower()
+            if term in seen or term in known or get_category_for_skill(term) != "other":
+                continue
+            seen.add(term)
+
+            vector = self._term_vector(span.text, span)
+            if vector is not None:
+                candidates.append((span, vector))
+
+        return candidates
+
+    def suggest(self, doc, known_skills: List[Dict]) -> List[Dict]:
+        """
+        Propose nearest known skills for unrecognised candidate terms.
+
+        Args:
+            doc: Processed spaCy Doc
+            known_skills: Skills already extracted from the doc
+
+        Returns:
+            Suggestions with term, nearest_skill, category and similarity
+        """
+        if self.matrix is None:
+            return []
+
+        known = {skill["name"].lower() for skill in known_skills}
+        candidates = self._candidates(doc, known)
+        if not candidates:
+            return []
+
+        vectors = self._normalize(np.asarray([vector for _, vector in candidates], dtype=np.float32))
+        similarities = vectors @ self.matrix.T  # (candidates, skills)
+        best = similarities.argmax(axis=1)
+        scores = similarities[np.arange(len(candidates)), best]
+
+        suggestions = []
+        for (span, _), index, score in zip(candidates, best, scores):
+            if score < self.threshold:
+                continue
+            suggestion = {
+                "term": span.text,
+                "nearest_skill": self.skill_names[index],
+                "category": self.skill_categories[index],
+                "similarity": round(float(score), 3),
+            }
+            suggestions.append(suggestion)
+            self.novel_terms.record(suggestion)
+
+        suggestions.sort(key=lambda s: s["similarity"], reverse=True)
+        return suggestions
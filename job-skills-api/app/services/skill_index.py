@@ -0,0 +1,326 @@
+"""
+Inverted index from skills to stored postings.
+Answers boolean skill queries ("Python AND Kubernetes, NOT Java, in
+data_science") with bitmap operations, and ranks postings by weighted cosine
+similarity to a set of skills (e.g. those found in a resume).
+"""
+
+import math
+import threading
+from array import array
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.jobs import AnalyzedJob
+
+# Rows fetched per round trip when catching up from the database
+SYNC_CHUNK_SIZE = 5000
+
+# Ids below the highest indexed one that each sync checks again. Ids are
+# assigned at insert, not commit, so a concurrent writer can commit a lower id
+# after a higher one was already indexed.
+SYNC_RESCAN_IDS = 1000
+
+# Relative importance of skill categories when matching; unlisted categories weigh 1.0
+CATEGORY_WEIGHTS = {
+    "soft_skills": 0.25,
+    "methodologies": 0.5,
+    "design_tools": 0.75,
+}
+
+
+def _skill_weight(skill: Dict) -> float:
+    """Weight of a skill within one posting or resume"""
+    return skill["confidence"] * math.log1p(skill["count"])
+
+
+class _PostingList:
+    """Postings of one skill or category: document numbers plus ranking weights"""
+
+    __slots__ = ("docs", "weights")
+
+    def __init__(self):
+        self.docs = array("I")  # ascending document numbers
+        self.weights = array("f")  # confidence * log(1 + count), aligned with docs
+
+
+class SkillIndex:
+    """
+    Skill -> posting inverted index over analyzed jobs.
+
+    Postings are numbered densely in the order they are added. Each skill and
+    category keeps a compact posting list (arrays of document numbers and
+    weights); queries turn the posting lists they touch into bitmaps (Python
+    ints, one bit per posting) so AND/OR/NOT are single big-integer
+    operations. Bitmaps are cached per term and dropped when the term gets
+    new postings, so incremental adds stay cheap.
+
+    The skill posting lists are also the sparse columns of a job x skill
+    matrix; with the category weights and per-posting norms kept alongside,
+    similarity ranking is one vectorized scatter-add per query skill.
+    """
+
+    def __init__(self):
+        self.job_ids = array("q")  # document number -> AnalyzedJob.id
+        self.job_norms = array("f")  # document number -> norm of its category-weighted skill vector
+        self.last_job_id = 0
+        self._recent_ids: Set[int] = set()  # indexed ids within SYNC_RESCAN_IDS of last_job_id
+
+        self._skills: Dict[str, _PostingList] = {}  # lowercase skill -> postings
+        self._categories: Dict[str, _PostingList] = {}
+        self._skill_names: Dict[str, str] = {}  # lowercase skill -> display name
+        self._skill_categories: Dict[str, str] = {}  # lowercase skill -> category
+        self._bitmap_cache: Dict[tuple, int] = {}
+
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def add(self, job_id: int, skills: List[Dict]):
+        """
+        Index one analyzed posting.
+
+        Args:
+            job_id: AnalyzedJob id of the posting
+            skills: Extracted skills (name, count, category, confidence)
+        """
+        # A posting may list the same skill under two spellings ("Python", "python")
+        weights: Dict[str, float] = {}
+        categories = set()
+        for skill in skills:
+            key = skill["name"].lower()
+            weights[key] = max(weights.get(key, 0.0), _skill_weight(skill))
+            self._skill_names.setdefault(key, skill["name"])
+            self._skill_categories.setdefault(key, skill["category"])
+            categories.add(skill["category"])
+
+        norm = math.sqrt(sum(
+            (CATEGORY_WEIGHTS.get(self._skill_categories[key], 1.0) * weight) ** 2
+            for key, weight in weights.items()
+        ))
+
+        with self._lock:
+            doc = len(self.job_ids)
+            self.job_ids.append(job_id)
+            self.job_norms.append(norm)
+            self.last_job_id = max(self.last_job_id, job_id)
+            self._recent_ids.add(job_id)
+
+            for key, weight in weights.items():
+                postings = self._skills.setdefault(key, _PostingList())
+                postings.docs.append(doc)
+                postings.weights.append(weight)
+                self._bitmap_cache.pop(("skill", key), None)
+
+            for category in categories:
+                postings = self._categories.setdefault(category, _PostingList())
+                postings.docs.append(doc)
+                postings.weights.append(1.0)
+                self._bitmap_cache.pop(("category", category), None)
+
+    def sync_from_db(self, db: Session) -> int:
+        """
+        Index postings stored since the last sync.
+
+        The last SYNC_RESCAN_IDS ids below the high-water mark are checked
+        again, so rows that committed out of id order are still picked up;
+        ids already indexed are skipped. Only ids are read for that window,
+        skills just for the rows that are missing.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of postings added
+        """
+        with self._sync_lock:
+            added = 0
+            cursor = max(self.last_job_id - SYNC_RESCAN_IDS, 0)
+            while True:
+                ids = [
+                    job_id
+                    for (job_id,) in db.query(AnalyzedJob.id)
+                    .filter(AnalyzedJob.id > cursor)
+                    .order_by(AnalyzedJob.id)
+                    .limit(SYNC_CHUNK_SIZE)
+                ]
+                missing = [job_id for job_id in ids if job_id not in self._recent_ids]
+                if missing:
+                    rows = (
+                        db.query(AnalyzedJob.id, AnalyzedJob.skills)
+                        .filter(AnalyzedJob.id.in_(missing))
+                        .order_by(AnalyzedJob.id)
+                        .all()
+                    )
+                    for job_id, skills in rows:
+                        self.add(job_id, skills)
+                    added += len(rows)
+                    self._forget_old_ids()
+                if len(ids) < SYNC_CHUNK_SIZE:
+                    return added
+                cursor = ids[-1]
+
+    def _forget_old_ids(self):
+        """Drop ids that have fallen out of the rescan window"""
+        floor = self.last_job_id - SYNC_RESCAN_IDS
+        with self._lock:
+            self._recent_ids = {job_id for job_id in self._recent_ids if job_id > floor}
+
+    def _bitmap(self, kind: str, key: str) -> int:
+        """Bitmap of a skill or category, built from its posting list on first use"""
+        cached = self._bitmap_cache.get((kind, key))
+        if cached is not None:
+            return cached
+
+        postings = (self._skills if kind == "skill" else self._categories).get(key)
+        if postings is None:
+            return 0
+
+        bits = np.zeros(len(self.job_ids), dtype=bool)
+        bits[np.frombuffer(postings.docs, dtype=np.uint32)] = True
+        bitmap = int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+        self._bitmap_cache[(kind, key)] = bitmap
+        return bitmap
+
+    def _bitmap_docs(self, bitmap: int) -> np.ndarray:
+        """Document numbers of the set bits, ascending"""
+        if not bitmap:
+            return np.empty(0, dtype=np.int64)
+        size = (len(self.job_ids) + 7) // 8
+        packed = np.frombuffer(bitmap.to_bytes(size, "little"), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(packed, bitorder="little"))
+
+    def search(
+        self,
+        skills: Sequence[str] = (),
+        any_skills: Sequence[str] = (),
+        exclude_skills: Sequence[str] = (),
+        category: Optional[str] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> Dict:
+        """
+        Find postings matching a boolean skill query.
+
+        Each matched query skill adds confidence * log(1 + count) to a
+        posting's score; ties (and queries without positive skills) are
+        broken by recency.
+
+        Args:
+            skills: Skills a posting must all require (AND)
+            any_skills: Skills of which a posting must require at least one (OR)
+            exclude_skills: Skills a posting must not mention (NOT)
+            category: Category in which a posting must require at least one skill
+            limit: Page size
+            offset: Index of the first hit to return
+
+        Returns:
+            Dictionary with the total number of matches and the page of hits
+            (job_id, score, matched_skills)
+        """
+        skills = [s.lower() for s in skills]
+        any_skills = [s.lower() for s in any_skills]
+
+        with self._lock:
+            count = len(self.job_ids)
+            matched = (1 << count) - 1
+
+            for key in skills:
+                matched &= self._bitmap("skill", key)
+            if any_skills:
+                union = 0
+                for key in any_skills:
+                    union |= self._bitmap("skill", key)
+                matched &= union
+            for key in exclude_skills:
+                matched &= ~self._bitmap("skill", key.lower())
+            if category:
+                matched &= self._bitmap("category", category)
+
+            docs = self._bitmap_docs(matched)
+
+            positive = list(dict.fromkeys(skills + any_skills))
+            scores = np.zeros(count, dtype=np.float32)
+            for key in positive:
+                postings = self._skills.get(key)
+                if postings is not None:
+                    # Document numbers are unique within a posting list
+                    scores[np.frombuffer(postings.docs, dtype=np.uint32)] += np.frombuffer(postings.weights, dtype=np.float32)
+
+            # Highest score first, newest posting first among equal scores
+            order = np.lexsort((-docs, -scores[docs]))
+            page = docs[order][offset:offset + limit]
+
+            hits = []
+            for doc in page.tolist():
+                hits.append({
+                    "job_id": self.job_ids[doc],
+                    "score": round(float(scores[doc]), 3),
+                    "matched_skills": [
+                        self._skill_names[key]
+                        for key in positive
+                        if (self._bitmap("skill", key) >> doc) & 1
+                    ],
+                })
+
+        return {"total": int(len(docs)), "hits": hits}
+
+    def match(self, skills: List[Dict], top_k: int = 10) -> Dict:
+        """
+        Rank postings by cosine similarity to a set of skills.
+
+        Postings and the query are skill vectors weighted by
+        confidence * log(1 + count) and by CATEGORY_WEIGHTS, so a shared
+        programming language counts for more than a shared soft skill.
+
+        Args:
+            skills: Extracted skills of the query (e.g. a resume)
+            top_k: Number of postings to return
+
+        Returns:
+            Dictionary with the number of postings sharing at least one skill
+            and the top postings (job_id, score), best first
+        """
+        query: Dict[str, float] = {}
+        for skill in skills:
+            key = skill["name"].lower()
+            query[key] = max(query.get(key, 0.0), _skill_weight(skill))
+
+        with self._lock:
+            # Views from np.frombuffer must not outlive the lock: an array
+            # cannot grow while a buffer export is alive
+            dots = np.zeros(len(self.job_ids), dtype=np.float32)
+            query_norm = 0.0
+            for key, query_weight in query.items():
+                category_weight = CATEGORY_WEIGHTS.get(self._skill_categories.get(key), 1.0)
+                query_norm += (category_weight * query_weight) ** 2
+
+                postings = self._skills.get(key)
+                if postings is not None:
+                    dots[np.frombuffer(postings.docs, dtype=np.uint32)] += (
+                        category_weight ** 2 * query_weight * np.frombuffer(postings.weights, dtype=np.float32)
+                    )
+
+            candidates = np.flatnonzero(dots)
+            norms = np.frombuffer(self.job_norms, dtype=np.float32)[candidates]  # fancy indexing copies
+
+        if not len(candidates):
+            return {"candidates": 0, "matches": []}
+
+        scores = dots[candidates] / (norms * math.sqrt(query_norm))
+        k = min(top_k, len(candidates))
+        # Select the k best without sorting every candidate, then order just those
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return {
+            "candidates": int(len(candidates)),
+            "matches": [
+                {"job_id": self.job_ids[candidates[i]], "score": round(float(scores[i]), 3)}
+                for i in top.tolist()
+            ],
+        }
@@ -1,216 +1,512 @@
 """
 Skills Extractor using spaCy NLP.
-Extracts technical skills from job descriptions using:
+Extracts technical skills from job descriptions, in one sweep over the tokens, using:
 1. Pattern matching against curated skills database
 2. Entity recognition for technical terms
 3. Contextual extraction based on keywords
+4. Fuzzy matching of aliases, spacing variants and misspellings
+5. Optionally, vector-similarity suggestions for unknown terms
 """
 
 import spacy
 from spacy.matcher import PhraseMatcher
-from typing import List, Dict
+from typing import List, Dict, Optional
+from bisect import bisect_right
 from collections import Counter
 import re
 
-from app.core.skills_database import SKILLS_DATABASE, get_category_for_skill
+from app.config import settings
+from app.core.fuzzy_index import FuzzySkillIndex
+from app.core.profiling import NULL_TIMER
+from app.core.skills_database import SKILL_CATEGORIES, SKILLS_DATABASE, get_category_for_skill
+from app.services.language_models import DEFAULT_LANGUAGE, LanguagePipelines, parse_language_models
+from app.services.skill_discovery import SkillDiscovery
+
+# spaCy pipeline the extractor loads by default
+SPACY_MODEL = "en_core_web_lg"
+
+# Tiers in the order their results are merged; a skill's category comes from the earliest tier
+PATTERN_TIER, ENTITY_TIER, CONTEXT_TIER, FUZZY_TIER = range(4)
+
+PATTERN_CONFIDENCE = 0.95  # Exact phrase matches
+ENTITY_CONFIDENCE = 0.75  # Known skills recognised as entities
+FUZZY_CONFIDENCE = 0.70  # Between entity and contextual confidence
+CONTEXT_CONFIDENCE = 0.60  # Known words following a context keyword
+
+# Entity labels likely to be technical skills, per language (the WikiNER-trained
+# pipelines of other languages label products and technologies ORG or MISC)
+ENTITY_LABELS = {
+    "en": frozenset({"PRODUCT", "ORG", "GPE"}),
+}
+OTHER_ENTITY_LABELS = frozenset({"ORG", "MISC"})
+
+# Keywords that often precede skills, per language
+CONTEXT_KEYWORDS = {
+    "en": [
+        "experience with",
+        "proficient in",
+        "knowledge of",
+        "expertise in",
+        "skilled in",
+        "familiar with",
+        "working with",
+        "understanding of",
+    ],
+    "de": [
+        "erfahrung mit",
+        "erfahrungen mit",
+        "kenntnisse in",
+        "kenntnisse von",
+        "vertraut mit",
+        "umgang mit",
+    ],
+    "fr": [
+        "expérience avec",
+        "expérience en",
+        "connaissance de",
+        "connaissances en",
+        "maîtrise de",
+        "maîtrise du",
+    ],
+    "es": [
+        "experiencia con",
+        "experiencia en",
+        "conocimiento de",
+        "conocimientos de",
+        "conocimientos en",
+        "dominio de",
+        "manejo de",
+    ],
+}
+CONTEXT_WINDOW = 50  # characters after a keyword searched for skills
+CONTEXT_MAX_WORDS = 5  # words after a keyword checked against the skill index
+
+# Per language: one alternation of its keywords and each keyword's rank. No
+# keyword overlaps another, so the alternation finds exactly what separate
+# scans would.
+_CONTEXT_TRIGGERS = {
+    language: (
+        re.compile("|".join(re.escape(keyword) for keyword in keywords)),
+        {keyword: rank for rank, keyword in enumerate(keywords)},
+    )
+    for language, keywords in CONTEXT_KEYWORDS.items()
+}
+_CONTEXT_WORD_RE = re.compile(r'\b[A-Za-z][A-Za-z0-9+#.]*\b')
+
+# Fuzzy lookups remembered per vocabulary entry before the cache starts over
+FUZZY_CACHE_SIZE = 100000
+
+# Common normalizations
+NORMALIZATIONS = {
+    "react.js": "React",
+    "reactjs": "React",
+    "vue.js": "Vue",
+    "vuejs": "Vue",
+    "next.js": "Next.js",
+    "nextjs": "Next.js",
+    "node.js": "Node.js",
+    "nodejs": "Node.js",
+    "javascript": "JavaScript",
+    "typescript": "TypeScript",
+    "postgresql": "PostgreSQL",
+    "mongodb": "MongoDB",
+    "mysql": "MySQL",
+    "aws": "AWS",
+    "gcp": "GCP",
+    "k8s": "Kubernetes",
+}
 
 
 class SkillsExtractor:
     """Extract and categorize skills from job descriptions using NLP"""
 
-    def __init__(self):
-        """Initialize spaCy model and phrase matcher"""
-        print("Loading spaCy model...")
-        self.nlp = spacy.load("en_core_web_lg")
+    def __init__(self, nlp=None):
+        """
+        Initialize spaCy model and phrase matcher.
+
+        Args:
+            nlp: Already loaded pipeline to use instead of loading SPACY_MODEL
+                (e.g. the vocabulary alone, for extraction from stored Docs)
+        """
+        if nlp is None:
+            print("Loading spaCy model...")
+            nlp = spacy.load(SPACY_MODEL)
+        self.nlp = nlp
         self.phrase_matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
         self._initialize_patterns()
+
+        # Other languages get pipelines of their own, loaded on first use. They
+        # share the phrase matcher, which matches on string hashes and so works
+        # for Docs of any vocabulary.
+        self.pipelines = None
+        if settings.MULTILINGUAL_ENABLED:
+            self.pipelines = LanguagePipelines(
+                DEFAULT_LANGUAGE,
+                SPACY_MODEL,
+                self.nlp,
+                parse_language_models(settings.LANGUAGE_MODELS),
+                max_loaded=settings.LANGUAGE_MODEL_CACHE_SIZE,
+                max_memory_mb=settings.LANGUAGE_MODEL_MEMORY_MB,
+                on_load=self._add_patterns,
+            )
+
+        # Edit-distance matches are only trusted for out-of-vocabulary tokens,
+        # which requires a model with word vectors to tell words from typos
+        self.fuzzy_index = FuzzySkillIndex.from_skills_database() if settings.FUZZY_MATCHING_ENABLED else None
+        self._has_vectors = self.nlp.vocab.vectors.n_keys > 0
+        self._fuzzy_caches = {}  # language -> lookups by lexeme (lexeme attributes differ per vocabulary)
+
+        # Count "React Native" once instead of also counting the "React" inside it
+        self.resolve_overlaps = settings.RESOLVE_OVERLAPPING_SKILLS
+
+        self.skill_discovery = None
+        if settings.VECTOR_DISCOVERY_ENABLED and self._has_vectors:
+            self.skill_discovery = SkillDiscovery(self.nlp, threshold=settings.VECTOR_DISCOVERY_THRESHOLD)
         print("Skills extractor initialized successfully!")
 
     def _initialize_patterns(self):
         """Initialize phrase matcher with all skills from database"""
+        self._add_patterns(self.nlp)
+
+        # Match ids are string hashes of the category names
+        self._match_categories = {self.nlp.vocab.strings[category]: category for category in SKILLS_DATABASE}
+
+    def _add_patterns(self, nlp):
+        """Add every skill, as tokenized by a pipeline, to the shared phrase matcher"""
         for category, skills in SKILLS_DATABASE.items():
-            # Create patterns for each skill
-            patterns = [self.nlp.make_doc(skill) for skill in skills]
+            # Patterns another tokenizer splits the same way are already there and add nothing
+            patterns = [nlp.make_doc(skill) for skill in skills]
             self.phrase_matcher.add(category, patterns)
 
-    def extract_skills(self, text: str) -> List[Dict]:
+    def pipeline(self, language: Optional[str] = None):
+        """spaCy pipeline for a language (the default one unless multilingual support is on)"""
+        if self.pipelines is None:
+            return self.nlp
+        return self.pipelines.get(language)
+
+    def model_name(self, language: Optional[str] = None) -> str:
+        """Name of the model that processes a language"""
+        if self.pipelines is None:
+            return SPACY_MODEL
+        return self.pipelines.model_name(language)
+
+    def extract_skills(
+        self,
+        text: str,
+        timer=None,
+        suggestions: Optional[List[Dict]] = None,
+        language: Optional[str] = None,
+    ) -> List[Dict]:
         """
         Extract skills from job description text.
 
         Args:
             text: Job description text
+            timer: Optional StageTimer that receives per-stage timings and counts
+            suggestions: Optional list that receives vector-similarity suggestions
+                for unknown terms (left empty when discovery is disabled)
+            language: Language code selecting the pipeline (default: English)
 
         Returns:
             List of skill dictionaries with name, count, category, and confidence
         """
+        timer = timer or NULL_TIMER
+        nlp = self.pipeline(language)
+
         # Process text with spaCy
-        doc = self.nlp(text)
+        if timer is NULL_TIMER:
+            doc = nlp(text)
+        else:
+            doc = self._run_pipeline_timed(nlp, text, timer)
+
+        return self.extract_from_doc(doc, timer=timer, suggestions=suggestions)
+
+    def extract_skills_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 32,
+        suggestions: Optional[List[List[Dict]]] = None,
+        docs: Optional[List] = None,
+        languages: Optional[List[str]] = None,
+    ) -> List[List[Dict]]:
+        """
+        Extract skills from several texts, running spaCy over them as one stream.
 
-        # 1. Pattern matching (high confidence)
-        pattern_skills = self._find_pattern_matches(doc)
+        Texts in different languages are streamed through their own pipelines,
+        one stream per language.
 
-        # 2. Entity recognition for tech terms (medium confidence)
-        entity_skills = self._extract_entities(doc)
+        Args:
+            texts: Job description texts
+            batch_size: Number of texts spaCy processes per internal batch
+            suggestions: Optional list that receives one suggestions list per text
+            docs: Optional list that receives the processed Doc of each text
+            languages: Optional language code per text (default: English)
 
-        # 3. Contextual extraction (lower confidence)
-        contextual_skills = self._extract_contextual_skills(doc)
+        Returns:
+            One skills list per input text, in input order
+        """
+        groups = {}  # language -> indices of its texts
+        for i, language in enumerate(languages or [None] * len(texts)):
+            groups.setdefault(language if self.pipelines is not None else None, []).append(i)
+
+        skills_lists: List[Optional[List[Dict]]] = [None] * len(texts)
+        text_docs = [None] * len(texts)
+        text_suggestions = [None] * len(texts)
+        for language, indices in groups.items():
+            nlp = self.pipeline(language)
+            for i, doc in zip(indices, nlp.pipe((texts[i] for i in indices), batch_size=batch_size)):
+                text_docs[i] = doc
+                text_suggestions[i] = [] if suggestions is not None else None
+                skills_lists[i] = self.extract_from_doc(doc, suggestions=text_suggestions[i])
+
+        if docs is not None:
+            docs.extend(text_docs)
+        if suggestions is not None:
+            suggestions.extend(text_suggestions)
+        return skills_lists
+
+    def extract_from_doc(self, doc, timer=None, suggestions: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        Run the extraction tiers over an already processed Doc.
 
-        # Merge and deduplicate skills
-        all_skills = self._merge_skills(pattern_skills, entity_skills, contextual_skills)
+        Phrase matcher hits, entities and fuzzy candidates are handled in a
+        single sweep over the tokens, and context-keyword triggers are found
+        with one scan of the text. Every hit goes into one accumulator, which
+        keeps the highest confidence and the category of the hit the
+        tier-by-tier extraction would have seen first.
 
-        # Convert to list format
-        skills_list = []
-        for skill_name, skill_data in all_skills.items():
-            skills_list.append({
-                "name": skill_name,
-                "count": skill_data["count"],
-                "category": skill_data["category"],
-                "confidence": skill_data["confidence"],
-            })
+        Args:
+            doc: spaCy Doc produced by this extractor's pipeline
+            timer: Optional StageTimer that receives per-stage timings and counts
+            suggestions: Optional list that receives vector-similarity suggestions
 
-        # Sort by count (descending) then by confidence (descending)
-        skills_list.sort(key=lambda x: (x["count"], x["confidence"]), reverse=True)
+        Returns:
+            List of skill dictionaries with name, count, category, and confidence
+        """
+        timer = timer or NULL_TIMER
+        timer.add_count("tokens", len(doc))
+        timer.add_count("entities", len(doc.ents))
+
+        found = {}  # name -> [count, category, confidence, rank]
+        hits = Counter()  # tier -> hits
+
+        def add(name: str, category: str, confidence: float, rank: tuple):
+            entry = found.get(name)
+            if entry is None:
+                found[name] = [1, category, confidence, rank]
+                return
+            entry[0] += 1
+            if confidence > entry[2]:
+                entry[2] = confidence
+            if rank < entry[3]:
+                # The category comes from the hit the tiers would have seen first
+                entry[1] = category
+                entry[3] = rank
+
+        with timer.stage("match_phrases"):
+            matches = self.phrase_matcher(doc)
+
+        with timer.stage("scan_tokens"):
+            claimed = self._scan_tokens(doc, matches, add, hits)
+
+        with timer.stage("find_context_triggers"):
+            self._find_contextual_skills(doc, claimed, add, hits)
+
+        timer.add_count("pattern_matches", hits[PATTERN_TIER])
+        timer.add_count("entity_matches", hits[ENTITY_TIER])
+        timer.add_count("contextual_matches", hits[CONTEXT_TIER])
+        if self.fuzzy_index is not None:
+            timer.add_count("fuzzy_matches", hits[FUZZY_TIER])
+
+        # Sort by count (descending) then by confidence (descending); ties keep tier order
+        with timer.stage("emit_skills"):
+            ranked = sorted(found.items(), key=lambda item: (-item[1][0], -item[1][2], item[1][3]))
+            skills_list = [
+                {"name": name, "count": count, "category": category, "confidence": confidence}
+                for name, (count, category, confidence, _) in ranked
+            ]
+
+        # Nearest known skills for candidate terms none of the tiers recognised
+        # (the vectors belong to the default pipeline, so only for its Docs)
+        if suggestions is not None and self.skill_discovery is not None and doc.vocab is self.nlp.vocab:
+            with timer.stage("discover_skills"):
+                suggestions.extend(self.skill_discovery.suggest(doc, skills_list))
+            timer.add_count("suggested_skills", len(suggestions))
 
         return skills_list
 
-    def _find_pattern_matches(self, doc) -> Dict:
-        """Find exact and fuzzy matches using phrase matcher"""
-        skills = {}
-        matches = self.phrase_matcher(doc)
-
-        for match_id, start, end in matches:
-            # Get the matched span
-            span = doc[start:end]
-            skill_name = span.text
-
-            # Normalize skill name (title case)
-            skill_name = self._normalize_skill_name(skill_name)
-
-            # Get category from match_id
-            category = self.nlp.vocab.strings[match_id]
-
-            if skill_name not in skills:
-                skills[skill_name] = {
-                    "count": 0,
-                    "category": category,
-                    "confidence": 0.95,  # High confidence for exact matches
-                }
-            skills[skill_name]["count"] += 1
-
-        return skills
-
-    def _extract_entities(self, doc) -> Dict:
-        """Extract technical entities using NER"""
-        skills = {}
-
-        for ent in doc.ents:
-            # Focus on entities likely to be technical skills
-            if ent.label_ in ["PRODUCT", "ORG", "GPE"]:
-                skill_name = self._normalize_skill_name(ent.text)
-
-                # Check if it matches known skills (case-insensitive)
-                category = get_category_for_skill(skill_name)
-
-                if category != "other":  # Only include if it's a known skill
-                    if skill_name not in skills:
-                        skills[skill_name] = {
-                            "count": 0,
-                            "category": category,
-                            "confidence": 0.75,  # Medium-high confidence
-                        }
-                    skills[skill_name]["count"] += 1
-
-        return skills
-
-    def _extract_contextual_skills(self, doc) -> Dict:
-        """Extract skills from contextual phrases"""
-        skills = {}
-
-        # Keywords that often precede skills
-        skill_keywords = [
-            "experience with",
-            "proficient in",
-            "knowledge of",
-            "expertise in",
-            "skilled in",
-            "familiar with",
-            "working with",
-            "understanding of",
-        ]
+    def _run_pipeline_timed(self, nlp, text: str, timer):
+        """Run a spaCy pipeline one component at a time, timing each"""
+        with timer.stage("spacy.tokenizer"):
+            doc = nlp.make_doc(text)
 
-        text_lower = doc.text.lower()
+        for name, component in nlp.pipeline:
+            with timer.stage(f"spacy.{name}"):
+                doc = component(doc)
+
+        return doc
+
+    def _scan_tokens(self, doc, matches, add, hits: Counter) -> Optional[bytearray]:
+        """
+        Walk the tokens once, handling phrase matcher hits, entities and fuzzy candidates.
+
+        Matcher hits are counted at their first token (the matcher returns
+        them ordered by start), entities once the sweep reaches their last
+        token, and the fuzzy tier looks at tokens no matcher hit covers.
+
+        Returns:
+            Per-token claim flags when overlapping spans are resolved, else None
+        """
+        resolve = self.resolve_overlaps
+        claimed = bytearray(len(doc)) if resolve else None
+        labels = ENTITY_LABELS.get(doc.lang_, OTHER_ENTITY_LABELS)
+        ents = [ent for ent in doc.ents if ent.label_ in labels]
+        fuzzy = self.fuzzy_index is not None
+
+        m = e = 0
+        covered_until = 0  # end of the furthest-reaching matcher hit so far
+        fuzzy_from = 0  # tokens before this were consumed by a two-token fuzzy match
+
+        for i in range(len(doc)):
+            # Matcher hits starting here; nested and repeated spans are all counted
+            # unless overlaps are resolved, which keeps the longest leftmost span
+            if m < len(matches) and matches[m][1] == i:
+                group_start = m
+                while m < len(matches) and matches[m][1] == i:
+                    m += 1
+                group = range(group_start, m)
+                if resolve:
+                    group = [] if claimed[i] else [max(group, key=lambda k: matches[k][2] - i)]
+
+                for k in group:
+                    match_id, start, end = matches[k]
+                    name = self._normalize_skill_name(doc[start:end].text)
+                    add(name, self._match_categories[match_id], PATTERN_CONFIDENCE, (PATTERN_TIER, k))
+                    hits[PATTERN_TIER] += 1
+                    if resolve:
+                        claimed[start:end] = b"\x01" * (end - start)
+
+                covered_until = max(covered_until, max(matches[k][2] for k in range(group_start, m)))
+
+            # Entities end here, so every matcher hit inside them has been seen
+            while e < len(ents) and ents[e].end - 1 <= i:
+                ent = ents[e]
+                e += 1
+                if resolve and claimed.find(1, ent.start, ent.end) != -1:
+                    continue  # Already counted as a phrase match ("React" inside "React Native")
+                name = self._normalize_skill_name(ent.text)
+                category = get_category_for_skill(name)
+                if category == "other":  # Only include known skills
+                    continue
+                add(name, category, ENTITY_CONFIDENCE, (ENTITY_TIER, ent.start))
+                hits[ENTITY_TIER] += 1
+                if resolve:
+                    claimed[ent.start:ent.end] = b"\x01" * (ent.end - ent.start)
+
+            if not fuzzy or i < fuzzy_from or i < covered_until:
+                continue
+            match, pair = self._fuzzy_lookup(doc, i, covered_until, matches[m][1] if m < len(matches) else None)
+            if match is not None:
+                add(self._normalize_skill_name(match.name), match.category, FUZZY_CONFIDENCE, (FUZZY_TIER, i))
+                hits[FUZZY_TIER] += 1
+                if pair:
+                    fuzzy_from = i + 2
+
+        return claimed
+
+    def _fuzzy_lookup(self, doc, i: int, covered_until: int, next_match_start: Optional[int]):
+        """
+        Find an alias ("Postgres"), spacing variant ("Node JS") or misspelling at token i.
 
-        # Find skill mentions near keywords
-        for keyword in skill_keywords:
-            # Find all occurrences of the keyword
-            for match in re.finditer(re.escape(keyword), text_lower):
-                start_idx = match.end()
-                # Look at the next 50 characters
-                context = text_lower[start_idx:start_idx + 50]
-
-                # Extract potential skills (words that might be skills)
-                words = re.findall(r'\b[A-Za-z][A-Za-z0-9+#.]*\b', context)
-
-                for word in words[:5]:  # Limit to first 5 words after keyword
-                    # Check if it's a known skill
-                    category = get_category_for_skill(word)
-                    if category != "other":
-                        skill_name = self._normalize_skill_name(word)
-                        if skill_name not in skills:
-                            skills[skill_name] = {
-                                "count": 0,
-                                "category": category,
-                                "confidence": 0.60,  # Lower confidence for contextual
-                            }
-                        skills[skill_name]["count"] += 1
-
-        return skills
-
-    def _merge_skills(self, *skill_dicts) -> Dict:
-        """Merge multiple skill dictionaries, keeping highest confidence and summing counts"""
-        merged = {}
-
-        for skill_dict in skill_dicts:
-            for skill_name, skill_data in skill_dict.items():
-                if skill_name not in merged:
-                    merged[skill_name] = skill_data.copy()
-                else:
-                    # Sum counts
-                    merged[skill_name]["count"] += skill_data["count"]
-                    # Keep highest confidence
-                    merged[skill_name]["confidence"] = max(
-                        merged[skill_name]["confidence"],
-                        skill_data["confidence"]
-                    )
-
-        return merged
+        Lookups depend only on the lexemes involved, so results are cached per
+        vocabulary entry and repeated words cost a dictionary probe.
+
+        Returns:
+            (FuzzyMatch or None, whether the match spans tokens i and i + 1)
+        """
+        cache = self._fuzzy_caches.get(doc.lang_)
+        if cache is None or len(cache) > FUZZY_CACHE_SIZE:
+            cache = self._fuzzy_caches[doc.lang_] = {}
+
+        token = doc[i]
+        single = cache.get(token.orth)
+        if single is None:
+            if self._is_fuzzy_candidate(token):
+                # Misspellings only for tokens the model does not know as words ("Kubernates", not "scale")
+                has_vectors = self._has_vectors if doc.vocab is self.nlp.vocab else doc.vocab.vectors.n_keys > 0
+                single = (True, self.fuzzy_index.lookup(token.text, fuzzy=has_vectors and token.is_oov))
+            else:
+                single = (False, None)
+            cache[token.orth] = single
+        if not single[0]:
+            return None, False
+
+        # Two-token variants must match exactly once separators are removed
+        j = i + 1
+        if j < len(doc) and j >= covered_until and next_match_start != j:
+            following = doc[j]
+            key = (token.orth, token.whitespace_, following.orth)
+            pair = cache.get(key)
+            if pair is None:
+                candidate = cache.get(following.orth)
+                is_candidate = candidate[0] if candidate is not None else self._is_fuzzy_candidate(following)
+                pair = (self.fuzzy_index.lookup(doc[i:j + 1].text, fuzzy=False) if is_candidate else None,)
+                cache[key] = pair
+            if pair[0] is not None:
+                return pair[0], True
+
+        return single[1], False
+
+    def _find_contextual_skills(self, doc, claimed: Optional[bytearray], add, hits: Counter):
+        """
+        Count known skills among the first words after context keywords.
+
+        One combined pattern finds every keyword of the Doc's language
+        ("experience with", "proficient in", ...) in a single scan; the words
+        in the 50 characters after each keyword are looked up in the skill
+        index.
+        """
+        trigger_re, keyword_ranks = _CONTEXT_TRIGGERS.get(doc.lang_, _CONTEXT_TRIGGERS[DEFAULT_LANGUAGE])
+        text_lower = doc.text.lower()
+        triggers = [
+            (keyword_ranks[trigger.group()], trigger.end())
+            for trigger in trigger_re.finditer(text_lower)
+        ]
+        if not triggers:
+            return
+
+        starts = [token.idx for token in doc] if claimed is not None else None
+
+        # Ordered keyword by keyword, the way the tiered extraction visited them
+        for keyword_rank, window_start in sorted(triggers):
+            context = text_lower[window_start:window_start + CONTEXT_WINDOW]
+            for word_index, word in enumerate(_CONTEXT_WORD_RE.finditer(context)):
+                if word_index == CONTEXT_MAX_WORDS:
+                    break
+                category = SKILL_CATEGORIES.get(word.group())
+                if category is None:
+                    continue
+                if claimed is not None:
+                    first = bisect_right(starts, window_start + word.start()) - 1
+                    last = bisect_right(starts, window_start + word.end() - 1) - 1
+                    if claimed.find(1, max(first, 0), last + 1) != -1:
+                        continue  # Part of a span another tier already counted
+                add(
+                    self._normalize_skill_name(word.group()),
+                    category,
+                    CONTEXT_CONFIDENCE,
+                    (CONTEXT_TIER, keyword_rank, window_start, word_index),
+                )
+                hits[CONTEXT_TIER] += 1
+
+    @staticmethod
+    def _is_fuzzy_candidate(token) -> bool:
+        return not (token.is_punct or token.is_space or token.like_num or token.is_stop) and any(
+            ch.isalpha() for ch in token.text
+        )
 
     def _normalize_skill_name(self, skill_name: str) -> str:
         """Normalize skill name for consistency"""
         # Remove extra whitespace
         skill_name = " ".join(skill_name.split())
-
-        # Handle special cases
-        skill_name_lower = skill_name.lower()
-
-        # Common normalizations
-        normalizations = {
-            "react.js": "React",
-            "reactjs": "React",
-            "vue.js": "Vue",
-            "vuejs": "Vue",
-            "next.js": "Next.js",
-            "nextjs": "Next.js",
-            "node.js": "Node.js",
-            "nodejs": "Node.js",
-            "javascript": "JavaScript",
-            "typescript": "TypeScript",
-            "postgresql": "PostgreSQL",
-            "mongodb": "MongoDB",
-            "mysql": "MySQL",
-            "aws": "AWS",
-            "gcp": "GCP",
-            "k8s": "Kubernetes",
-        }
-
-        return normalizations.get(skill_name_lower, skill_name)
+        return NORMALIZATIONS.get(skill_name.lower(), skill_name)
@@ -0,0 +1,361 @@
+"""
+Skill trend rollups.
+Folds analyzed postings into daily, weekly and monthly counters and answers
+trend questions from those counters.
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session
+
+from app.database import SessionLocal
+from app.models.trends import CategoryRollup, PostingRollup, SkillRollup
+from app.services.job_store import stored_content_hashes
+from app.services.nlp_service import NLPService
+
+GRANULARITIES = ("day", "week", "month")
+
+# Rows per INSERT statement; keeps SQLite under its bound-parameter limit
+UPSERT_CHUNK_SIZE = 100
+
+
+def period_start(day: date, granularity: str) -> date:
+    """Return the first day of the period containing `day`"""
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+
+def _shift_periods(start: date, granularity: str, periods: int) -> date:
+    """Move a period start backwards by a number of periods"""
+    if granularity == "day":
+        return start - timedelta(days=periods)
+    if granularity == "week":
+        return start - timedelta(weeks=periods)
+    months = start.year * 12 + start.month - 1 - periods
+    return date(months // 12, months % 12 + 1, 1)
+
+
+# Rollup reads as fixed statements with bound parameters, so SQLAlchemy
+# compiles each once and asyncpg prepares each once per connection
+# Skills are grouped by their lowercased key; the name shown is the first
+# spelling in sort order ("Python" before "python")
+_TOP_SKILLS_COLUMNS = select(
+    func.min(SkillRollup.skill).label("skill"),
+    func.min(SkillRollup.category).label("category"),
+    func.sum(SkillRollup.postings).label("postings"),
+    func.sum(SkillRollup.mentions).label("mentions"),
+).where(
+    SkillRollup.granularity == "day",
+    SkillRollup.period_start.between(bindparam("start"), bindparam("end")),
+)
+_TOP_SKILLS_ORDER = (func.sum(SkillRollup.postings).desc(), func.sum(SkillRollup.mentions).desc())
+
+TOP_SKILLS = (
+    _TOP_SKILLS_COLUMNS.group_by(SkillRollup.skill_key).order_by(*_TOP_SKILLS_ORDER).limit(bindparam("limit"))
+)
+TOP_SKILLS_IN_CATEGORY = (
+    _TOP_SKILLS_COLUMNS.where(SkillRollup.category == bindparam("category"))
+    .group_by(SkillRollup.skill_key)
+    .order_by(*_TOP_SKILLS_ORDER)
+    .limit(bindparam("limit"))
+)
+WINDOW_POSTINGS = select(func.coalesce(func.sum(PostingRollup.postings), 0)).where(
+    PostingRollup.granularity == "day",
+    PostingRollup.period_start.between(bindparam("start"), bindparam("end")),
+)
+
+
+def _series_statement(model, name_column):
+    return (
+        select(
+            model.period_start,
+            func.sum(model.postings).label("postings"),
+            func.sum(model.mentions).label("mentions"),
+        )
+        .where(
+            model.granularity == bindparam("granularity"),
+            model.period_start >= bindparam("first"),
+            name_column == bindparam("name"),
+        )
+        .group_by(model.period_start)
+    )
+
+
+SKILL_SERIES = _series_statement(SkillRollup, SkillRollup.skill_key)  # name bound lowercased
+CATEGORY_SERIES = _series_statement(CategoryRollup, CategoryRollup.category)
+PERIOD_POSTINGS = select(PostingRollup.period_start, PostingRollup.postings).where(
+    PostingRollup.granularity == bindparam("granularity"),
+    PostingRollup.period_start >= bindparam("first"),
+)
+
+
+def _upsert_counters(db: Session, model, rows: List[Dict], key_columns: List[str], counter_columns: List[str]):
+    """Insert rollup rows, adding to the counters of rows that already exist"""
+    if not rows:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        insert = None
+
+    table = model.__table__
+    for offset in range(0, len(rows), UPSERT_CHUNK_SIZE):
+        chunk = rows[offset:offset + UPSERT_CHUNK_SIZE]
+
+        if insert is None:
+            # Portable fallback: one lookup per row
+            for row in chunk:
+                existing = db.query(model).filter_by(**{c: row[c] for c in key_columns}).one_or_none()
+                if existing is None:
+                    db.add(model(**row))
+                else:
+                    for column in counter_columns:
+                        setattr(existing, column, getattr(existing, column) + row[column])
+            continue
+
+        stmt = insert(table).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={column: table.c[column] + stmt.excluded[column] for column in counter_columns},
+        )
+        db.execute(stmt)
+
+
+def rollup_rows(analyses: List[Dict], analyzed_at: datetime) -> Tuple[int, List[Dict], List[Dict], List[Dict]]:
+    """
+    Aggregate analyses into rollup counter increments.
+
+    Near-duplicate postings (those carrying "duplicate_of") are skipped so
+    reposts do not inflate trends. A skill listed under two spellings in one
+    posting ("Python", "python") counts that posting once, under the first
+    spelling.
+
+    Returns:
+        (postings counted, posting rows, skill rows, category rows), one row
+        per granularity and key
+    """
+    skill_totals = {}  # lowercased skill -> {skill, skill_key, category, postings, mentions}
+    category_totals = {}  # category -> {postings, mentions}
+    postings = 0
+
+    for analysis in analyses:
+        if "duplicate_of" in analysis:
+            continue
+        postings += 1
+
+        categories_in_posting = set()
+        skills_in_posting = set()
+        for skill in analysis["skills"]:
+            key = skill["name"].lower()
+            totals = skill_totals.setdefault(
+                key,
+                {"skill": skill["name"], "skill_key": key, "category": skill["category"], "postings": 0, "mentions": 0},
+            )
+            if key not in skills_in_posting:
+                skills_in_posting.add(key)
+                totals["postings"] += 1
+            totals["mentions"] += skill["count"]
+
+            category = category_totals.setdefault(skill["category"], {"postings": 0, "mentions": 0})
+            category["mentions"] += skill["count"]
+            categories_in_posting.add(skill["category"])
+
+        for category in categories_in_posting:
+            category_totals[category]["postings"] += 1
+
+    if not postings:
+        return 0, [], [], []
+
+    day = analyzed_at.date()
+    skill_rows, category_rows, posting_rows = [], [], []
+    for granularity in GRANULARITIES:
+        start = period_start(day, granularity)
+        posting_rows.append({"granularity": granularity, "period_start": start, "postings": postings})
+        for totals in skill_totals.values():
+            skill_rows.append({"granularity": granularity, "period_start": start, **totals})
+        for category, totals in category_totals.items():
+            category_rows.append({"granularity": granularity, "period_start": start, "category": category, **totals})
+
+    return postings, posting_rows, skill_rows, category_rows
+
+
+def unstored_analyses(analyses: List[Dict], job_descriptions: List[str], stored: Set[str]) -> List[Dict]:
+    """Analyses of postings whose content hash is not among the stored ones"""
+    return [
+        analysis
+        for text, analysis in zip(job_descriptions, analyses)
+        if NLPService.content_key(text) not in stored
+    ]
+
+
+def fold_analyses(
+    db: Session,
+    analyses: List[Dict],
+    analyzed_at: datetime,
+    job_descriptions: Optional[List[str]] = None,
+) -> int:
+    """
+    Fold analysis results into the rollup tables (without committing).
+
+    Args:
+        db: Database session
+        analyses: Analysis dictionaries as returned by NLPService
+        analyzed_at: When the postings were analyzed
+        job_descriptions: Posting texts aligned with analyses; when given,
+            postings already stored in analyzed_jobs (JOB_INDEX_ENABLED) are
+            skipped, so a repeat sent in a later request is counted once
+
+    Returns:
+        Number of postings folded in
+    """
+    if job_descriptions is not None:
+        stored = stored_content_hashes(db, [NLPService.content_key(text) for text in job_descriptions])
+        analyses = unstored_analyses(analyses, job_descriptions, stored)
+
+    postings, posting_rows, skill_rows, category_rows = rollup_rows(analyses, analyzed_at)
+    if not postings:
+        return 0
+
+    _upsert_counters(db, PostingRollup, posting_rows, ["granularity", "period_start"], ["postings"])
+    _upsert_counters(db, SkillRollup, skill_rows, ["granularity", "period_start", "skill_key"], ["postings", "mentions"])
+    _upsert_counters(db, CategoryRollup, category_rows, ["granularity", "period_start", "category"], ["postings", "mentions"])
+
+    return postings
+
+
+def record_analyses(
+    analyses: List[Dict],
+    analyzed_at: Optional[datetime] = None,
+    job_descriptions: Optional[List[str]] = None,
+):
+    """Fold analyses into the rollups in a session of their own (for background tasks)"""
+    db = SessionLocal()
+    try:
+        fold_analyses(db, analyses, analyzed_at or datetime.utcnow(), job_descriptions)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def top_skills(
+    db: Session,
+    days: int = 90,
+    limit: int = 20,
+    category: Optional[str] = None,
+    today: Optional[date] = None,
+) -> Dict:
+    """
+    Return the most frequently required skills over a trailing window.
+
+    Args:
+        db: Database session
+        days: Window length in days, ending today
+        limit: Number of skills to return
+        category: Optional category filter
+        today: Last day of the window (defaults to the current UTC date)
+
+    Returns:
+        Dictionary with the window, total postings and ranked skills
+    """
+    params = top_skills_params(days, limit, category, today)
+    total_postings = db.execute(WINDOW_POSTINGS, params).scalar_one()
+    rows = db.execute(TOP_SKILLS_IN_CATEGORY if category else TOP_SKILLS, params).all()
+    return top_skills_result(params, total_postings, rows)
+
+
+def top_skills_params(days: int, limit: int, category: Optional[str], today: Optional[date]) -> Dict:
+    """Bound parameters of the top skills statements for a trailing window"""
+    end = today or datetime.utcnow().date()
+    return {"start": end - timedelta(days=days - 1), "end": end, "limit": limit, "category": category}
+
+
+def top_skills_result(params: Dict, total_postings: int, rows) -> Dict:
+    """Shape top skills rows into the response dictionary"""
+    skills = [
+        {
+            "name": row.skill,
+            "category": row.category,
+            "postings": row.postings,
+            "mentions": row.mentions,
+            "share": round(row.postings / total_postings * 100, 1) if total_postings else 0.0,
+        }
+        for row in rows
+    ]
+    return {"start": params["start"], "end": params["end"], "total_postings": total_postings, "skills": skills}
+
+
+def series_params(name: str, granularity: str, periods: int, today: Optional[date]) -> Dict:
+    """Bound parameters of the series statements for the periods ending with the current one"""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unknown granularity: {granularity}")
+
+    last = period_start(today or datetime.utcnow().date(), granularity)
+    return {
+        "name": name,
+        "granularity": granularity,
+        "periods": periods,
+        "last": last,
+        "first": _shift_periods(last, granularity, periods - 1),
+    }
+
+
+def series_points(params: Dict, count_rows, total_rows) -> List[Dict]:
+    """Per-period postings, mentions and share, oldest first, zero-filled"""
+    counts = {row.period_start: row for row in count_rows}
+    totals = dict(total_rows)
+
+    points = []
+    for offset in range(params["periods"] - 1, -1, -1):
+        start = _shift_periods(params["last"], params["granularity"], offset)
+        row = counts.get(start)
+        postings = row.postings if row else 0
+        total = totals.get(start, 0)
+        points.append({
+            "period_start": start,
+            "postings": postings,
+            "mentions": row.mentions if row else 0,
+            "total_postings": total,
+            "share": round(postings / total * 100, 1) if total else 0.0,
+        })
+    return points
+
+
+def _series(db: Session, statement, params: Dict) -> List[Dict]:
+    """Per-period postings, mentions and share for one skill or category"""
+    return series_points(params, db.execute(statement, params).all(), db.execute(PERIOD_POSTINGS, params).all())
+
+
+def skill_trend(
+    db: Session,
+    skill: str,
+    granularity: str = "month",
+    periods: int = 12,
+    today: Optional[date] = None,
+) -> List[Dict]:
+    """Return the share of postings requiring a skill in each period (case-insensitive)"""
+    return _series(db, SKILL_SERIES, series_params(skill.lower(), granularity, periods, today))
+
+
+def category_trend(
+    db: Session,
+    category: str,
+    granularity: str = "month",
+    periods: int = 12,
+    today: Optional[date] = None,
+) -> List[Dict]:
+    """Return the share of postings mentioning a skill category in each period"""
+    return _series(db, CATEGORY_SERIES, series_params(category, granularity, periods, today))
@@ -0,0 +1,347 @@
+"""
+Extraction performance suite for SkillsExtractor and NLPService.
+
+Runs a deterministic synthetic corpus (see benchmarks.corpus) through the
+extraction pipeline and measures:
+
+- startup: importing the NLP service and loading the model and matchers
+- stages: per-stage latency from the profiled path (StageTimer)
+- latency: end-to-end NLPService.analyze_job_description per posting
+- throughput: NLPService.analyze_job_descriptions over batches
+- memory: peak RSS of the process and peak traced allocations of one batch pass
+
+Results are written as JSON. Given a baseline (a previous result file), each
+metric is compared against it and the run exits non-zero when a headline
+metric (startup, total and end-to-end latency, throughput, peak RSS)
+regresses by more than the tolerance. The suite also records a digest of the extracted skills,
+so a change that alters extraction output is reported alongside its timings.
+
+Usage:
+    python -m benchmarks.bench_extraction --output bench.json
+    python -m benchmarks.bench_extraction --baseline bench.json --tolerance 0.1
+"""
+
+import argparse
+import hashlib
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from benchmarks.corpus import generate_corpus
+
+# Metric direction for baseline comparison
+LOWER_IS_BETTER = ("_ms", "_mb")
+HIGHER_IS_BETTER = ("per_second",)
+
+# Headline metrics that fail the run when they regress; individual stages are
+# too short to gate on reliably and are reported for diagnosis only
+GATED_METRICS = (
+    "startup.total_ms",
+    "stages.total.",
+    "latency.",
+    "throughput.postings_per_second",
+    "memory.peak_rss_mb",
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(values_ms: List[float]) -> Dict[str, float]:
+    """Mean and tail percentiles of a list of millisecond timings"""
+    return {
+        "mean_ms": round(statistics.fmean(values_ms), 3),
+        "p50_ms": round(percentile(values_ms, 50), 3),
+        "p95_ms": round(percentile(values_ms, 95), 3),
+        "p99_ms": round(percentile(values_ms, 99), 3),
+    }
+
+
+def measure_startup() -> Tuple[object, Dict]:
+    """Time importing the NLP service and building its extractor (model, matchers, indexes)"""
+    start = time.perf_counter()
+    from app.services.nlp_service import NLPService
+    imported = time.perf_counter()
+    service = NLPService()
+    loaded = time.perf_counter()
+    return service, {
+        "import_ms": round((imported - start) * 1000, 3),
+        "load_ms": round((loaded - imported) * 1000, 3),
+        "total_ms": round((loaded - start) * 1000, 3),
+    }
+
+
+def measure_stages(service, texts: List[str]) -> Dict:
+    """Per-stage latency of the profiled single-posting path"""
+    per_stage: Dict[str, List[float]] = {}
+    totals = []
+    for text in texts:
+        debug = service.analyze_job_description(text, profile=True)["debug"]
+        totals.append(debug["total_ms"])
+        for stage, ms in debug["stages"].items():
+            per_stage.setdefault(stage, []).append(ms)
+
+    return {
+        "total": summarize(totals),
+        **{stage: summarize(values) for stage, values in per_stage.items()},
+    }
+
+
+def measure_latency(service, texts: List[str]) -> Dict:
+    """End-to-end latency of NLPService.analyze_job_description, one posting at a time"""
+    timings = []
+    for text in texts:
+        start = time.perf_counter()
+        service.analyze_job_description(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return summarize(timings)
+
+
+def measure_throughput(service, texts: List[str], batch_size: int, repeat: int) -> Dict:
+    """Batch throughput of NLPService.analyze_job_descriptions (best of `repeat` passes)"""
+    chars = sum(len(text) for text in texts)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(0, len(texts), batch_size):
+            service.analyze_job_descriptions(texts[i:i + batch_size])
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        "batch_size": batch_size,
+        "postings_per_second": round(len(texts) / best, 2),
+        "chars_per_second": round(chars / best, 1),
+        "pass_ms": round(best * 1000, 3),
+    }
+
+
+def measure_memory(service, texts: List[str], batch_size: int) -> Dict:
+    """Peak RSS of the process and peak traced allocations of one batch pass"""
+    tracemalloc.start()
+    for i in range(0, len(texts), batch_size):
+        service.analyze_job_descriptions(texts[i:i + batch_size])
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_bytes = max_rss if sys.platform == "darwin" else max_rss * 1024
+    return {
+        "peak_rss_mb": round(rss_bytes / (1024 * 1024), 1),
+        "batch_peak_traced_mb": round(traced_peak / (1024 * 1024), 1),
+    }
+
+
+def output_digest(service, corpus: List[Dict]) -> Dict:
+    """Digest of extracted skills, plus recall against the skills the generator planted"""
+    results = service.analyze_job_descriptions([posting["text"] for posting in corpus])
+    digest = hashlib.sha256()
+    planted = found = 0
+    for posting, result in zip(corpus, results):
+        names = sorted((skill["name"], skill["category"], skill["count"]) for skill in result["skills"])
+        digest.update(json.dumps(names).encode("utf-8"))
+        extracted = {skill["name"].lower() for skill in result["skills"]}
+        planted += len(posting["skills"])
+        found += sum(1 for skill in posting["skills"] if skill.lower() in extracted)
+
+    return {
+        "skills_digest": digest.hexdigest()[:16],
+        "skills_found": sum(result["total_skills_found"] for result in results),
+        "planted_recall": round(found / planted, 4) if planted else 0.0,
+    }
+
+
+def _reset_caches(service):
+    """Forget near-duplicates and cached paragraphs so every measurement sees cold input"""
+    if service.near_duplicates is not None:
+        service.near_duplicates = service._new_duplicate_index(service.near_duplicates.max_size)
+    if service.paragraph_cache is not None:
+        service.paragraph_cache = type(service.paragraph_cache)(
+            max_entries=service.paragraph_cache.max_entries,
+            min_length=service.paragraph_cache.min_length,
+        )
+
+
+def run(args) -> Dict:
+    """Run every measurement and return the result document"""
+    service, startup = measure_startup()
+    from app.config import settings
+
+    corpus = generate_corpus(args.postings, args.seed, args.words, args.skill_density, args.boilerplate_ratio)
+    texts = [posting["text"] for posting in corpus]
+
+    # Warm up lazily built state (vocab, lexeme caches) outside the measurements
+    service.analyze_job_descriptions(texts[:min(len(texts), args.batch_size)])
+
+    metrics = {"startup": startup}
+    _reset_caches(service)
+    metrics["stages"] = measure_stages(service, texts[:args.stage_postings])
+    _reset_caches(service)
+    metrics["latency"] = measure_latency(service, texts)
+    _reset_caches(service)
+    metrics["throughput"] = measure_throughput(service, texts, args.batch_size, args.repeat)
+    _reset_caches(service)
+    metrics["memory"] = measure_memory(service, texts, args.batch_size)
+    _reset_caches(service)
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "corpus": {
+            "postings": args.postings,
+            "seed": args.seed,
+            "words": args.words,
+            "skill_density": args.skill_density,
+            "boilerplate_ratio": args.boilerplate_ratio,
+            "chars": sum(len(text) for text in texts),
+        },
+        "config": {
+            "FUZZY_MATCHING_ENABLED": settings.FUZZY_MATCHING_ENABLED,
+            "VECTOR_DISCOVERY_ENABLED": settings.VECTOR_DISCOVERY_ENABLED,
+            "SECTION_SEGMENTATION_ENABLED": settings.SECTION_SEGMENTATION_ENABLED,
+            "PARAGRAPH_CACHE_ENABLED": settings.PARAGRAPH_CACHE_ENABLED,
+            "NEAR_DUPLICATE_DETECTION_ENABLED": settings.NEAR_DUPLICATE_DETECTION_ENABLED,
+        },
+        "output": output_digest(service, corpus),
+        "metrics": metrics,
+    }
+
+
+def _flatten(metrics: Dict, prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in metrics.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = value
+    return flat
+
+
+def compare(result: Dict, baseline: Dict, tolerance: float) -> List[Dict]:
+    """
+    Compare a result against a baseline.
+
+    Args:
+        result: Result document of this run
+        baseline: Result document of a previous run
+        tolerance: Allowed relative change of a gated metric in the bad direction (0.1 = 10%)
+
+    Returns:
+        One row per metric present in both runs (metric, baseline, current,
+        change, regressed)
+    """
+    current, previous = _flatten(result["metrics"]), _flatten(baseline["metrics"])
+    rows = []
+    for metric, value in current.items():
+        before = previous.get(metric)
+        if before is None or metric.endswith("batch_size"):
+            continue
+        change = (value - before) / before if before else 0.0
+        if not metric.startswith(GATED_METRICS):
+            regressed = False
+        elif metric.endswith(LOWER_IS_BETTER):
+            regressed = change > tolerance
+        elif metric.endswith(HIGHER_IS_BETTER):
+            regressed = change < -tolerance
+        else:
+            regressed = False
+        rows.append({
+            "metric": metric,
+            "baseline": before,
+            "current": value,
+            "change": round(change, 4),
+            "regressed": regressed,
+        })
+    return rows
+
+
+def print_report(result: Dict, comparison: Optional[List[Dict]]):
+    """Human-readable summary on stderr (JSON goes to --output or stdout)"""
+    out = sys.stderr
+    corpus = result["corpus"]
+    print(
+        f"corpus: {corpus['postings']} postings, {corpus['chars']:,} chars "
+        f"(seed {corpus['seed']}, ~{corpus['words']} words, density {corpus['skill_density']}, "
+        f"boilerplate {corpus['boilerplate_ratio']})",
+        file=out,
+    )
+    print(f"output: {result['output']}", file=out)
+    rows = comparison or [
+        {"metric": metric, "current": value}
+        for metric, value in _flatten(result["metrics"]).items()
+    ]
+    for row in rows:
+        line = f"  {row['metric']:<40} {row['current']:>14,.3f}"
+        if "baseline" in row:
+            line += f"  baseline {row['baseline']:>14,.3f}  {row['change']:+8.1%}"
+            if row["regressed"]:
+                line += "  REGRESSION"
+        print(line, file=out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--postings", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--words", type=int, default=400, help="Approximate words per posting")
+    parser.add_argument("--skill-density", type=float, default=0.04, help="Skill mentions per content word")
+    parser.add_argument("--boilerplate-ratio", type=float, default=0.3, help="Share of words in boilerplate sections")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--stage-postings", type=int, default=50, help="Postings run through the profiled path")
+    parser.add_argument("--repeat", type=int, default=3, help="Throughput passes (best is reported)")
+    parser.add_argument("--output", help="Write the JSON result here instead of stdout")
+    parser.add_argument("--baseline", help="Result JSON of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative regression per metric")
+    args = parser.parse_args()
+
+    result = run(args)
+
+    comparison = None
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("corpus", {}).get("seed") != result["corpus"]["seed"] or \
+                baseline.get("corpus", {}).get("postings") != result["corpus"]["postings"]:
+            print("warning: baseline was generated from a different corpus", file=sys.stderr)
+        comparison = compare(result, baseline, args.tolerance)
+        result["comparison"] = {
+            "baseline_created_at": baseline.get("created_at"),
+            "tolerance": args.tolerance,
+            "output_changed": baseline.get("output", {}).get("skills_digest") != result["output"]["skills_digest"],
+            "regressions": [row["metric"] for row in comparison if row["regressed"]],
+        }
+        if result["comparison"]["regressions"]:
+            exit_code = 1
+
+    print_report(result, comparison)
+    if args.baseline and result["comparison"]["output_changed"]:
+        print("note: extracted skills differ from the baseline", file=sys.stderr)
+
+    document = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(document + "\n")
+    else:
+        print(document)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
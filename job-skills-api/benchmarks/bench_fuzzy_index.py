@@ -0,0 +1,99 @@
+"""
+Throughput benchmark for the fuzzy skill index.
+
+Compares deletion-neighborhood lookups against a linear edit-distance scan
+over every known skill, on a deterministic mix of exact skills, aliases,
+misspellings and ordinary words.
+
+Usage:
+    python -m benchmarks.bench_fuzzy_index [--tokens 20000] [--seed 7]
+"""
+
+import argparse
+import random
+import string
+import time
+
+from app.core.fuzzy_index import FuzzySkillIndex, compact, edit_distance
+from app.core.skills_database import SKILL_ALIASES, get_all_skills
+
+NOISE_WORDS = [
+    "experience", "team", "building", "scalable", "services", "customers",
+    "collaborate", "product", "engineering", "design", "scale", "ownership",
+    "communication", "delivery", "platform", "reliable", "growth", "systems",
+]
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    """Apply one random edit (substitution, deletion, insertion or transposition)"""
+    if len(word) < 3:
+        return word
+    i = rng.randrange(len(word) - 1)
+    edit = rng.choice("sdit")
+    if edit == "s":
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1:]
+    if edit == "d":
+        return word[:i] + word[i + 1:]
+    if edit == "i":
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def make_tokens(count: int, seed: int):
+    rng = random.Random(seed)
+    skills = get_all_skills()
+    aliases = list(SKILL_ALIASES)
+    tokens = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.25:
+            tokens.append(rng.choice(skills))
+        elif kind < 0.35:
+            tokens.append(rng.choice(aliases))
+        elif kind < 0.55:
+            tokens.append(misspell(rng.choice(skills), rng))
+        else:
+            tokens.append(rng.choice(NOISE_WORDS))
+    return tokens
+
+
+def linear_lookup(keys, term: str, limit: int = 2):
+    """Baseline: bounded edit distance against every key"""
+    key = compact(term)
+    best = None
+    for candidate in keys:
+        distance = edit_distance(key, candidate, limit)
+        if distance <= limit and (best is None or distance < best[1]):
+            best = (candidate, distance)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=20000)
+    parser.add_argument("--baseline-tokens", type=int, default=1000, help="Tokens for the (slow) linear scan")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = FuzzySkillIndex.from_skills_database()
+    build_seconds = time.perf_counter() - start
+    print(f"index build: {build_seconds * 1000:.1f} ms ({len(index)} keys)")
+
+    tokens = make_tokens(args.tokens, args.seed)
+    start = time.perf_counter()
+    hits = sum(1 for token in tokens if index.lookup(token) is not None)
+    elapsed = time.perf_counter() - start
+    print(f"index lookup: {len(tokens) / elapsed:,.0f} tokens/s, {elapsed / len(tokens) * 1e6:.1f} us/token, {hits} hits")
+
+    keys = list(index._exact)
+    sample = tokens[:args.baseline_tokens]
+    start = time.perf_counter()
+    for token in sample:
+        linear_lookup(keys, token)
+    elapsed = time.perf_counter() - start
+    print(f"linear scan:  {len(sample) / elapsed:,.0f} tokens/s, {elapsed / len(sample) * 1e6:.1f} us/token")
+
+
+if __name__ == "__main__":
+    main()
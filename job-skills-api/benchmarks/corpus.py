@@ -0,0 +1,185 @@
+"""
+Deterministic synthetic job-description generator.
+
+Postings are assembled from skills in SKILLS_DATABASE, requirement and
+responsibility templates, and company boilerplate ("About us", benefits, EEO
+statements). Length, skill density and boilerplate ratio are configurable, and
+the same seed always produces the same corpus, so benchmark runs on different
+commits measure the same input.
+
+Usage:
+    python -m benchmarks.corpus --count 3 --words 300 --skill-density 0.05
+"""
+
+import argparse
+import random
+from typing import Dict, List
+
+from app.core.skills_database import SKILLS_DATABASE
+
+TITLES = [
+    "Software Engineer", "Senior Backend Engineer", "Data Engineer", "Frontend Developer",
+    "Machine Learning Engineer", "DevOps Engineer", "Full Stack Developer", "Platform Engineer",
+    "Site Reliability Engineer", "Mobile Developer", "Data Scientist", "Security Engineer",
+]
+
+REQUIREMENT_TEMPLATES = [
+    "{years}+ years of professional experience with {skill}",
+    "Strong knowledge of {skill} and {skill2}",
+    "Hands-on experience building production systems with {skill}",
+    "Familiarity with {skill} is a plus",
+    "Solid understanding of {skill} in a team setting",
+    "Experience designing and operating services on {skill}",
+]
+
+RESPONSIBILITY_SENTENCES = [
+    "Design, build and maintain services that handle millions of requests per day.",
+    "Collaborate with product managers and designers to ship features our customers love.",
+    "Own features end to end, from technical design through rollout and monitoring.",
+    "Review code, mentor teammates and help raise the engineering bar across the team.",
+    "Improve the reliability, performance and observability of our platform.",
+    "Participate in an on-call rotation shared fairly across the team.",
+    "Write clear technical documentation and share knowledge with other teams.",
+    "Break down ambiguous problems into well-scoped milestones.",
+]
+
+ABOUT_SENTENCES = [
+    "We are a fast-growing company on a mission to make hiring fair and transparent.",
+    "Founded by a team of former engineers, we now serve customers in over forty countries.",
+    "Our culture values curiosity, ownership and kindness above everything else.",
+    "We are backed by leading investors and have been profitable for three years.",
+    "Our offices are located downtown, and most teams work in a hybrid setup.",
+]
+
+BENEFIT_SENTENCES = [
+    "Competitive salary and meaningful equity in a growing company.",
+    "Comprehensive medical, dental and vision insurance for you and your dependents.",
+    "Generous parental leave and flexible working hours.",
+    "A yearly learning budget for conferences, courses and books.",
+    "Home office stipend and the latest hardware of your choice.",
+]
+
+LEGAL_SENTENCES = [
+    "We are an equal opportunity employer and value diversity at our company.",
+    "We do not discriminate on the basis of race, religion, color, national origin, gender, "
+    "sexual orientation, age, marital status, veteran status, or disability status.",
+    "We will ensure that individuals with disabilities are provided reasonable accommodation "
+    "to participate in the job application or interview process.",
+]
+
+# Every skill once, in a stable order (some skills are listed under two categories)
+ALL_SKILLS: List[str] = list(dict.fromkeys(skill for skills in SKILLS_DATABASE.values() for skill in skills))
+
+
+def _words(lines: List[str]) -> int:
+    return sum(len(line.split()) for line in lines)
+
+
+def _fill(rng: random.Random, sentences: List[str], words: int) -> List[str]:
+    """Draw sentences until they add up to roughly `words` words"""
+    lines = []
+    while _words(lines) < words:
+        lines.append(rng.choice(sentences))
+    return lines
+
+
+def generate_posting(
+    rng: random.Random,
+    words: int = 400,
+    skill_density: float = 0.04,
+    boilerplate_ratio: float = 0.3,
+) -> Dict:
+    """
+    Generate one synthetic posting.
+
+    Args:
+        rng: Random generator (seeded by the caller for reproducibility)
+        words: Approximate posting length in words
+        skill_density: Skill mentions per word in the skill-bearing part
+        boilerplate_ratio: Share of words spent on about/benefits/legal sections
+
+    Returns:
+        Dictionary with title, text and the skills mentioned (ground truth)
+    """
+    boilerplate_words = int(words * boilerplate_ratio)
+    content_words = words - boilerplate_words
+    mentions = max(1, round(content_words * skill_density))
+
+    # Requirements carry skill mentions; responsibilities pad the content part
+    skills = [rng.choice(ALL_SKILLS) for _ in range(mentions)]
+    requirements = []
+    remaining = list(skills)
+    while remaining:
+        template = rng.choice(REQUIREMENT_TEMPLATES)
+        skill = remaining.pop()
+        if "{skill2}" in template:
+            if not remaining:
+                template = REQUIREMENT_TEMPLATES[0]
+            else:
+                requirements.append(f"- {template.format(skill=skill, skill2=remaining.pop(), years=rng.randint(2, 8))}")
+                continue
+        requirements.append(f"- {template.format(skill=skill, years=rng.randint(2, 8))}")
+
+    responsibilities = _fill(rng, RESPONSIBILITY_SENTENCES, content_words - _words(requirements))
+
+    lines = [rng.choice(TITLES)]
+    if boilerplate_words:
+        lines += ["About Us"] + _fill(rng, ABOUT_SENTENCES, boilerplate_words // 2)
+    lines += ["What you'll do:"] + [f"- {sentence}" for sentence in responsibilities]
+    lines += ["Requirements:"] + requirements
+    if boilerplate_words:
+        lines += ["Benefits"] + _fill(rng, BENEFIT_SENTENCES, boilerplate_words // 4)
+        lines += ["Equal Opportunity"] + _fill(rng, LEGAL_SENTENCES, boilerplate_words // 4)
+
+    return {"title": lines[0], "text": "\n".join(lines), "skills": sorted(set(skills))}
+
+
+def generate_corpus(
+    count: int,
+    seed: int = 42,
+    words: int = 400,
+    skill_density: float = 0.04,
+    boilerplate_ratio: float = 0.3,
+) -> List[Dict]:
+    """
+    Generate a reproducible corpus of synthetic postings.
+
+    Args:
+        count: Number of postings
+        seed: Random seed; the same arguments always yield the same corpus
+        words: Approximate posting length in words (varies +/- 25% per posting)
+        skill_density: Skill mentions per word in the skill-bearing part
+        boilerplate_ratio: Share of words spent on about/benefits/legal sections
+
+    Returns:
+        List of postings (title, text, skills)
+    """
+    rng = random.Random(seed)
+    return [
+        generate_posting(
+            rng,
+            words=max(50, int(words * rng.uniform(0.75, 1.25))),
+            skill_density=skill_density,
+            boilerplate_ratio=boilerplate_ratio,
+        )
+        for _ in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--skill-density", type=float, default=0.04)
+    parser.add_argument("--boilerplate-ratio", type=float, default=0.3)
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.count, args.seed, args.words, args.skill_density, args.boilerplate_ratio)
+    for posting in corpus:
+        print(posting["text"])
+        print(f"\n[{len(posting['text'].split())} words, skills: {', '.join(posting['skills'])}]\n")
+
+
+if __name__ == "__main__":
+    main()
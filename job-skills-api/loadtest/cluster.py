@@ -0,0 +1,187 @@
+"""
+Multi-process check of cluster mode.
+
+Starts several app nodes on local ports with CLUSTER_ENABLED, then:
+
+1. sends every posting to two random nodes and checks both answers come from
+   the same owner, the one the hash ring predicts;
+2. stops one node and checks its postings are processed locally by whichever
+   node receives them, while every other posting keeps its owner;
+3. removes the stopped node from the survivors' rings and checks only its
+   postings moved.
+
+Also reports how many keys a join and a leave remap on the ring itself.
+Exits with status 1 if any check fails.
+
+Usage:
+    python -m loadtest.cluster --nodes 3 --postings 60
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+from collections import Counter
+from typing import Dict, List
+
+import httpx
+
+from app.core.hash_ring import HashRing
+from app.services.cluster import NODE_HEADER, SECRET_HEADER
+from app.services.nlp_service import NLPService
+from benchmarks.corpus import generate_corpus
+from loadtest.run import start_process, stop_process, wait_healthy
+
+ANALYZE = "/api/v1/analysis/analyze"
+CLUSTER_SECRET = "loadtest-cluster-secret"
+
+
+async def wait_converged(client: httpx.AsyncClient, nodes: List[str], timeout: float):
+    """Wait until every node has seen all of its peers pass a health check"""
+    deadline = asyncio.get_running_loop().time() + timeout
+    while True:
+        statuses = [(await client.get(f"{node}/api/v1/cluster/status")).json() for node in nodes]
+        if all(peer["healthy"] for status in statuses for peer in status["nodes"]):
+            return
+        if asyncio.get_running_loop().time() > deadline:
+            raise RuntimeError("nodes did not see each other as healthy in time")
+        await asyncio.sleep(0.25)
+
+
+async def send_all(client: httpx.AsyncClient, entries: List[str], texts: List[str], rng: random.Random) -> List[Dict]:
+    """Send each posting to a random entry node; record who served it"""
+    async def send(text: str) -> Dict:
+        entry = rng.choice(entries)
+        response = await client.post(entry + ANALYZE, json={"job_description": text})
+        return {"entry": entry, "status": response.status_code, "node": response.headers.get(NODE_HEADER)}
+
+    return await asyncio.gather(*(send(text) for text in texts))
+
+
+def ring_remapping(nodes: List[str], replicas: int, keys: int = 10000) -> Dict[str, float]:
+    """Share of keys that change owner when a node joins or leaves"""
+    sample = [f"key-{i}" for i in range(keys)]
+    ring = HashRing(nodes, replicas=replicas)
+    before = [ring.node_for(key) for key in sample]
+
+    ring.add("http://joining-node")
+    joined = [ring.node_for(key) for key in sample]
+    ring.remove("http://joining-node")
+    ring.remove(nodes[0])
+    left = [ring.node_for(key) for key in sample]
+
+    return {
+        "join_moved": sum(a != b for a, b in zip(before, joined)) / keys,
+        "join_ideal": 1 / (len(nodes) + 1),
+        "leave_moved": sum(a != b for a, b in zip(before, left)) / keys,
+        "leave_ideal": 1 / len(nodes),
+        "owner_shares": {node: round(share / keys, 3) for node, share in Counter(before).items()},
+    }
+
+
+async def run(args) -> bool:
+    nodes = [f"http://127.0.0.1:{args.base_port + i}" for i in range(args.nodes)]
+    ring = HashRing(nodes, replicas=args.replicas)
+    rng = random.Random(args.seed)
+    texts = [posting["text"] for posting in generate_corpus(args.postings, seed=args.seed, words=args.words)]
+    expected = [ring.node_for(NLPService.content_key(text)) for text in texts]
+    failures = []
+
+    processes = {}
+    try:
+        for node in nodes:
+            processes[node] = start_process(
+                ["-m", "uvicorn", "app.main:app", "--port", node.rsplit(":", 1)[1], "--log-level", "warning"],
+                {
+                    "CLUSTER_ENABLED": "true",
+                    "CLUSTER_NODES": ",".join(nodes),
+                    "CLUSTER_SELF_URL": node,
+                    "CLUSTER_VIRTUAL_NODES": str(args.replicas),
+                    "CLUSTER_HEALTH_INTERVAL": str(args.health_interval),
+                    "CLUSTER_SECRET": CLUSTER_SECRET,
+                },
+            )
+        for node in nodes:
+            await wait_healthy(f"{node}/health", args.startup_timeout)
+
+        async with httpx.AsyncClient(timeout=args.timeout) as client:
+            await wait_converged(client, nodes, args.startup_timeout)
+
+            # 1. Affinity: two sends per posting, same owner both times
+            first = await send_all(client, nodes, texts, rng)
+            second = await send_all(client, nodes, texts, rng)
+            mismatched = sum(
+                a["node"] != want or b["node"] != want for a, b, want in zip(first, second, expected)
+            )
+            errors = sum(r["status"] != 200 for r in first + second)
+            print(f"affinity: {len(texts)} postings x2, {mismatched} served off-owner, {errors} errors")
+            print("  served per node:", dict(Counter(r["node"] for r in first)))
+            if mismatched or errors:
+                failures.append("affinity")
+
+            # 2. Unhealthy owner: its postings fall back to the receiving node
+            down = nodes[-1]
+            stop_process(processes.pop(down))
+            await asyncio.sleep(args.health_interval * 2 + 0.5)
+            survivors = nodes[:-1]
+            after = await send_all(client, survivors, texts, rng)
+            wrong = sum(
+                r["status"] != 200 or r["node"] != (r["entry"] if want == down else want)
+                for r, want in zip(after, expected)
+            )
+            print(f"fallback: {sum(want == down for want in expected)} postings owned by {down}, {wrong} routed wrongly")
+            if wrong:
+                failures.append("fallback")
+
+            # 3. Leave: only the departed node's postings change owner
+            for node in survivors:
+                response = await client.post(
+                    f"{node}/api/v1/cluster/leave", json={"url": down}, headers={SECRET_HEADER: CLUSTER_SECRET}
+                )
+                response.raise_for_status()
+            ring.remove(down)
+            after_leave = await send_all(client, survivors, texts, rng)
+            moved = sum(r["node"] != want for r, want in zip(after_leave, expected))
+            unexpected = sum(
+                r["node"] != ring.node_for(NLPService.content_key(text))
+                for r, text in zip(after_leave, texts)
+            )
+            print(f"leave: {moved} postings changed owner, {unexpected} not on their new owner")
+            if unexpected or moved != sum(want == down for want in expected):
+                failures.append("leave")
+    finally:
+        for process in processes.values():
+            stop_process(process)
+
+    remap = ring_remapping(nodes, args.replicas)
+    print(
+        f"ring: join moves {remap['join_moved']:.1%} of keys (ideal {remap['join_ideal']:.1%}), "
+        f"leave moves {remap['leave_moved']:.1%} (ideal {remap['leave_ideal']:.1%})"
+    )
+    print("  key shares:", remap["owner_shares"])
+
+    if failures:
+        print("FAILED:", ", ".join(failures))
+    return not failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=3)
+    parser.add_argument("--base-port", type=int, default=8781)
+    parser.add_argument("--postings", type=int, default=60)
+    parser.add_argument("--words", type=int, default=200)
+    parser.add_argument("--replicas", type=int, default=160, help="Virtual nodes per node")
+    parser.add_argument("--health-interval", type=float, default=1.0)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    if args.nodes < 2:
+        parser.error("--nodes must be at least 2")
+    sys.exit(0 if asyncio.run(run(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+"""
+End-to-end load harness for the API.
+
+Starts the stand-in job boards (loadtest.stand_in_boards) and the app under
+uvicorn or pre-fork mode, then drives a weighted mix of /analyze, /batch and
+/fetch-job requests at a fixed arrival rate (open loop: requests are sent on
+schedule whether or not earlier ones finished, so overload shows up as
+latency and errors instead of a silently lower rate). /fetch-job URLs point at
+Greenhouse, Lever and generic career pages, which the app fetches from the
+stand-in through FETCH_HOST_OVERRIDES.
+
+Reports p50/p95/p99 latency, throughput and error rates per endpoint, plus a
+per-interval timeline of request rate, latency and the server's CPU and
+memory (all processes of the server, summed; Linux only).
+
+Usage:
+    python -m loadtest.run --rate 20 --duration 60 --mix analyze=6,batch=1,fetch=3
+    python -m loadtest.run --server prefork --workers 4 --upstream-latency-ms 200 --output load.json
+    python -m loadtest.run --app-url http://127.0.0.1:8000 --app-pid 12345   # already running
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import subprocess
+import sys
+import time
+from collections import Counter
+from typing import Dict, List
+
+import httpx
+
+from app.core.memory import read_memory_usage
+from benchmarks.bench_extraction import percentile
+from benchmarks.corpus import generate_corpus
+
+ENDPOINTS = {
+    "analyze": "/api/v1/analysis/analyze",
+    "batch": "/api/v1/analysis/batch",
+    "fetch": "/api/v1/analysis/fetch-job",
+}
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+# ---------------------------------------------------------------------------
+# Processes
+# ---------------------------------------------------------------------------
+
+def start_process(args: List[str], env: Dict[str, str]) -> subprocess.Popen:
+    """Start a server in its own process group so it can be stopped with its workers"""
+    return subprocess.Popen(
+        [sys.executable, *args],
+        env={**os.environ, **env},
+        start_new_session=True,
+    )
+
+
+def stop_process(process: subprocess.Popen):
+    """Stop a server and its workers"""
+    if process.poll() is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=15)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+async def wait_healthy(url: str, timeout: float):
+    """Poll a health URL until it answers 200"""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.25)
+    raise RuntimeError(f"{url} did not become healthy within {timeout:.0f}s")
+
+
+def process_tree(pid: int) -> List[int]:
+    """A process and all its descendants, from /proc"""
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, []))
+    return tree
+
+
+def cpu_seconds(pid: int) -> float:
+    """User plus system CPU time of one process"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return 0.0
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+class ResourceSampler:
+    """Periodically sample CPU and memory of a server's process tree"""
+
+    def __init__(self, pid: int, interval: float):
+        self.pid = pid
+        self.interval = interval
+        self.samples: List[Dict] = []
+        self._cpu: Dict[int, float] = {}
+
+    def sample(self, elapsed: float):
+        pids = process_tree(self.pid)
+        cpu = {pid: cpu_seconds(pid) for pid in pids}
+        # Only count CPU used since the previous sample by processes seen both times
+        cpu_delta = sum(cpu[pid] - self._cpu[pid] for pid in cpu if pid in self._cpu)
+        previous = self.samples[-1]["t"] if self.samples else None
+        self._cpu = cpu
+
+        memory = [usage for usage in (read_memory_usage(pid) for pid in pids) if usage]
+        self.samples.append({
+            "t": round(elapsed, 2),
+            "processes": len(pids),
+            "cpu_percent": round(cpu_delta / (elapsed - previous) * 100, 1) if previous is not None else None,
+            "rss_mb": round(sum(usage["rss"] for usage in memory) / 2 ** 20, 1),
+            # PSS splits pages shared by pre-fork workers, so it does not double count the model
+            "pss_mb": round(sum(usage["pss"] for usage in memory) / 2 ** 20, 1),
+        })
+
+    async def run(self, started: float, stop: asyncio.Event):
+        while not stop.is_set():
+            self.sample(time.perf_counter() - started)
+            try:
+                await asyncio.wait_for(stop.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+        self.sample(time.perf_counter() - started)
+
+
+# ---------------------------------------------------------------------------
+# Load generation
+# ---------------------------------------------------------------------------
+
+class RequestFactory:
+    """Build request bodies for each endpoint from a synthetic corpus"""
+
+    def __init__(self, seed: int, batch_size: int, corpus_size: int, words: int):
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.texts = [posting["text"] for posting in generate_corpus(corpus_size, seed=seed, words=words)]
+        self._next_id = 0
+
+    def body(self, endpoint: str) -> Dict:
+        if endpoint == "analyze":
+            return {"job_description": self.rng.choice(self.texts)}
+        if endpoint == "batch":
+            return {"jobs": [{"job_description": text} for text in self.rng.sample(self.texts, self.batch_size)]}
+
+        # Distinct posting ids so request coalescing does not hide fetch cost
+        self._next_id += 1
+        posting_id = 1000000 + self._next_id
+        return {"url": self.rng.choice([
+            f"https://boards.greenhouse.io/acme/jobs/{posting_id}",
+            f"https://jobs.lever.co/globex/{posting_id}",
+            f"https://careers.example.com/jobs/{posting_id}",
+        ])}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """Parse "analyze=6,batch=1,fetch=3" into endpoint weights"""
+    mix = {}
+    for item in spec.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint {name!r}; expected one of {', '.join(ENDPOINTS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def send(client: httpx.AsyncClient, endpoint: str, body: Dict, offset: float, results: List[Dict]):
+    start = time.perf_counter()
+    record = {"endpoint": endpoint, "t": round(offset, 3), "status": None, "error": None}
+    try:
+        response = await client.post(ENDPOINTS[endpoint], json=body)
+        record["status"] = response.status_code
+    except httpx.HTTPError as e:
+        record["error"] = type(e).__name__
+    record["latency_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    results.append(record)
+
+
+async def generate_load(args, factory: RequestFactory, mix: Dict[str, float], started: float) -> Dict:
+    """Send requests on an open-loop schedule for the configured duration"""
+    results: List[Dict] = []
+    dropped: Counter = Counter()
+    names, weights = list(mix), list(mix.values())
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=args.max_inflight, max_keepalive_connections=args.max_inflight)
+
+    async with httpx.AsyncClient(base_url=args.app_url, timeout=args.timeout, limits=limits) as client:
+        pending = set()
+        next_send = 0.0
+        while next_send < args.duration:
+            delay = started + next_send - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            endpoint = rng.choices(names, weights)[0]
+            if len(pending) >= args.max_inflight:
+                dropped[endpoint] += 1  # client-side limit; counts as an error below
+            else:
+                task = asyncio.create_task(send(client, endpoint, factory.body(endpoint), next_send, results))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+
+            next_send += rng.expovariate(args.rate) if args.arrivals == "poisson" else 1.0 / args.rate
+
+        if pending:
+            await asyncio.wait(pending)
+
+    return {"results": results, "dropped": dropped}
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+def _succeeded(record: Dict) -> bool:
+    return record["status"] is not None and record["status"] < 400
+
+
+def _summary(records: List[Dict], dropped: int, duration: float) -> Dict:
+    ok = [r for r in records if _succeeded(r)]
+    statuses = Counter(str(r["status"] or r["error"]) for r in records if not _succeeded(r))
+    if dropped:
+        statuses["client_dropped"] = dropped
+    attempted = len(records) + dropped
+    latencies = [r["latency_ms"] for r in ok]
+    return {
+        "sent": attempted,
+        "ok": len(ok),
+        "errors": dict(statuses),
+        "error_rate": round((attempted - len(ok)) / attempted, 4) if attempted else 0.0,
+        "throughput_rps": round(len(ok) / duration, 2),
+        "p50_ms": round(percentile(latencies, 50), 1) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95), 1) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99), 1) if latencies else None,
+    }
+
+
+def build_report(args, load: Dict, samples: List[Dict]) -> Dict:
+    results, dropped = load["results"], load["dropped"]
+    endpoints = {
+        name: _summary([r for r in results if r["endpoint"] == name], dropped[name], args.duration)
+        for name in ENDPOINTS
+        if any(r["endpoint"] == name for r in results) or dropped[name]
+    }
+
+    timeline = []
+    buckets = int(args.duration // args.sample_interval) + 1
+    for i in range(buckets):
+        start, end = i * args.sample_interval, (i + 1) * args.sample_interval
+        window = [r for r in results if start <= r["t"] < end]
+        latencies = [r["latency_ms"] for r in window if _succeeded(r)]
+        resources = next((s for s in samples if s["t"] >= end), samples[-1] if samples else {})
+        timeline.append({
+            "t": round(start, 2),
+            "sent_rps": round(len(window) / args.sample_interval, 2),
+            "errors": sum(1 for r in window if not _succeeded(r)),
+            "p95_ms": round(percentile(latencies, 95), 1) if latencies else None,
+            "cpu_percent": resources.get("cpu_percent"),
+            "rss_mb": resources.get("rss_mb"),
+            "pss_mb": resources.get("pss_mb"),
+        })
+
+    cpu = [s["cpu_percent"] for s in samples if s["cpu_percent"] is not None]
+    return {
+        "config": {
+            "server": args.server if not args.external else "external",
+            "workers": args.workers,
+            "rate": args.rate,
+            "arrivals": args.arrivals,
+            "duration": args.duration,
+            "mix": args.mix,
+            "batch_size": args.batch_size,
+            "upstream_latency_ms": args.upstream_latency_ms,
+            "upstream_jitter_ms": args.upstream_jitter_ms,
+        },
+        "overall": _summary(results, sum(dropped.values()), args.duration),
+        "endpoints": endpoints,
+        "server": {
+            "cpu_percent_mean": round(sum(cpu) / len(cpu), 1) if cpu else None,
+            "cpu_percent_max": max(cpu) if cpu else None,
+            "rss_mb_max": max((s["rss_mb"] for s in samples), default=None),
+            "pss_mb_max": max((s["pss_mb"] for s in samples), default=None),
+        },
+        "timeline": timeline,
+    }
+
+
+def print_report(report: Dict):
+    out = sys.stderr
+    config = report["config"]
+    print(
+        f"\n{config['server']} x{config['workers']}, {config['rate']} req/s ({config['arrivals']}) for "
+        f"{config['duration']}s, mix {config['mix']}, upstream {config['upstream_latency_ms']}ms",
+        file=out,
+    )
+    print(f"  {'endpoint':<10} {'sent':>6} {'ok':>6} {'err%':>6} {'rps':>7} {'p50':>8} {'p95':>8} {'p99':>8}", file=out)
+    for name, row in [*report["endpoints"].items(), ("overall", report["overall"])]:
+        print(
+            f"  {name:<10} {row['sent']:>6} {row['ok']:>6} {row['error_rate'] * 100:>5.1f}% "
+            f"{row['throughput_rps']:>7.2f} {row['p50_ms'] or 0:>8.1f} {row['p95_ms'] or 0:>8.1f} {row['p99_ms'] or 0:>8.1f}",
+            file=out,
+        )
+        if row["errors"]:
+            print(f"  {'':<10} errors: {row['errors']}", file=out)
+    server = report["server"]
+    print(
+        f"  server cpu mean {server['cpu_percent_mean']}% max {server['cpu_percent_max']}%, "
+        f"rss max {server['rss_mb_max']} MB, pss max {server['pss_mb_max']} MB",
+        file=out,
+    )
+
+
+# ---------------------------------------------------------------------------
+
+async def run(args) -> Dict:
+    processes = []
+    stand_in_url = f"http://127.0.0.1:{args.stand_in_port}"
+    try:
+        if not args.external:
+            processes.append(start_process(
+                ["-m", "uvicorn", "loadtest.stand_in_boards:app", "--port", str(args.stand_in_port), "--log-level", "warning"],
+                {
+                    "STAND_IN_LATENCY_MS": str(args.upstream_latency_ms),
+                    "STAND_IN_JITTER_MS": str(args.upstream_jitter_ms),
+                },
+            ))
+            app_env = {
+                "FETCH_HOST_OVERRIDES": ",".join([
+                    f"boards.greenhouse.io={stand_in_url}/pages/greenhouse",
+                    f"jobs.lever.co={stand_in_url}/pages/lever",
+                    f"careers.example.com={stand_in_url}/pages/generic",
+                ]),
+            }
+            if args.server == "prefork":
+                command = ["-m", "app.prefork", "--workers", str(args.workers), "--port", str(args.app_port)]
+            else:
+                command = [
+                    "-m", "uvicorn", "app.main:app", "--port", str(args.app_port),
+                    "--workers", str(args.workers), "--log-level", "warning",
+                ]
+            app_process = start_process(command, app_env)
+            processes.append(app_process)
+            args.app_pid = app_process.pid
+            await wait_healthy(f"{stand_in_url}/docs", args.startup_timeout)
+
+        await wait_healthy(f"{args.app_url}/health", args.startup_timeout)
+
+        factory = RequestFactory(args.seed, args.batch_size, args.corpus_size, args.words)
+        mix = parse_mix(args.mix)
+
+        stop = asyncio.Event()
+        sampler = None
+        started = time.perf_counter()
+        if args.app_pid and os.path.isdir("/proc"):
+            sampler = ResourceSampler(args.app_pid, args.sample_interval)
+            sampler_task = asyncio.create_task(sampler.run(started, stop))
+
+        load = await generate_load(args, factory, mix, started)
+
+        stop.set()
+        if sampler:
+            await sampler_task
+        return build_report(args, load, sampler.samples if sampler else [])
+    finally:
+        for process in reversed(processes):
+            stop_process(process)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=10.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of load")
+    parser.add_argument("--arrivals", choices=["constant", "poisson"], default="poisson")
+    parser.add_argument("--mix", default="analyze=6,batch=1,fetch=3", help="Endpoint weights")
+    parser.add_argument("--batch-size", type=int, default=10, help="Postings per /batch request")
+    parser.add_argument("--words", type=int, default=400, help="Approximate words per posting")
+    parser.add_argument("--corpus-size", type=int, default=500, help="Distinct postings to draw from")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--max-inflight", type=int, default=256, help="Client-side cap on outstanding requests")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request client timeout in seconds")
+    parser.add_argument("--server", choices=["uvicorn", "prefork"], default="uvicorn")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--app-port", type=int, default=8765)
+    parser.add_argument("--stand-in-port", type=int, default=8766)
+    parser.add_argument("--upstream-latency-ms", type=float, default=100.0, help="Stand-in board response delay")
+    parser.add_argument("--upstream-jitter-ms", type=float, default=50.0, help="Random extra stand-in delay")
+    parser.add_argument("--app-url", help="Load an already running app instead of starting one")
+    parser.add_argument("--app-pid", type=int, help="PID of the running app (for CPU/RSS sampling with --app-url)")
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Seconds per timeline interval")
+    parser.add_argument("--startup-timeout", type=float, default=120.0)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    args.external = args.app_url is not None
+    args.app_url = args.app_url or f"http://127.0.0.1:{args.app_port}"
+
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    document = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(document + "\n")
+    else:
+        print(document)
+
+
+if __name__ == "__main__":
+    main()
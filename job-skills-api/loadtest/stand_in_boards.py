@@ -0,0 +1,274 @@
+"""
+Local stand-in for the Greenhouse and Lever job boards and a generic careers site.
+
+Serves the two listing APIs board sync uses, plus posting pages recorded from
+Greenhouse, Lever and a generic careers site (loadtest/pages) for
+/analysis/fetch-job. Postings can be added, edited and removed over HTTP, so
+syncs can be exercised end to end without touching the real boards. Pages for
+postings that were never added are generated deterministically from their id,
+so load tests can request any number of distinct postings. Every response can
+be delayed to emulate a slow upstream.
+
+Usage:
+    STAND_IN_LATENCY_MS=150 STAND_IN_JITTER_MS=50 uvicorn loadtest.stand_in_boards:app --port 8090
+
+    # then point the API at it
+    GREENHOUSE_API_URL=http://127.0.0.1:8090/greenhouse \\
+    LEVER_API_URL=http://127.0.0.1:8090/lever \\
+    BOARD_SYNC_ENABLED=true BOARD_SYNC_BOARDS=greenhouse:acme,lever:globex \\
+    FETCH_HOST_OVERRIDES=boards.greenhouse.io=http://127.0.0.1:8090/pages/greenhouse,\\
+jobs.lever.co=http://127.0.0.1:8090/pages/lever,careers.example.com=http://127.0.0.1:8090/pages/generic \\
+    uvicorn app.main:app
+
+Posting pages (behind the FETCH_HOST_OVERRIDES above):
+    https://boards.greenhouse.io/{board}/jobs/{id}
+    https://jobs.lever.co/{company}/{id}
+    https://careers.example.com/jobs/{id}
+
+Admin endpoints (mutate a board between syncs, change latency):
+    POST   /_admin/{provider}/{board}/postings          {"title": ..., "description": ...}
+    PUT    /_admin/{provider}/{board}/postings/{id}     {"title": ..., "description": ...}
+    DELETE /_admin/{provider}/{board}/postings/{id}
+    POST   /_admin/{provider}/{board}/seed?count=20
+    PUT    /_admin/latency?ms=150&jitter_ms=50
+"""
+
+import asyncio
+import html
+import itertools
+import os
+import random
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse
+from pydantic import BaseModel
+
+from benchmarks.corpus import generate_posting
+
+PAGES_DIR = Path(__file__).parent / "pages"
+
+SAMPLE_SKILLS = [
+    "Python", "Java", "Go", "TypeScript", "React", "PostgreSQL", "Redis", "Kafka",
+    "Docker", "Kubernetes", "AWS", "Terraform", "Spark", "Airflow", "TensorFlow",
+    "GraphQL", "Linux", "Git", "CI/CD", "Agile",
+]
+
+SAMPLE_TITLES = [
+    "Backend Engineer", "Data Engineer", "Platform Engineer", "Frontend Engineer",
+    "Machine Learning Engineer", "Site Reliability Engineer",
+]
+
+BOILERPLATE = (
+    "We are an equal opportunity employer and value diversity at our company. We do not "
+    "discriminate on the basis of race, religion, color, national origin, gender, sexual "
+    "orientation, age, marital status, veteran status, or disability status."
+)
+
+app = FastAPI(title="Stand-in job boards")
+
+# Added to every non-admin response: ms plus a uniform random 0..jitter_ms
+latency = {
+    "ms": float(os.environ.get("STAND_IN_LATENCY_MS", 0)),
+    "jitter_ms": float(os.environ.get("STAND_IN_JITTER_MS", 0)),
+}
+
+# Recorded page markup with {{title}}, {{company}} and {{content}} slots
+templates = {name: (PAGES_DIR / f"{name}.html").read_text() for name in ("greenhouse", "lever", "generic")}
+
+# (provider, board) -> posting id -> {"title", "description"}; insertion ordered
+boards: Dict[tuple, Dict[str, Dict]] = {}
+_greenhouse_ids = itertools.count(4000000)
+
+
+class PostingIn(BaseModel):
+    title: str
+    description: str
+
+
+def sample_description(rng: random.Random) -> str:
+    """A plausible posting body with a requirements list and an EEO footer"""
+    skills = rng.sample(SAMPLE_SKILLS, 5)
+    lines = [
+        "About the role",
+        "You will build and operate services used by thousands of customers every day.",
+        "Requirements:",
+        *(f"- {rng.randint(2, 6)}+ years of experience with {skill}" for skill in skills[:3]),
+        f"- Familiarity with {skills[3]} and {skills[4]}",
+        "Equal opportunity",
+        BOILERPLATE,
+    ]
+    return "\n".join(lines)
+
+
+def _new_id(provider: str) -> str:
+    return str(next(_greenhouse_ids)) if provider == "greenhouse" else str(uuid.uuid4())
+
+
+def _board(provider: str, board: str) -> Dict[str, Dict]:
+    if provider not in ("greenhouse", "lever"):
+        raise HTTPException(status_code=404, detail="Unknown provider")
+    return boards.setdefault((provider, board), {})
+
+
+def seed_board(provider: str, board: str, count: int, seed: Optional[int] = None):
+    """Fill a board with deterministic sample postings"""
+    rng = random.Random(seed if seed is not None else f"{provider}:{board}")
+    postings = _board(provider, board)
+    for _ in range(count):
+        postings[_new_id(provider)] = {
+            "title": rng.choice(SAMPLE_TITLES),
+            "description": sample_description(rng),
+        }
+
+
+def _to_html(description: str) -> str:
+    """Render a posting body the way board editors do (paragraphs and lists)"""
+    parts, items = [], []
+    for line in description.splitlines():
+        if line.startswith("- "):
+            items.append(f"<li>{html.escape(line[2:])}</li>")
+            continue
+        if items:
+            parts.append(f"<ul>{''.join(items)}</ul>")
+            items = []
+        parts.append(f"<p>{html.escape(line)}</p>")
+    if items:
+        parts.append(f"<ul>{''.join(items)}</ul>")
+    return "".join(parts)
+
+
+@app.middleware("http")
+async def upstream_latency(request: Request, call_next):
+    """Delay responses like a remote job board would"""
+    if not request.url.path.startswith("/_admin") and (latency["ms"] or latency["jitter_ms"]):
+        await asyncio.sleep((latency["ms"] + random.uniform(0, latency["jitter_ms"])) / 1000)
+    return await call_next(request)
+
+
+def _page(template: str, provider: str, board: str, posting_id: str) -> HTMLResponse:
+    """Render a posting page; postings never added are generated from their id"""
+    posting = boards.get((provider, board), {}).get(posting_id)
+    if posting is None:
+        generated = generate_posting(random.Random(f"{provider}:{board}:{posting_id}"))
+        posting = {"title": generated["title"], "description": generated["text"].split("\n", 1)[1]}
+
+    markup = (
+        templates[template]
+        .replace("{{title}}", html.escape(posting["title"]))
+        .replace("{{company}}", html.escape(board))
+        .replace("{{content}}", _to_html(posting["description"]))
+    )
+    return HTMLResponse(markup)
+
+
+@app.get("/pages/greenhouse/{board}/jobs/{posting_id}", response_class=HTMLResponse)
+def greenhouse_page(board: str, posting_id: str):
+    """Greenhouse hosted job page (boards.greenhouse.io/{board}/jobs/{id})"""
+    return _page("greenhouse", "greenhouse", board, posting_id)
+
+
+@app.get("/pages/lever/{company}/{posting_id}", response_class=HTMLResponse)
+def lever_page(company: str, posting_id: str):
+    """Lever hosted job page (jobs.lever.co/{company}/{id})"""
+    return _page("lever", "lever", company, posting_id)
+
+
+@app.get("/pages/generic/jobs/{posting_id}", response_class=HTMLResponse)
+def generic_page(posting_id: str):
+    """Job page of a company careers site without a board provider"""
+    return _page("generic", "generic", "Example Corp", posting_id)
+
+
+@app.put("/_admin/latency")
+def set_latency(ms: float = Query(0, ge=0), jitter_ms: float = Query(0, ge=0)):
+    """Change the emulated upstream latency"""
+    latency.update(ms=ms, jitter_ms=jitter_ms)
+    return latency
+
+
+@app.get("/greenhouse/v1/boards/{board}/jobs")
+def greenhouse_jobs(board: str, content: bool = False):
+    """Greenhouse Job Board API: list a board's jobs"""
+    if ("greenhouse", board) not in boards:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    jobs = []
+    for posting_id, posting in boards[("greenhouse", board)].items():
+        job = {
+            "id": int(posting_id),
+            "title": posting["title"],
+            "absolute_url": f"https://boards.greenhouse.io/{board}/jobs/{posting_id}",
+            "updated_at": "2024-01-01T00:00:00-05:00",
+        }
+        if content:
+            # Greenhouse double-encodes: the content field holds escaped HTML
+            job["content"] = html.escape(_to_html(posting["description"]))
+        jobs.append(job)
+    return {"jobs": jobs, "meta": {"total": len(jobs)}}
+
+
+@app.get("/lever/v0/postings/{company}")
+def lever_postings(company: str, mode: str = "json"):
+    """Lever Postings API: list a company's postings"""
+    if ("lever", company) not in boards:
+        raise HTTPException(status_code=404, detail="Document not found")
+
+    postings = []
+    for posting_id, posting in boards[("lever", company)].items():
+        description, _, rest = posting["description"].partition("Requirements:")
+        requirements = [line[2:] for line in rest.splitlines() if line.startswith("- ")]
+        additional = "\n".join(line for line in rest.splitlines() if line and not line.startswith("- "))
+        postings.append({
+            "id": posting_id,
+            "text": posting["title"],
+            "hostedUrl": f"https://jobs.lever.co/{company}/{posting_id}",
+            "descriptionPlain": description.strip(),
+            "lists": [{
+                "text": "Requirements:",
+                "content": "".join(f"<li>{html.escape(item)}</li>" for item in requirements),
+            }],
+            "additionalPlain": additional,
+        })
+    return postings
+
+
+@app.post("/_admin/{provider}/{board}/seed")
+def seed(provider: str, board: str, count: int = Query(20, ge=1, le=10000), seed: Optional[int] = None):
+    """Add `count` sample postings to a board (creating it if needed)"""
+    seed_board(provider, board, count, seed)
+    return {"postings": len(boards[(provider, board)])}
+
+
+@app.post("/_admin/{provider}/{board}/postings")
+def add_posting(provider: str, board: str, posting: PostingIn):
+    """Publish a new posting"""
+    posting_id = _new_id(provider)
+    _board(provider, board)[posting_id] = posting.model_dump()
+    return {"id": posting_id}
+
+
+@app.put("/_admin/{provider}/{board}/postings/{posting_id}")
+def edit_posting(provider: str, board: str, posting_id: str, posting: PostingIn):
+    """Edit an existing posting"""
+    postings = _board(provider, board)
+    if posting_id not in postings:
+        raise HTTPException(status_code=404, detail="Posting not found")
+    postings[posting_id] = posting.model_dump()
+    return {"id": posting_id}
+
+
+@app.delete("/_admin/{provider}/{board}/postings/{posting_id}")
+def remove_posting(provider: str, board: str, posting_id: str):
+    """Take a posting down"""
+    if _board(provider, board).pop(posting_id, None) is None:
+        raise HTTPException(status_code=404, detail="Posting not found")
+    return {"id": posting_id}
+
+
+@app.get("/_admin/{provider}/{board}/postings")
+def list_postings(provider: str, board: str):
+    """List a board's posting ids"""
+    return {"ids": list(_board(provider, board))}
@@ -0,0 +1,25 @@
+"""
+Shared test setup.
+
+Tests run against a throwaway SQLite database; DATABASE_URL is set before
+app.config is first imported so no test touches a configured database.
+"""
+
+import os
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="job-skills-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture
+def db_tables():
+    """Create every table before the test and drop them afterwards"""
+    import app.models  # noqa: F401  (registers models on Base.metadata)
+    from app.database import Base, engine
+
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
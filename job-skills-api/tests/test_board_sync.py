@@ -0,0 +1,127 @@
+"""
+Board sync against the stand-in Greenhouse and Lever boards (loadtest/stand_in_boards.py).
+
+The stand-in app is served in process through httpx's ASGI transport.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.core.admission import AdmissionController
+from app.database import SessionLocal
+from app.models.boards import BoardPosting
+from app.services import board_sync
+from app.services.board_sync import BoardSyncScheduler, apply_board_snapshot, open_posting_skills
+from loadtest import stand_in_boards
+
+STAND_IN_URL = "http://stand-in"
+
+
+@pytest.fixture
+def stand_in(monkeypatch, db_tables):
+    """Point board sync at an empty stand-in and route its HTTP client there"""
+    stand_in_boards.boards.clear()
+    monkeypatch.setitem(stand_in_boards.latency, "ms", 0)
+    monkeypatch.setitem(stand_in_boards.latency, "jitter_ms", 0)
+    monkeypatch.setattr(settings, "GREENHOUSE_API_URL", f"{STAND_IN_URL}/greenhouse")
+    monkeypatch.setattr(settings, "LEVER_API_URL", f"{STAND_IN_URL}/lever")
+
+    client_class = httpx.AsyncClient
+    monkeypatch.setattr(
+        board_sync.httpx,
+        "AsyncClient",
+        lambda **kwargs: client_class(transport=httpx.ASGITransport(app=stand_in_boards.app), **kwargs),
+    )
+    yield stand_in_boards.boards
+    stand_in_boards.boards.clear()
+
+
+@pytest.fixture
+def scheduler():
+    lane = AdmissionController("analysis", max_concurrent=1, max_queue=4, queue_timeout=30)
+    return BoardSyncScheduler(lane, [], host_min_interval=0)
+
+
+def _tracked(provider, board):
+    db = SessionLocal()
+    try:
+        return {row.external_id: row for row in db.query(BoardPosting).filter_by(provider=provider, board=board)}
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("provider", ["greenhouse", "lever"])
+def test_sync_board_tracks_added_edited_removed_and_reopened_postings(stand_in, scheduler, provider):
+    stand_in_boards.seed_board(provider, "acme", 3, seed=1)
+    postings = stand_in[(provider, "acme")]
+    ids = list(postings)
+
+    outcome = asyncio.run(scheduler.sync_board(provider, "acme"))
+    assert outcome["error"] is None
+    assert (outcome["added"], outcome["changed"], outcome["unchanged"], outcome["removed"]) == (3, 0, 0, 0)
+    assert all(row.skills for row in _tracked(provider, "acme").values())
+
+    # Nothing changed: nothing is analyzed again
+    outcome = asyncio.run(scheduler.sync_board(provider, "acme"))
+    assert (outcome["added"], outcome["changed"], outcome["unchanged"], outcome["analyzed"]) == (0, 0, 3, 0)
+
+    # Edit one posting and take another down
+    edited, removed = ids[0], ids[1]
+    postings[edited] = {
+        "title": "Data Engineer",
+        "description": "About the role\nYou will build data pipelines.\nRequirements:\n- 5+ years of experience with Terraform",
+    }
+    taken_down = postings.pop(removed)
+    outcome = asyncio.run(scheduler.sync_board(provider, "acme"))
+    assert (outcome["added"], outcome["changed"], outcome["unchanged"], outcome["removed"]) == (0, 1, 1, 1)
+    tracked = _tracked(provider, "acme")
+    assert "Terraform" in {skill["name"] for skill in tracked[edited].skills}
+    assert tracked[removed].closed_at is not None
+
+    # The posting comes back unchanged
+    postings[removed] = taken_down
+    outcome = asyncio.run(scheduler.sync_board(provider, "acme"))
+    assert (outcome["reopened"], outcome["unchanged"], outcome["analyzed"]) == (1, 3, 0)
+    assert _tracked(provider, "acme")[removed].closed_at is None
+
+
+def test_sync_board_reports_missing_board(stand_in, scheduler):
+    outcome = asyncio.run(scheduler.sync_board("greenhouse", "missing"))
+    assert "not found" in outcome["error"]
+    assert scheduler.last_results["greenhouse:missing"] is outcome
+
+
+def test_sync_board_reports_unexpected_errors(stand_in, scheduler, monkeypatch):
+    stand_in_boards.seed_board("lever", "globex", 1)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(board_sync, "apply_board_snapshot", fail)
+    outcome = asyncio.run(scheduler.sync_board("lever", "globex"))
+    assert outcome["error"] == "RuntimeError: database is locked"
+
+
+def test_apply_board_snapshot_open_posting_skills(db_tables):
+    seen_at = datetime(2026, 1, 5)
+    postings = [
+        {"external_id": "1", "title": "Backend Engineer", "url": None, "description": "Experience with Python and Docker."},
+        {"external_id": "2", "title": "Data Engineer", "url": None, "description": "Experience with Python and Terraform."},
+    ]
+    assert apply_board_snapshot("greenhouse", "acme", postings, seen_at)["added"] == 2
+
+    outcome = apply_board_snapshot("greenhouse", "acme", postings[:1], seen_at + timedelta(hours=1))
+    assert (outcome["removed"], outcome["unchanged"]) == (1, 1)
+
+    db = SessionLocal()
+    try:
+        result = open_posting_skills(db)
+    finally:
+        db.close()
+    assert result["open_postings"] == 1
+    names = {skill["name"] for skill in result["skills"]}
+    assert "Docker" in names and "Terraform" not in names
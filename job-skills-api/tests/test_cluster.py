@@ -0,0 +1,169 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.api.routes import cluster as cluster_routes
+from app.config import settings
+from app.prefork import WORKER_SLOT_ENV
+from app.services.cluster import FORWARDED_HEADER, NODE_HEADER, SECRET_HEADER, ClusterRouter, NodeHeaderMiddleware
+
+SELF = "http://node-a:8000"
+PEER = "http://node-b:8000"
+
+
+def _router(handler) -> ClusterRouter:
+    """Two-node router whose peer traffic goes to `handler` instead of the network"""
+    router = ClusterRouter(SELF, [SELF, PEER], replicas=64)
+    router._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return router
+
+
+def _key_owned_by(router: ClusterRouter, node: str) -> str:
+    return next(key for key in (f"posting-{i}" for i in range(1000)) if router.ring.node_for(key) == node)
+
+
+def _echo_app(router: ClusterRouter) -> FastAPI:
+    """App with one route that forwards to the key's owner or answers locally"""
+    app = FastAPI()
+
+    @app.post("/echo/{key}")
+    async def echo(key: str, request: Request):
+        forwarded = await router.forward(request, key)
+        return forwarded if forwarded is not None else {"node": "local"}
+
+    return app
+
+
+def test_forwards_to_a_healthy_owner():
+    def peer(request: httpx.Request):
+        assert request.headers[FORWARDED_HEADER] == SELF
+        return httpx.Response(200, json={"node": "peer"}, headers={NODE_HEADER: PEER})
+
+    router = _router(peer)
+    with TestClient(_echo_app(router)) as client:
+        response = client.post(f"/echo/{_key_owned_by(router, PEER)}", json={})
+        assert response.json() == {"node": "peer"}
+        assert response.headers[NODE_HEADER] == PEER
+        assert client.post(f"/echo/{_key_owned_by(router, SELF)}", json={}).json() == {"node": "local"}
+    assert (router.forwarded, router.owned, router.fallbacks) == (1, 1, 0)
+
+
+def test_processes_locally_while_the_owner_is_down():
+    calls = []
+
+    def peer(request: httpx.Request):
+        calls.append(request.url.path)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    router = _router(peer)
+    key = _key_owned_by(router, PEER)
+    with TestClient(_echo_app(router)) as client:
+        # The failed forward marks the peer unhealthy; later requests skip it
+        assert client.post(f"/echo/{key}", json={}).json() == {"node": "local"}
+        assert client.post(f"/echo/{key}", json={}).json() == {"node": "local"}
+    assert calls == [f"/echo/{key}"]
+    assert router.fallbacks == 2
+    assert not next(node for node in router.stats()["nodes"] if node["url"] == PEER)["healthy"]
+
+
+def test_health_checks_mark_peers_down_and_up_without_raising():
+    state = {"up": False}
+
+    def peer(request: httpx.Request):
+        if not state["up"]:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"status": "healthy"})
+
+    router = _router(peer)
+    router.join("not a url")
+    asyncio.run(router.check_health())
+    assert router.owner(_key_owned_by(router, PEER)) is None
+
+    state["up"] = True
+    asyncio.run(router.check_health())
+    healthy = {node["url"]: node["healthy"] for node in router.stats()["nodes"]}
+    assert healthy == {SELF: True, PEER: True, "not a url": False}
+    assert router.owner(_key_owned_by(router, PEER)) == PEER
+
+
+@pytest.fixture
+def membership_client(monkeypatch):
+    router = ClusterRouter(SELF, [SELF])
+    monkeypatch.setattr(cluster_routes, "cluster", router)
+    monkeypatch.setattr(settings, "CLUSTER_ENABLED", True)
+    monkeypatch.setattr(settings, "CLUSTER_SECRET", "s3cret")
+    app = FastAPI()
+    app.include_router(cluster_routes.router, prefix="/cluster")
+    with TestClient(app) as client:
+        yield client, router
+
+
+def test_membership_changes_require_the_cluster_secret(membership_client):
+    client, router = membership_client
+
+    assert client.post("/cluster/join", json={"url": PEER}).status_code == 403
+    assert client.post("/cluster/join", json={"url": PEER}, headers={SECRET_HEADER: "wrong"}).status_code == 403
+    assert PEER not in router.ring
+
+    assert client.post("/cluster/join", json={"url": PEER}, headers={SECRET_HEADER: "s3cret"}).status_code == 200
+    assert PEER in router.ring
+    assert client.post("/cluster/leave", json={"url": PEER}).status_code == 403
+    assert client.post("/cluster/leave", json={"url": PEER}, headers={SECRET_HEADER: "s3cret"}).status_code == 200
+    assert PEER not in router.ring
+
+
+def test_membership_changes_are_refused_without_a_configured_secret(membership_client, monkeypatch):
+    client, router = membership_client
+    monkeypatch.setattr(settings, "CLUSTER_SECRET", "")
+
+    assert client.post("/cluster/join", json={"url": PEER}, headers={SECRET_HEADER: ""}).status_code == 403
+    assert client.get("/cluster/status").status_code == 200
+
+
+def test_retries_a_down_owner_after_the_health_interval_without_health_checks():
+    state = {"up": False}
+
+    def peer(request: httpx.Request):
+        if not state["up"]:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"node": "peer"})
+
+    router = _router(peer)
+    router.health_interval = 0.05
+    key = _key_owned_by(router, PEER)
+    with TestClient(_echo_app(router)) as client:
+        assert client.post(f"/echo/{key}", json={}).json() == {"node": "local"}
+        state["up"] = True
+        assert client.post(f"/echo/{key}", json={}).json() == {"node": "local"}
+        time.sleep(0.1)
+        assert client.post(f"/echo/{key}", json={}).json() == {"node": "peer"}
+
+
+def test_membership_changes_are_refused_in_prefork_workers(membership_client, monkeypatch):
+    client, router = membership_client
+    monkeypatch.setenv(WORKER_SLOT_ENV, "1")
+
+    response = client.post("/cluster/join", json={"url": PEER}, headers={SECRET_HEADER: "s3cret"})
+    assert response.status_code == 409
+    assert PEER not in router.ring
+
+
+def test_node_header_middleware_tags_local_responses_only():
+    app = FastAPI()
+
+    @app.get("/local")
+    async def local():
+        return {"node": "local"}
+
+    @app.get("/forwarded")
+    async def forwarded():
+        return Response(b"{}", headers={NODE_HEADER: PEER})
+
+    app.add_middleware(NodeHeaderMiddleware, node_url=SELF)
+    with TestClient(app) as client:
+        assert client.get("/local").headers[NODE_HEADER] == SELF
+        assert client.get("/forwarded").headers[NODE_HEADER] == PEER
@@ -0,0 +1,53 @@
+from app.core.hash_ring import HashRing
+
+NODES = ["http://10.0.0.1:8000", "http://10.0.0.2:8000", "http://10.0.0.3:8000"]
+KEYS = [f"posting-{i}" for i in range(5000)]
+
+
+def _owners(ring):
+    return [ring.node_for(key) for key in KEYS]
+
+
+def test_empty_ring_owns_nothing():
+    assert HashRing().node_for("posting") is None
+
+
+def test_ownership_is_independent_of_join_order():
+    assert _owners(HashRing(NODES)) == _owners(HashRing(reversed(NODES)))
+
+
+def test_keys_spread_over_every_node():
+    owners = _owners(HashRing(NODES))
+    for node in NODES:
+        assert 0.2 < owners.count(node) / len(KEYS) < 0.47
+
+
+def test_join_only_moves_keys_to_the_new_node():
+    ring = HashRing(NODES)
+    before = _owners(ring)
+    assert ring.add("http://10.0.0.4:8000")
+    after = _owners(ring)
+
+    moved = [(old, new) for old, new in zip(before, after) if old != new]
+    assert all(new == "http://10.0.0.4:8000" for _, new in moved)
+    assert 0.15 < len(moved) / len(KEYS) < 0.35  # ideally 1/4
+
+
+def test_leave_only_moves_the_departed_nodes_keys():
+    ring = HashRing(NODES)
+    before = _owners(ring)
+    assert ring.remove(NODES[0])
+    after = _owners(ring)
+
+    for old, new in zip(before, after):
+        if old == NODES[0]:
+            assert new in NODES[1:]
+        else:
+            assert new == old
+
+
+def test_add_and_remove_report_membership_changes():
+    ring = HashRing(NODES)
+    assert not ring.add(NODES[0])
+    assert not ring.remove("http://10.0.0.9:8000")
+    assert ring.nodes == NODES and len(ring) == 3
@@ -0,0 +1,40 @@
+from datetime import datetime
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.job_store import recent_signatures, save_analyses
+from app.services.near_duplicates import MinHasher
+from app.services.nlp_service import NLPService
+
+POSTING = (
+    "We are hiring a backend engineer to build and operate our payments platform. "
+    "You will design APIs in Python and Go, run services on Kubernetes and AWS, "
+    "and own PostgreSQL schemas and migrations. Experience with Docker, Terraform "
+    "and CI/CD pipelines is required. We value clear writing and careful code review."
+)
+REPOST = POSTING + " Apply by the end of the month."
+
+
+def test_stored_signatures_seed_the_index_after_a_restart(db_tables, monkeypatch):
+    monkeypatch.setattr(settings, "NEAR_DUPLICATE_DETECTION_ENABLED", True)
+    monkeypatch.setattr(settings, "JOB_INDEX_ENABLED", True)
+    service = NLPService()
+    monkeypatch.setattr(service, "minhasher", MinHasher())
+    monkeypatch.setattr(service, "near_duplicates", service._new_duplicate_index())
+
+    analysis = service.analyze_job_description(POSTING)
+    db = SessionLocal()
+    try:
+        save_analyses(db, [POSTING], ["Backend Engineer"], [analysis], datetime(2026, 1, 1))
+        db.commit()
+
+        # A new process starts with an empty index
+        monkeypatch.setattr(service, "near_duplicates", service._new_duplicate_index())
+        assert service.seed_near_duplicates(recent_signatures(db, 10)) == 1
+    finally:
+        db.close()
+
+    repeat = service.analyze_job_description(REPOST)
+    assert repeat["duplicate_of"]["content_hash"] == NLPService.content_key(POSTING)
+    assert repeat["skills"] == analysis["skills"]
+    assert repeat["categories"] == analysis["categories"]
@@ -0,0 +1,177 @@
+from datetime import datetime
+
+from app.database import SessionLocal
+from app.models.jobs import AnalyzedJob
+from app.services import skill_index
+from app.services.skill_index import SkillIndex
+
+
+def _skill(name, category="programming_languages", count=1, confidence=0.95):
+    return {"name": name, "category": category, "count": count, "confidence": confidence}
+
+
+# job id -> skills; Python weighs most in posting 2 (three mentions)
+POSTINGS = {
+    1: [_skill("Python"), _skill("SQL"), _skill("Communication", "soft_skills")],
+    2: [_skill("Python", count=3), _skill("Kubernetes", "devops_tools")],
+    3: [_skill("Java"), _skill("Kubernetes", "devops_tools")],
+    4: [_skill("Python"), _skill("java", confidence=0.6), _skill("Java")],  # two spellings, one skill
+    5: [_skill("Tableau", "business_intelligence")],
+}
+
+
+def _index():
+    index = SkillIndex()
+    for job_id, skills in POSTINGS.items():
+        index.add(job_id, skills)
+    return index
+
+
+def _ids(result):
+    return [hit["job_id"] for hit in result["hits"]]
+
+
+def _store(db, job_id, *skills):
+    db.add(AnalyzedJob(
+        id=job_id,
+        content_hash=f"{job_id:064d}",
+        analyzed_at=datetime(2026, 1, 1),
+        total_skills_found=len(skills),
+        skills=[{"name": name, "category": "programming_languages", "count": 1, "confidence": 0.95} for name in skills],
+    ))
+    db.commit()
+
+
+def test_all_skills_are_required():
+    assert _ids(_index().search(["python", "kubernetes"])) == [2]
+
+
+def test_any_skills_need_one_match_and_ties_go_to_the_newest():
+    result = _index().search(any_skills=["Java", "SQL"])
+    assert _ids(result) == [4, 3, 1]
+    assert len({hit["score"] for hit in result["hits"]}) == 1
+
+
+def test_excluded_skills_remove_postings():
+    assert _ids(_index().search(["python"], exclude_skills=["JAVA"])) == [2, 1]
+
+
+def test_category_filter():
+    index = _index()
+    assert _ids(index.search(category="business_intelligence")) == [5]
+    assert _ids(index.search(["python"], category="soft_skills")) == [1]
+    assert index.search(category="databases") == {"total": 0, "hits": []}
+
+
+def test_query_without_skills_returns_everything_newest_first():
+    result = _index().search()
+    assert result["total"] == 5
+    assert _ids(result) == [5, 4, 3, 2, 1]
+    assert all(hit["score"] == 0 for hit in result["hits"])
+
+
+def test_hits_are_ranked_by_weight_and_report_display_names():
+    hits = _index().search(["PYTHON"], any_skills=["kubernetes"])["hits"]
+    assert [(hit["job_id"], hit["score"], hit["matched_skills"]) for hit in hits] == [
+        (2, 1.975, ["Python", "Kubernetes"]),
+    ]
+
+    result = _index().search(["python"])
+    assert _ids(result) == [2, 4, 1]
+    scores = [hit["score"] for hit in result["hits"]]
+    assert scores[0] > scores[1] == scores[2]
+
+
+def test_limit_and_offset_page_through_the_ranking():
+    result = _index().search(["python"], limit=1, offset=1)
+    assert result["total"] == 3
+    assert _ids(result) == [4]
+
+
+def test_postings_added_after_a_query_are_found():
+    index = _index()
+    assert _ids(index.search(["tableau"])) == [5]
+    index.add(6, [_skill("Tableau", "business_intelligence", count=3)])
+    assert _ids(index.search(["tableau"])) == [6, 5]
+    assert _ids(index.search(category="business_intelligence")) == [6, 5]
+
+
+def test_match_ranks_by_cosine_similarity():
+    result = _index().match([_skill("Python"), _skill("Kubernetes", "devops_tools")])
+    assert result["candidates"] == 4
+    scores = {match["job_id"]: match["score"] for match in result["matches"]}
+    assert scores == {2: 0.949, 3: 0.5, 4: 0.5, 1: 0.492}
+    assert result["matches"][0]["job_id"] == 2
+
+
+def test_match_weighs_soft_skills_less_than_technical_ones():
+    index = _index()
+    language = index.match([_skill("SQL")])["matches"]
+    soft_skill = index.match([_skill("Communication", "soft_skills")])["matches"]
+    assert language[0]["job_id"] == soft_skill[0]["job_id"] == 1
+    assert language[0]["score"] > 3 * soft_skill[0]["score"]
+
+
+def test_match_returns_top_k():
+    result = _index().match([_skill("Python"), _skill("Kubernetes", "devops_tools")], top_k=2)
+    assert result["candidates"] == 4
+    assert len(result["matches"]) == 2
+    assert result["matches"][0]["job_id"] == 2
+
+
+def test_match_without_shared_skills():
+    assert _index().match([_skill("Rust")]) == {"candidates": 0, "matches": []}
+
+
+def test_sync_only_reads_new_rows(db_tables):
+    index = SkillIndex()
+    db = SessionLocal()
+    try:
+        _store(db, 1, "Python")
+        _store(db, 2, "Go")
+        assert index.sync_from_db(db) == 2
+        assert index.sync_from_db(db) == 0
+
+        _store(db, 3, "Python")
+        assert index.sync_from_db(db) == 1
+    finally:
+        db.close()
+
+    assert _ids(index.search(["python"])) == [3, 1]
+    assert index.last_job_id == 3
+
+
+def test_sync_picks_up_ids_committed_out_of_order(db_tables):
+    index = SkillIndex()
+    db = SessionLocal()
+    try:
+        # Id 2 was assigned first but commits after id 3 has been indexed
+        _store(db, 1, "Python")
+        _store(db, 3, "Go")
+        assert index.sync_from_db(db) == 2
+
+        _store(db, 2, "Rust")
+        assert index.sync_from_db(db) == 1
+        assert index.sync_from_db(db) == 0
+    finally:
+        db.close()
+
+    assert sorted(index.job_ids) == [1, 2, 3]
+    assert [hit["job_id"] for hit in index.search(["rust"])["hits"]] == [2]
+
+
+def test_sync_reads_in_chunks_and_forgets_ids_outside_the_rescan_window(db_tables, monkeypatch):
+    monkeypatch.setattr(skill_index, "SYNC_CHUNK_SIZE", 3)
+    monkeypatch.setattr(skill_index, "SYNC_RESCAN_IDS", 4)
+    index = SkillIndex()
+    db = SessionLocal()
+    try:
+        for job_id in range(1, 11):
+            _store(db, job_id, "Python")
+        assert index.sync_from_db(db) == 10
+        assert index.sync_from_db(db) == 0
+    finally:
+        db.close()
+
+    assert index.search(["python"])["total"] == 10
+    assert index._recent_ids == {7, 8, 9, 10}
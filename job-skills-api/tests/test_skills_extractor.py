@@ -0,0 +1,137 @@
+"""
+Golden output of the skills extractor.
+
+The expected lists were produced by the extractor as it was before the
+single-sweep rewrite, so any change to names, counts, categories,
+confidences or order shows up here. A blank pipeline with an entity ruler
+stands in for the statistical model to keep entity hits deterministic.
+"""
+
+import pytest
+import spacy
+
+from app.config import settings
+from app.services.skills_extractor import SkillsExtractor
+
+ENTITY_PATTERNS = [
+    {"label": "ORG", "pattern": "Google"},
+    {"label": "PRODUCT", "pattern": "Kubernetes"},
+    {"label": "ORG", "pattern": "Postgres"},
+    {"label": "PRODUCT", "pattern": "React Native"},
+    {"label": "ORG", "pattern": "Snowflake"},
+    {"label": "GPE", "pattern": "Tableau"},
+    {"label": "PRODUCT", "pattern": "K8s"},
+    # Two spaces: the phrase matcher misses it, so only the entity tier finds it
+    {"label": "PRODUCT", "pattern": "Power  BI"},
+]
+
+POSTINGS = [
+    "Senior Backend Engineer. We need experience with Python, Django and PostgreSQL. "
+    "You will run services on Kubernetes at scale and deploy to AWS with Terraform. "
+    "Knowledge of Redis and Kafka is a plus. Python is our main language; Kubernetes runs everything.",
+    "Mobile developer: proficient in React Native and TypeScript, familiar with GraphQL. "
+    "Working with Snowflake and Tableau dashboards, understanding of agile and scrum. "
+    "React.js, Node.js and nodejs experience; expertise in java and c++.",
+    "Data analyst at Google. Skilled in SQL, Excel and Tableau. Experience with machine learning, "
+    "pandas and numpy. Familiar with tensorflow, pytorch and scikit-learn. Communication and leadership.",
+    "Platform engineer running K8s clusters; reporting in Power  BI. Experience with docker.",
+]
+
+# (name, count, category, confidence) per skill, in output order
+EXPECTED = [
+    [
+        ("Kubernetes", 4, "devops_tools", 0.95),
+        ("Python", 2, "programming_languages", 0.95),
+        ("PostgreSQL", 2, "databases", 0.95),
+        ("Django", 1, "frameworks", 0.95),
+        ("AWS", 1, "cloud_platforms", 0.95),
+        ("Terraform", 1, "devops_tools", 0.95),
+        ("Redis", 1, "databases", 0.95),
+        ("python", 1, "programming_languages", 0.6),
+        ("django", 1, "frameworks", 0.6),
+        ("redis", 1, "databases", 0.6),
+    ],
+    [
+        ("React", 3, "frameworks", 0.95),
+        ("React Native", 3, "mobile_development", 0.95),
+        ("Tableau", 3, "business_intelligence", 0.95),
+        ("java", 3, "mobile_development", 0.95),
+        ("TypeScript", 2, "programming_languages", 0.95),
+        ("Snowflake", 2, "databases", 0.95),
+        ("dashboards", 2, "business_intelligence", 0.95),
+        ("agile", 2, "methodologies", 0.95),
+        ("scrum", 2, "methodologies", 0.95),
+        ("Node.js", 2, "web_technologies", 0.95),
+        ("snowflake", 2, "databases", 0.6),
+        ("GraphQL", 1, "web_technologies", 0.95),
+        ("c++", 1, "programming_languages", 0.95),
+        ("react", 1, "frameworks", 0.6),
+        ("c", 1, "programming_languages", 0.6),
+        ("graphql", 1, "web_technologies", 0.6),
+        ("tableau", 1, "data_science", 0.6),
+    ],
+    [
+        ("Tableau", 3, "business_intelligence", 0.95),
+        ("pandas", 3, "frameworks", 0.95),
+        ("numpy", 3, "frameworks", 0.95),
+        ("tensorflow", 3, "frameworks", 0.95),
+        ("pytorch", 3, "frameworks", 0.95),
+        ("scikit-learn", 2, "frameworks", 0.95),
+        ("SQL", 1, "programming_languages", 0.95),
+        ("machine learning", 1, "data_science", 0.95),
+        ("Communication", 1, "soft_skills", 0.95),
+        ("leadership", 1, "soft_skills", 0.95),
+        ("sql", 1, "programming_languages", 0.6),
+        ("tableau", 1, "data_science", 0.6),
+    ],
+    [
+        ("Kubernetes", 2, "devops_tools", 0.95),
+        ("docker", 2, "devops_tools", 0.95),
+        ("reporting", 1, "business_intelligence", 0.95),
+        ("BI", 1, "business_intelligence", 0.95),
+        ("Power BI", 1, "data_science", 0.75),
+    ],
+]
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    monkeypatch.setattr(settings, "FUZZY_MATCHING_ENABLED", False)
+    monkeypatch.setattr(settings, "MULTILINGUAL_ENABLED", False)
+    monkeypatch.setattr(settings, "VECTOR_DISCOVERY_ENABLED", False)
+    monkeypatch.setattr(settings, "RESOLVE_OVERLAPPING_SKILLS", False)
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("entity_ruler").add_patterns(ENTITY_PATTERNS)
+    return SkillsExtractor(nlp=nlp)
+
+
+def _summary(skills):
+    return [(s["name"], s["count"], s["category"], s["confidence"]) for s in skills]
+
+
+@pytest.mark.parametrize("posting, expected", list(zip(POSTINGS, EXPECTED)))
+def test_output_matches_the_golden_lists(extractor, posting, expected):
+    assert _summary(extractor.extract_skills(posting)) == expected
+
+
+def test_batch_extraction_matches_single_extraction(extractor):
+    assert [_summary(skills) for skills in extractor.extract_skills_batch(POSTINGS)] == EXPECTED
+
+
+def test_resolving_overlaps_counts_each_span_once(extractor):
+    extractor.resolve_overlaps = True
+    assert _summary(extractor.extract_skills(POSTINGS[1])) == [
+        ("React Native", 1, "mobile_development", 0.95),
+        ("TypeScript", 1, "programming_languages", 0.95),
+        ("GraphQL", 1, "web_technologies", 0.95),
+        ("Snowflake", 1, "databases", 0.95),
+        ("Tableau", 1, "business_intelligence", 0.95),
+        ("dashboards", 1, "business_intelligence", 0.95),
+        ("agile", 1, "methodologies", 0.95),
+        ("scrum", 1, "methodologies", 0.95),
+        ("React", 1, "frameworks", 0.95),
+        ("Node.js", 1, "web_technologies", 0.95),
+        ("java", 1, "mobile_development", 0.95),
+        ("c++", 1, "programming_languages", 0.95),
+    ]
@@ -0,0 +1,32 @@
+from datetime import date, datetime
+
+from app.database import SessionLocal
+from app.models.trends import SkillRollup
+from app.services import trend_service
+
+TODAY = date(2026, 3, 15)
+
+
+def _analysis(*skills):
+    return {
+        "skills": [{"name": name, "category": "programming_languages", "count": 2, "confidence": 0.95} for name in skills],
+    }
+
+
+def test_spellings_of_a_skill_share_one_rollup_row(db_tables):
+    db = SessionLocal()
+    try:
+        trend_service.fold_analyses(db, [_analysis("python"), _analysis("Python", "python")], datetime(2026, 3, 14))
+        trend_service.fold_analyses(db, [_analysis("PYTHON")], datetime(2026, 3, 15))
+        db.commit()
+
+        rows = db.query(SkillRollup).filter_by(granularity="month").all()
+        assert [(row.skill, row.skill_key, row.postings, row.mentions) for row in rows] == [("python", "python", 3, 8)]
+
+        top = trend_service.top_skills(db, days=30, today=TODAY)
+        assert [(skill["name"], skill["postings"], skill["mentions"]) for skill in top["skills"]] == [("PYTHON", 3, 8)]
+
+        series = trend_service.skill_trend(db, "Python", granularity="month", periods=1, today=TODAY)
+        assert [(point["postings"], point["mentions"]) for point in series] == [(3, 8)]
+    finally:
+        db.close()
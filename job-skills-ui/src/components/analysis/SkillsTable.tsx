@@ -114,7 +114,7 @@ export const SkillsTable = ({ skills }: Props) => {
           </thead>
           <tbody className="bg-white divide-y divide-gray-200">
             {sortedSkills.map((skill) => (
-              <tr key={skill.id} className="hover:bg-gray-50">
+              <tr key={skill.name} className="hover:bg-gray-50">
                 <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900">
                   {skill.name}
                 </td>
@@ -1,5 +1,4 @@
 export interface Skill {
-  id: string;
   name: string;
   count: number;
   category: string;